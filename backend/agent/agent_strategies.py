@@ -7,15 +7,25 @@ decision making in the text adventure game framework.
 
 import os
 import logging
-from typing import Protocol, Optional
+from typing import Any, Dict, Protocol, Optional
 
 # Kani imports
 from kani import Kani, ChatMessage, ai_function
-from kani.engines.openai import OpenAIEngine
 
 # Configuration imports
 from ..config.yaml_config import get_config_manager
 
+# Local imports
+from .engine_registry import get_engine_registry
+from .llm_scheduler import get_llm_scheduler, PRIORITY_NORMAL, PRIORITY_BACKGROUND
+from .memory import ConversationMemory
+from .observation import ObservationCompressor
+from ..config.models import MemoryConfig
+from ..tracing import get_tracer
+
+# Text adventure games imports
+from ..text_adventure_games.actions.base import ExecutionContext
+
 # Module-level logger
 logger = logging.getLogger(__name__)
 
@@ -66,7 +76,9 @@ class KaniAgent(Kani):
             self.persona = persona or f"I am {character_name}, a helpful agent."
             
         # Get engine configuration
+        engine_config = None
         try:
+            engine_name = self.config_manager.llm_config.engine_override or engine_name
             engine_config = self.config_manager.get_engine_config(engine_name)
             if api_key is None:
                 api_key = engine_config.get_api_key()
@@ -81,7 +93,7 @@ class KaniAgent(Kani):
             if model is None:
                 model = "gpt-4.1-mini"
         
-        if not api_key:
+        if not api_key and (engine_config is None or engine_config.requires_api_key):
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
         
         # Track recent actions to avoid loops
@@ -94,25 +106,14 @@ class KaniAgent(Kani):
         # Safety flag to prevent multiple executions per turn
         self.command_executed_this_turn = False
         
-        # Fix SSL certificate path issue on Windows
-        import ssl
-        original_ssl_cert_file = os.environ.get("SSL_CERT_FILE")
-        if original_ssl_cert_file and not original_ssl_cert_file.endswith(('.pem', '.crt')):
-            # If SSL_CERT_FILE points to a directory, fix it
-            potential_cert_files = [
-                os.path.join(original_ssl_cert_file, "cacert.pem"),
-                os.path.join(original_ssl_cert_file, "cert.pem"),
-                "C:/Users/milos/.conda/envs/kani_env/Library/ssl/cacert.pem",
-                "C:/Users/milos/.conda/envs/kani_env/Lib/site-packages/certifi/cacert.pem"
-            ]
-            
-            for cert_file in potential_cert_files:
-                if os.path.exists(cert_file):
-                    os.environ["SSL_CERT_FILE"] = cert_file
-                    logger.info(f"Fixed SSL_CERT_FILE to: {cert_file}")
-                    break
+        # When set, submit_command only records the command and the AgentManager
+        # applies it later (used by concurrent turn mode)
+        self.defer_execution = False
+        
+        # ExecutionContext of the command executed this turn (read by the AgentManager)
+        self.last_execution = None
         
-        # Initialize kani with OpenAI engine and configured parameters
+        # Get a shared engine (pooled HTTP client) for these parameters
         engine_kwargs = {}
         
         # Add parameters conditionally (standard GPT-4 parameters)
@@ -120,8 +121,19 @@ class KaniAgent(Kani):
             engine_kwargs['temperature'] = temperature
         if max_tokens is not None:
             engine_kwargs['max_tokens'] = max_tokens
-            
-        engine = OpenAIEngine(api_key=api_key, model=model, **engine_kwargs) 
+        
+        # Every model request goes through the shared scheduler (rate limits, retries, priority)
+        self.scheduler = get_llm_scheduler()
+        self.request_priority = PRIORITY_NORMAL
+        self.retry_attempts = engine_config.retry_attempts if engine_config is not None else None
+        self.request_timeout = engine_config.timeout if engine_config is not None else None
+        
+        registry = get_engine_registry()
+        if engine_config is not None:
+            engine = registry.get_engine_for_config(engine_config, api_key=api_key, model=model,
+                                                    agent_id=character_name, **engine_kwargs)
+        else:
+            engine = registry.get_engine(api_key, model, **engine_kwargs)
         
         # Build system prompt using configuration
         try:
@@ -173,6 +185,88 @@ Remember: You can only choose from the available actions provided. If unsure, su
         # Store initial world state to be sent as first user message
         self.initial_world_state = initial_world_state
         self.initial_context_sent = False
+        
+        # Bounded conversation memory (None keeps Kani's full history)
+        memory_config = self._load_memory_config()
+        self.memory = ConversationMemory(memory_config, summarize=self._summarize_turns) if memory_config.enabled else None
+        
+        # Observation compression (None sends observations verbatim)
+        self.observation_compressor = ObservationCompressor() if memory_config.compress_observations else None
+        self.last_observation_report = None
+    
+    def _load_memory_config(self) -> MemoryConfig:
+        """Load the configured memory defaults."""
+        try:
+            return MemoryConfig(**self.config_manager.defaults_config.memory_defaults)
+        except Exception as e:
+            logger.warning(f"Failed to load memory config for {self.character_name}: {e}. Using defaults.")
+            return MemoryConfig()
+    
+    def _compress_observation(self, text: str, is_world_state: bool = False) -> str:
+        """Compress an observation and pin it in memory if it describes the agent's surroundings."""
+        full_text = text
+        if self.observation_compressor is not None:
+            self.last_observation_report = self.observation_compressor.compress(text)
+            text = self.last_observation_report.text
+            full_text = self.last_observation_report.full_text
+            report = self.last_observation_report
+            logger.debug("[%s] Observation tokens: %s -> %s %s", self.character_name,
+                         report.original_tokens, report.compressed_tokens, report.section_tokens)
+        if is_world_state and self.memory is not None:
+            self.memory.note_world_state(full_text, sent_text=text)
+        return text
+    
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Conversation state stored in game checkpoints (see GameLoop.snapshot)."""
+        state: Dict[str, Any] = {
+            "chat_history": list(self.chat_history),
+            "initial_context_sent": self.initial_context_sent,
+            "recent_actions": list(self.recent_actions),
+        }
+        if self.memory is not None:
+            state["memory"] = {
+                "summary_lines": list(self.memory.summary_lines),
+                "llm_summary": self.memory.llm_summary,
+                "latest_world_state": self.memory.latest_world_state,
+                "latest_world_state_sent": self.memory.latest_world_state_sent,
+                "evicted_rounds": self.memory.evicted_rounds,
+            }
+        return state
+    
+    def load_checkpoint_state(self, state: Dict[str, Any]):
+        """Continue the conversation stored by get_checkpoint_state."""
+        self.chat_history = list(state["chat_history"])
+        self.initial_context_sent = state["initial_context_sent"]
+        self.recent_actions = list(state["recent_actions"])
+        if self.memory is not None and "memory" in state:
+            for name, value in state["memory"].items():
+                setattr(self.memory, name, value)
+    
+    async def get_prompt(self) -> list[ChatMessage]:
+        """Build the prompt within the memory's token budget (older turns are summarized)."""
+        if self.memory is None:
+            return await super().get_prompt()
+        return await self.memory.build_prompt(self)
+    
+    async def _summarize_turns(self, previous_summary: str, turns: str) -> str:
+        """Fold evicted turns into the rolling summary with a low-priority LLM request."""
+        max_tokens = self.memory.config.summary_max_tokens if self.memory else 400
+        messages = [
+            ChatMessage.system(
+                f"You maintain a concise memory for {self.character_name}, a character in a text adventure game. "
+                "Merge the new turns into the existing summary. Keep facts that matter for future decisions "
+                "(places visited, items found or moved, conversations, goals). Use at most a few short sentences."
+            ),
+            ChatMessage.user(f"Existing summary:\n{previous_summary or '(none)'}\n\nNew turns:\n{turns}")
+        ]
+        completion = await self.scheduler.submit(
+            lambda: self.engine.predict(messages, max_tokens=max_tokens),
+            estimated_tokens=(len(previous_summary) + len(turns)) // 4 + max_tokens,
+            priority=PRIORITY_BACKGROUND,
+            max_retries=self.retry_attempts,
+            timeout=self.request_timeout
+        )
+        return completion.message.text or previous_summary
     
     @ai_function()
     def submit_command(self, command: str):
@@ -188,11 +282,18 @@ Remember: You can only choose from the available actions provided. If unsure, su
         if self.command_executed_this_turn:
             return "You have already executed a command this turn."
         
+        # Deferred execution: the AgentManager commits the command after the round
+        if self.defer_execution:
+            self.selected_command = command.lower().strip()
+            logger.debug("[%s] FUNCTION CALL: submit_command('%s') -> deferred until commit", self.character_name, command)
+            return f"Command '{command}' submitted. It will be carried out once all agents have chosen their actions."
+        
         # Check if we have game and character references
         if not self.game or not self.character:
             # Fallback to old behavior if references not available
             self.selected_command = command.lower().strip()
-            logger.debug(f"[{self.character_name}] FUNCTION CALL: submit_command('{command}') -> stored as '{self.selected_command}' (no game reference)")
+            logger.debug("[%s] FUNCTION CALL: submit_command('%s') -> stored as '%s' (no game reference)",
+                         self.character_name, command, self.selected_command)
             return f"Command '{command}' submitted successfully."
         
         # Store command and execute immediately
@@ -201,16 +302,18 @@ Remember: You can only choose from the available actions provided. If unsure, su
         
         # Execute command via game parser
         try:
-            logger.debug(f"[{self.character_name}] EXECUTING: submit_command('{command}') immediately")
-            action_result = self.game.parser.parse_command(command, character=self.character)
-            
-            # Store in game for schema export (maintain compatibility)
-            self.game._last_action_result = action_result
-            self.game._last_action_agent_id = self.character.name
+            logger.debug("[%s] EXECUTING: submit_command('%s') immediately", self.character_name, command)
+            self.last_execution = ExecutionContext(actor=self.character)
+            with get_tracer().span("parse_command"):
+                action_result = self.game.parser.parse_command(command, context=self.last_execution)
             
             # Return the actual description from ActionResult
             result_description = action_result.description if action_result else "No result available"
-            logger.debug(f"[{self.character_name}] RESULT: {result_description}")
+            
+            # A look result is the agent's full view of its surroundings
+            if getattr(self.last_execution.action, 'ACTION_NAME', None) == "look":
+                result_description = self._compress_observation(result_description, is_world_state=True)
+            logger.debug("[%s] RESULT: %s", self.character_name, result_description)
             return result_description
             
         except Exception as e:
@@ -218,6 +321,41 @@ Remember: You can only choose from the available actions provided. If unsure, su
             logger.error(f"[{self.character_name}] {error_msg}")
             return error_msg
     
+    async def get_model_completion(self, include_functions: bool = True, **kwargs):
+        """
+        Get the model's completion through the shared LLM scheduler.
+        
+        The prompt is built before a scheduler slot is taken: building it may evict
+        old rounds and summarize them with a background request of its own, which
+        would otherwise wait for a slot while holding one.
+        """
+        messages = await self.get_prompt()
+        if include_functions:
+            kwargs["functions"] = list(self.functions.values())
+        estimated_tokens = self._estimate_request_tokens(messages)
+        
+        with get_tracer().span("llm", estimated_tokens=estimated_tokens) as span:
+            completion = await self.scheduler.submit(
+                lambda: self.engine.predict(messages=messages, **kwargs),
+                estimated_tokens=estimated_tokens,
+                priority=self.request_priority,
+                max_retries=self.retry_attempts,
+                timeout=self.request_timeout
+            )
+            
+            used_tokens = None
+            if completion.prompt_tokens is not None and completion.completion_tokens is not None:
+                used_tokens = completion.prompt_tokens + completion.completion_tokens
+                span.set("tokens", used_tokens)
+        self.scheduler.record_usage(estimated_tokens, used_tokens)
+        return completion
+    
+    def _estimate_request_tokens(self, messages: list[ChatMessage]) -> int:
+        """Rough token cost of a request (prompt plus the expected reply)."""
+        prompt_chars = sum(len(str(message.content or "")) for message in messages)
+        reply_tokens = self.engine.hyperparams.get('max_tokens') or 256
+        return prompt_chars // 4 + reply_tokens
+    
     async def select_action(self, action_result: str) -> str:
         """
         Use LLM with function calling to select an action based on previous action result.
@@ -229,13 +367,14 @@ Remember: You can only choose from the available actions provided. If unsure, su
             self.selected_command = None
             
             # Handle first turn: send initial world state as first user message
-            if not self.initial_context_sent and self.initial_world_state:
-                logger.info(f"[{self.character_name}] Sending initial world state as first user message")
-                observation = self.initial_world_state
-                self.initial_context_sent = True
-            else:
-                # Subsequent turns: use action result from previous turn
-                observation = action_result
+            with get_tracer().span("observation"):
+                if not self.initial_context_sent and self.initial_world_state:
+                    logger.info(f"[{self.character_name}] Sending initial world state as first user message")
+                    observation = self._compress_observation(self.initial_world_state, is_world_state=True)
+                    self.initial_context_sent = True
+                else:
+                    # Subsequent turns: use action result from previous turn
+                    observation = self._compress_observation(action_result, is_world_state=action_result.startswith("You are at:"))
             
             # Add recent actions context to avoid loops
             if self.recent_actions:
@@ -246,14 +385,13 @@ Remember: You can only choose from the available actions provided. If unsure, su
             observation += "\n\nYou must call the submit_command function with your chosen action. Submit \"look\" to show what actions you can take."
             
             # Debug: Log the full observation sent to the LLM
-            logger.debug(f"[{self.character_name}] OBSERVATION:")
-            logger.debug(observation)
+            logger.debug("[%s] OBSERVATION:\n%s", self.character_name, observation)
             
             # Get LLM response with function calling
-            logger.debug(f"[{self.character_name}] Sending observation to LLM...")
+            logger.debug("[%s] Sending observation to LLM...", self.character_name)
             async for message in self.full_round(observation, max_function_rounds=1):
-                logger.debug(f"[{self.character_name}] LLM message: {message.role}")
-            logger.debug(f"[{self.character_name}] LLM response received")
+                logger.debug("[%s] LLM message: %s", self.character_name, message.role)
+            logger.debug("[%s] LLM response received", self.character_name)
             
             # Check if a command was submitted via function call
             if self.selected_command:
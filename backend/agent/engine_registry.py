@@ -0,0 +1,215 @@
+"""
+Engine Registry - Shared LLM engines and HTTP connection pool
+=============================================================
+Contains the EngineRegistry class that hands out Kani engines to agents.
+
+All agents share one process-wide httpx client, so keep-alive connections
+and TLS sessions are reused across agents and the total number of concurrent
+LLM requests is capped by the pool size. Pooled connections belong to the
+event loop that opened them, so the client keeps one connection pool per
+running event loop (e.g. per asyncio.run call or per test). Engines (and their
+OpenAI clients) are created once per distinct engine configuration and
+shared by every agent that uses that configuration. Mock engines keep
+per-agent state and are created per agent instead.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import logging
+import os
+
+import httpx
+from openai import AsyncOpenAI
+from kani.engines.openai import OpenAIEngine
+
+from ..config.models import HttpPoolConfig
+from .mock_engine import MockEngine
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+
+class LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport with one connection pool per running event loop.
+    """
+
+    def __init__(self, **transport_kwargs):
+        """
+        Args:
+            **transport_kwargs: Arguments of each loop's httpx.AsyncHTTPTransport (e.g. limits)
+        """
+        self._transport_kwargs = transport_kwargs
+        self._transports: Dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+
+    def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            # Pools of closed loops cannot be used (or closed) any more
+            self._transports = {other: pool for other, pool in self._transports.items() if not other.is_closed()}
+            transport = self._transports[loop] = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._get_transport().handle_async_request(request)
+
+    async def aclose(self):
+        """Close the running loop's pool and drop the others (their loops own their connections)."""
+        transports, self._transports = self._transports, {}
+        transport = transports.get(asyncio.get_running_loop())
+        if transport is not None:
+            await transport.aclose()
+
+
+class EngineRegistry:
+    """
+    Process-wide registry of OpenAI clients and Kani engines keyed by engine configuration.
+    """
+
+    def __init__(self, pool_config: Optional[HttpPoolConfig] = None):
+        """
+        Args:
+            pool_config: Connection pool settings (defaults to HttpPoolConfig())
+        """
+        self.pool_config = pool_config or HttpPoolConfig()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._clients: Dict[Tuple, AsyncOpenAI] = {}
+        self._engines: Dict[Tuple, OpenAIEngine] = {}
+        _fix_ssl_cert_file()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The shared, pooled HTTP client (created on first use)."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                transport=LoopLocalTransport(limits=httpx.Limits(
+                    max_connections=self.pool_config.max_connections,
+                    max_keepalive_connections=self.pool_config.max_keepalive_connections,
+                    keepalive_expiry=self.pool_config.keepalive_expiry,
+                )),
+                timeout=httpx.Timeout(
+                    self.pool_config.request_timeout,
+                    pool=self.pool_config.pool_timeout,
+                ),
+            )
+        return self._http_client
+
+    def get_client(self, api_key: str, timeout: Optional[float] = None, max_retries: Optional[int] = None) -> AsyncOpenAI:
+        """Return the shared OpenAI client for an API key and request settings."""
+        key = (api_key, timeout, max_retries)
+        client = self._clients.get(key)
+        if client is None:
+            client_kwargs: Dict[str, Any] = {'api_key': api_key, 'http_client': self.http_client}
+            if timeout is not None:
+                client_kwargs['timeout'] = timeout
+            if max_retries is not None:
+                client_kwargs['max_retries'] = max_retries
+            client = AsyncOpenAI(**client_kwargs)
+            self._clients[key] = client
+        return client
+
+    def get_engine(self, api_key: str, model: str, timeout: Optional[float] = None,
+                   max_retries: Optional[int] = None, **hyperparams) -> OpenAIEngine:
+        """
+        Return the shared engine for a model and its hyperparameters.
+
+        Args:
+            api_key: API key used by the engine's client
+            model: Model identifier
+            timeout: Request timeout in seconds (client default if None)
+            max_retries: Retry attempts for failed requests (client default if None)
+            **hyperparams: Completion parameters such as temperature and max_tokens
+        """
+        key = (api_key, model, timeout, max_retries, tuple(sorted(hyperparams.items())))
+        engine = self._engines.get(key)
+        if engine is None:
+            client = self.get_client(api_key, timeout, max_retries)
+            engine = OpenAIEngine(model=model, client=client, **hyperparams)
+            self._engines[key] = engine
+            logger.debug(f"Created shared engine for model {model} ({len(self._engines)} engines)")
+        return engine
+
+    def get_engine_for_config(self, engine_config, api_key: Optional[str] = None,
+                              model: Optional[str] = None, agent_id: Optional[str] = None, **hyperparams):
+        """
+        Return the engine for an EngineConfig, with optional overrides.
+
+        The client does not retry by itself: retries (honoring retry_attempts)
+        are done by the LLM scheduler so they respect the shared rate limits.
+        Engines with provider "mock" get a new MockEngine for the agent.
+        """
+        if engine_config.provider == "mock":
+            return MockEngine(engine_config.mock, agent_id=agent_id)
+        return self.get_engine(
+            api_key or engine_config.get_api_key(),
+            model or engine_config.model,
+            timeout=engine_config.timeout,
+            max_retries=0,
+            **hyperparams
+        )
+
+    async def close(self):
+        """Close all clients and the shared connection pool."""
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+        self._engines.clear()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+_engine_registry: Optional[EngineRegistry] = None
+_ssl_cert_file_checked = False
+
+
+def get_engine_registry() -> EngineRegistry:
+    """
+    Get the global engine registry instance.
+
+    Returns:
+        EngineRegistry configured from the LLM configuration.
+    """
+    global _engine_registry
+    if _engine_registry is None:
+        pool_config = None
+        try:
+            from ..config.yaml_config import get_config_manager
+            pool_config = get_config_manager().llm_config.http_pool
+        except Exception as e:
+            logger.warning(f"Failed to load HTTP pool configuration: {e}. Using defaults.")
+        _engine_registry = EngineRegistry(pool_config)
+    return _engine_registry
+
+
+async def close_engine_registry():
+    """Close the global engine registry (called on application shutdown)."""
+    global _engine_registry
+    if _engine_registry is not None:
+        await _engine_registry.close()
+        _engine_registry = None
+
+
+def _fix_ssl_cert_file():
+    """Fix SSL certificate path issue on Windows (once per process)."""
+    global _ssl_cert_file_checked
+    if _ssl_cert_file_checked:
+        return
+    _ssl_cert_file_checked = True
+
+    original_ssl_cert_file = os.environ.get("SSL_CERT_FILE")
+    if original_ssl_cert_file and not original_ssl_cert_file.endswith(('.pem', '.crt')):
+        # If SSL_CERT_FILE points to a directory, fix it
+        potential_cert_files = [
+            os.path.join(original_ssl_cert_file, "cacert.pem"),
+            os.path.join(original_ssl_cert_file, "cert.pem"),
+            "C:/Users/milos/.conda/envs/kani_env/Library/ssl/cacert.pem",
+            "C:/Users/milos/.conda/envs/kani_env/Lib/site-packages/certifi/cacert.pem"
+        ]
+
+        for cert_file in potential_cert_files:
+            if os.path.exists(cert_file):
+                os.environ["SSL_CERT_FILE"] = cert_file
+                logger.info(f"Fixed SSL_CERT_FILE to: {cert_file}")
+                break
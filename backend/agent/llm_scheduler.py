@@ -0,0 +1,315 @@
+"""
+LLM Scheduler - Rate-limit-aware request scheduling
+===================================================
+Contains the LLMScheduler class that every KaniAgent model request goes
+through.
+
+- Requests-per-minute and tokens-per-minute budgets are enforced with token
+  buckets shared by all agents, so bursts are smoothed instead of turning
+  into 429 storms.
+- At most `max_concurrent` requests are in flight at once.
+- Waiting requests are served by priority (agents whose turn blocks the game
+  loop first), then in arrival order.
+- Failed requests are retried with exponential backoff, honoring the engine's
+  `retry_attempts` and `timeout`. A rate limit response pauses all requests
+  until the provider's retry-after has passed.
+- Queue wait times and retry counts are kept for the /llm/metrics endpoint.
+"""
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+
+import openai
+
+from ..config.models import SchedulerConfig
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Request priorities (lower is served first)
+PRIORITY_BLOCKING = 0    # The game loop is waiting for this agent
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2  # e.g. history summaries
+
+# Errors worth retrying; anything else is raised immediately
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+
+class TokenBucket:
+    """
+    Budget that refills continuously up to `per_minute` units per minute.
+
+    The level may go negative when a request uses more than it reserved; later
+    requests then wait until the debt is refilled.
+    """
+
+    def __init__(self, per_minute: Optional[int], clock: Callable[[], float] = time.monotonic):
+        self.per_minute = per_minute
+        self._clock = clock
+        self._level = float(per_minute or 0)
+        self._updated = clock()
+
+    @property
+    def unlimited(self) -> bool:
+        return not self.per_minute
+
+    def _refill(self):
+        now = self._clock()
+        if not self.unlimited:
+            rate = self.per_minute / 60.0
+            self._level = min(float(self.per_minute), self._level + (now - self._updated) * rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if available now)."""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.per_minute)
+        missing = amount - self._level
+        return 0.0 if missing <= 0 else missing * 60.0 / self.per_minute
+
+    def consume(self, amount: float):
+        """Take units from the budget (may leave it negative)."""
+        if self.unlimited:
+            return
+        self._refill()
+        self._level -= amount
+
+    def refund(self, amount: float):
+        """Give back units that were reserved but not used."""
+        if self.unlimited:
+            return
+        self._refill()
+        self._level = min(float(self.per_minute), self._level + amount)
+
+
+class LLMScheduler:
+    """
+    Shared admission control for LLM requests (concurrency, RPM/TPM budgets, priority, retries).
+    """
+
+    def __init__(self, config: Optional[SchedulerConfig] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            config: Scheduler limits (defaults to SchedulerConfig())
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        self.config = config or SchedulerConfig()
+        self._clock = clock
+        self._requests = TokenBucket(self.config.requests_per_minute, clock)
+        self._tokens = TokenBucket(self.config.tokens_per_minute, clock)
+
+        # Asyncio primitives belong to one event loop: rebuilt when the loop changes
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._waiting: List[List[int]] = []  # heap of [priority, sequence]
+        self._sequence = itertools.count()
+        self._active = 0
+        self._paused_until = 0.0
+
+        # Metrics
+        self._counters: Dict[str, int] = {
+            "submitted": 0, "completed": 0, "failed": 0, "retries": 0, "rate_limited": 0, "tokens_used": 0
+        }
+        self._queue_waits: deque = deque(maxlen=1000)
+
+    # === Public API ===
+
+    async def submit(self, request: Callable[[], Awaitable[T]], estimated_tokens: int = 0,
+                     priority: int = PRIORITY_NORMAL, max_retries: Optional[int] = None,
+                     timeout: Optional[float] = None) -> T:
+        """
+        Run a model request once the scheduler admits it, retrying transient failures.
+
+        Args:
+            request: Zero-argument coroutine function performing one model call
+            estimated_tokens: Tokens the request is expected to use (reserved from the TPM budget)
+            priority: PRIORITY_BLOCKING, PRIORITY_NORMAL or PRIORITY_BACKGROUND
+            max_retries: Retry attempts after the first try (config default if None)
+            timeout: Seconds allowed per attempt (no limit if None)
+
+        Returns:
+            The request's result
+        """
+        if max_retries is None:
+            max_retries = self.config.default_retry_attempts
+        self._counters["submitted"] += 1
+
+        attempt = 0
+        while True:
+            await self._acquire(priority, estimated_tokens)
+            try:
+                if timeout:
+                    result = await asyncio.wait_for(request(), timeout)
+                else:
+                    result = await request()
+                self._counters["completed"] += 1
+                return result
+            except RETRYABLE_ERRORS as e:
+                if attempt >= max_retries:
+                    self._counters["failed"] += 1
+                    raise
+                delay = self._backoff_delay(attempt, e)
+                attempt += 1
+                self._counters["retries"] += 1
+                logger.warning(f"LLM request failed ({type(e).__name__}), retry {attempt}/{max_retries} in {delay:.1f}s")
+            except BaseException:
+                self._counters["failed"] += 1
+                raise
+            finally:
+                await self._release()
+
+            await asyncio.sleep(delay)
+
+    def record_usage(self, reserved_tokens: int, used_tokens: Optional[int]):
+        """Settle a request's token reservation against the tokens it actually used."""
+        if used_tokens is None:
+            return
+        self._counters["tokens_used"] += used_tokens
+        difference = used_tokens - reserved_tokens
+        if difference > 0:
+            self._tokens.consume(difference)
+        elif difference < 0:
+            self._tokens.refund(-difference)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return counters, queue state and queue-wait statistics."""
+        waits = sorted(self._queue_waits)
+        metrics: Dict[str, Any] = dict(self._counters)
+        metrics.update({
+            "queued": len(self._waiting),
+            "active": self._active,
+            "queue_wait_avg": sum(waits) / len(waits) if waits else 0.0,
+            "queue_wait_p95": waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+            "queue_wait_max": waits[-1] if waits else 0.0,
+        })
+        return metrics
+
+    # === Internals ===
+
+    def _get_condition(self) -> asyncio.Condition:
+        """The condition of the running event loop (a new loop starts with an empty queue)."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            # Requests of an earlier loop (a finished asyncio.run, a previous test) ended with it
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._waiting = []
+            self._active = 0
+        return self._condition
+
+    def _admission_delay(self, estimated_tokens: int) -> float:
+        """Seconds until the budgets admit a request (0 if admitted now)."""
+        return max(
+            self._paused_until - self._clock(),
+            self._requests.time_until(1),
+            self._tokens.time_until(estimated_tokens),
+            0.0,
+        )
+
+    async def _acquire(self, priority: int, estimated_tokens: int):
+        """Wait until this request is first in line and the budgets allow it."""
+        condition = self._get_condition()
+        entry = [priority, next(self._sequence)]
+        enqueued = self._clock()
+
+        async with condition:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    timeout = None
+                    if self._waiting[0] is entry and self._active < self.config.max_concurrent:
+                        timeout = self._admission_delay(estimated_tokens)
+                        if timeout <= 0:
+                            break
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                condition.notify_all()
+                raise
+
+            heapq.heappop(self._waiting)
+            self._requests.consume(1)
+            self._tokens.consume(estimated_tokens)
+            self._active += 1
+            self._queue_waits.append(self._clock() - enqueued)
+            # The next request in line may be admissible too
+            condition.notify_all()
+
+    async def _release(self):
+        condition = self._get_condition()
+        async with condition:
+            self._active -= 1
+            condition.notify_all()
+
+    def _backoff_delay(self, attempt: int, error: BaseException) -> float:
+        """Exponential backoff with jitter; rate limits pause every request."""
+        delay = min(self.config.backoff_max, self.config.backoff_base * (2 ** attempt))
+        delay *= 0.5 + random.random() / 2
+
+        if isinstance(error, openai.RateLimitError):
+            self._counters["rate_limited"] += 1
+            retry_after = _retry_after_seconds(error)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+        return delay
+
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read the Retry-After header of a rate limit response, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+_llm_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """
+    Get the global LLM scheduler instance.
+
+    Returns:
+        LLMScheduler configured from the LLM configuration.
+    """
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        scheduler_config = None
+        try:
+            from ..config.yaml_config import get_config_manager
+            scheduler_config = get_config_manager().llm_config.scheduler
+        except Exception as e:
+            logger.warning(f"Failed to load LLM scheduler configuration: {e}. Using defaults.")
+        _llm_scheduler = LLMScheduler(scheduler_config)
+    return _llm_scheduler
+
+
+def set_llm_scheduler(scheduler: Optional[LLMScheduler]) -> Optional[LLMScheduler]:
+    """Replace the global LLM scheduler (None reloads it from the configuration on next use)."""
+    global _llm_scheduler
+    _llm_scheduler = scheduler
+    return scheduler
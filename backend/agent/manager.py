@@ -6,11 +6,13 @@ text adventure game framework.
 """
 
 from typing import Optional, Dict, List
+import asyncio
 import logging
 
 # Text adventure games imports
 from ..text_adventure_games.things import Character
 from ..text_adventure_games.games import Game
+from ..text_adventure_games.actions.base import ExecutionContext
 
 # Schema imports  
 from ..config.schema import AgentActionOutput, ChatRequest
@@ -18,7 +20,9 @@ from ..config.schema import AgentActionOutput, ChatRequest
 # Local imports
 from .agent_strategies import AgentStrategy
 from .chat_manager import ChatManager
+from .llm_scheduler import PRIORITY_BLOCKING
 from ..log_config import log_agent_decision
+from ..tracing import get_tracer
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -68,80 +72,216 @@ class AgentManager:
         """
         if agent.name not in self.agent_strategies:
             return None, True  # Default to ending turn if no strategy
-            
-        try:
-            strategy = self.agent_strategies[agent.name]
-            
-            # Reset execution flag for agents that support immediate execution
-            if hasattr(strategy, 'command_executed_this_turn'):
-                setattr(strategy, 'command_executed_this_turn', False)
-            
-            # Get the previous action result for this agent (empty string for first turn)
-            previous_result = self.previous_action_results.get(agent.name, "Welcome to the game! This is your first turn.")
-            
-            # Check for pending chat requests and include in feedback
-            pending_requests = self.chat_manager.get_pending_requests(agent.name)
-            if pending_requests:
-                chat_notifications = self._format_chat_notifications(pending_requests)
-                previous_result += "\n\n" + chat_notifications
-            
-            # Let the strategy decide (execution may happen immediately in submit_command)
-            command = await strategy.select_action(previous_result)
-            
-            # Check if command was already executed (immediate execution model)
-            if (hasattr(strategy, 'game') and getattr(strategy, 'game', None) and 
-                hasattr(self.game, '_last_action_result') and self.game._last_action_result and
-                hasattr(self.game, '_last_action_agent_id') and self.game._last_action_agent_id == agent.name):
-                
-                # Command was executed immediately in submit_command
-                log_agent_decision(agent.name, command, {"previous_result": previous_result, "execution": "immediate"})
-                
-                # Get the schema from the already-executed action
-                action_schema = self.game.schema_exporter.get_schema()
-                
-                # Extract and store action result for next turn
-                action_result = getattr(action_schema, 'description', None) or "Action completed"
-                self.previous_action_results[agent.name] = action_result
+        
+        tracer = get_tracer()
+        with tracer.span("turn", agent=agent.name, mode="sequential") as turn_span:
+            try:
+                strategy = self.agent_strategies[agent.name]
                 
-                # Check if the action ended the turn
-                action_ended_turn = True  # Default to ending turn
-                if hasattr(self.game, '_last_executed_action') and self.game._last_executed_action:
-                    action_ended_turn = getattr(self.game._last_executed_action, 'ends_turn', True)
+                # Reset execution state for agents that support immediate execution
+                if hasattr(strategy, 'command_executed_this_turn'):
+                    setattr(strategy, 'command_executed_this_turn', False)
+                if hasattr(strategy, 'last_execution'):
+                    setattr(strategy, 'last_execution', None)
                 
-                return action_schema, action_ended_turn
-            
-            else:
-                # Fallback to old execution model for agents without immediate execution
-                log_agent_decision(agent.name, command, {"previous_result": previous_result, "execution": "deferred"})
-                action_result = self.game.parser.parse_command(command, character=agent)
+                # Get the previous action result (plus any pending chat requests)
+                with tracer.span("feedback"):
+                    previous_result = self._build_agent_feedback(agent)
                 
-                # Get the schema immediately after execution
-                action_schema = self.game.schema_exporter.get_schema()
+                # Let the strategy decide (execution may happen immediately in submit_command)
+                with tracer.span("select_action"):
+                    command = await self._select_blocking_action(strategy, previous_result)
+                turn_span.set("command", command)
                 
-                # Check if this was a noop action (non-fatal error)
-                is_noop = action_schema.action.action_type == "noop"
+                # Check if command was already executed (immediate execution model)
+                execution = getattr(strategy, 'last_execution', None)
+                if execution is not None and execution.result is not None:
+                    
+                    # Command was executed immediately in submit_command
+                    log_agent_decision(agent.name, command, {"previous_result": previous_result, "execution": "immediate"})
+                    
+                    # Get the schema from the already-executed action
+                    with tracer.span("get_schema"):
+                        action_schema = self.game.schema_exporter.get_schema(execution)
+                    
+                    # Extract and store action result for next turn
+                    action_result = getattr(action_schema, 'description', None) or "Action completed"
+                    self.previous_action_results[agent.name] = action_result
+                    
+                    # Check if the action ended the turn
+                    action_ended_turn = getattr(execution.action, 'ends_turn', True)
+                    
+                    return action_schema, action_ended_turn
                 
-                # Extract and store action result for next turn
-                if is_noop:
-                    # For noop actions, store error message
-                    stored_result = f"Action failed: {action_schema.description or 'Unknown error'}"
                 else:
-                    # For successful actions, store result description from ActionResult
-                    stored_result = getattr(action_result, 'description', str(action_result))
+                    # Fallback to old execution model for agents without immediate execution
+                    log_agent_decision(agent.name, command, {"previous_result": previous_result, "execution": "deferred"})
+                    return self._execute_command(agent, command)
                 
-                # Store the action result for this agent's next turn
-                self.previous_action_results[agent.name] = stored_result
+            except Exception as e:
+                logger.error(f"Error in execute_agent_turn for {agent.name}: {e}")
+                turn_span.set("error", type(e).__name__)
+                return None, True  # Default to ending turn on error
+    
+    async def execute_concurrent_round(self) -> List[tuple[Character, Optional[AgentActionOutput], bool]]:
+        """
+        Have every agent take a turn with their strategies deliberating concurrently.
+        
+        All select_action calls run at the same time against the current world,
+        which is not modified until every agent has chosen. Commands are then
+        validated against that snapshot and committed one by one in turn order.
+        A command that was valid at the snapshot but fails at commit time lost a
+        conflict to an earlier agent, so that agent is asked to re-plan once.
+        
+        Returns:
+            List of (agent, AgentActionOutput schema or None, action_ended_turn) in commit order
+        """
+        agents = []
+        for agent_name in self.active_agents:
+            agent = self.game.characters.get(agent_name)
+            if agent and agent_name in self.agent_strategies:
+                agents.append(agent)
+        
+        if not agents:
+            return []
+        
+        # Deliberation phase: every strategy decides against the same world state
+        feedback = {agent.name: self._build_agent_feedback(agent) for agent in agents}
+        commands = await asyncio.gather(
+            *(self._traced_deferred_turn(agent, feedback[agent.name]) for agent in agents),
+            return_exceptions=True
+        )
+        
+        # Validate every command before anything is committed (the world is still the snapshot)
+        valid_at_snapshot = {}
+        for agent, command in zip(agents, commands):
+            if isinstance(command, BaseException):
+                logger.error(f"Error selecting action for {agent.name}: {command}")
+                continue
+            valid_at_snapshot[agent.name] = self.game.parser.check_command(command, agent)
+        
+        # Commit phase: apply commands in deterministic turn order
+        results = []
+        for agent, command in zip(agents, commands):
+            if isinstance(command, BaseException):
+                results.append((agent, None, True))
+                continue
+            
+            try:
+                log_agent_decision(agent.name, command, {"previous_result": feedback[agent.name], "execution": "concurrent"})
+                with get_tracer().span("commit", agent=agent.name, command=command):
+                    action_schema, action_ended_turn = self._execute_command(agent, command)
                 
-                # Check if the action ended the turn
-                action_ended_turn = True  # Default to ending turn
-                if hasattr(self.game, '_last_executed_action') and self.game._last_executed_action:
-                    action_ended_turn = getattr(self.game._last_executed_action, 'ends_turn', True)
+                if valid_at_snapshot[agent.name] and action_schema and action_schema.action.action_type == "noop":
+                    # Valid when the agent decided, invalid now: an earlier commit got there first
+                    logger.info(f"Conflict for {agent.name}: '{command}' is no longer possible, re-planning")
+                    results.append((agent, action_schema, False))
+                    action_schema, action_ended_turn = await self._replan_conflicting_action(agent, command)
                 
-                return action_schema, action_ended_turn
-            
-        except Exception as e:
-            logger.error(f"Error in execute_agent_turn for {agent.name}: {e}")
-            return None, True  # Default to ending turn on error
+                results.append((agent, action_schema, action_ended_turn))
+            except Exception as e:
+                logger.error(f"Error committing action for {agent.name}: {e}")
+                results.append((agent, None, True))
+        
+        return results
+    
+    async def _traced_deferred_turn(self, agent: Character, previous_result: str) -> str:
+        """An agent's deliberation in a concurrent round, traced as its turn."""
+        tracer = get_tracer()
+        with tracer.span("turn", agent=agent.name, mode="concurrent") as turn_span:
+            with tracer.span("select_action"):
+                command = await self._select_deferred_action(agent, previous_result)
+            turn_span.set("command", command)
+            return command
+    
+    async def _select_deferred_action(self, agent: Character, previous_result: str) -> str:
+        """Ask an agent's strategy for a command without letting it execute the command."""
+        strategy = self.agent_strategies[agent.name]
+        
+        # Reset execution flag and switch immediate-execution agents to deferred mode
+        if hasattr(strategy, 'command_executed_this_turn'):
+            setattr(strategy, 'command_executed_this_turn', False)
+        if hasattr(strategy, 'defer_execution'):
+            setattr(strategy, 'defer_execution', True)
+        
+        try:
+            return await self._select_blocking_action(strategy, previous_result)
+        finally:
+            if hasattr(strategy, 'defer_execution'):
+                setattr(strategy, 'defer_execution', False)
+    
+    async def _select_blocking_action(self, strategy: AgentStrategy, previous_result: str) -> str:
+        """Call select_action with the strategy's LLM requests prioritized, since the game loop waits on them."""
+        if not hasattr(strategy, 'request_priority'):
+            return await strategy.select_action(previous_result)
+        
+        original_priority = getattr(strategy, 'request_priority')
+        setattr(strategy, 'request_priority', PRIORITY_BLOCKING)
+        try:
+            return await strategy.select_action(previous_result)
+        finally:
+            setattr(strategy, 'request_priority', original_priority)
+    
+    async def _replan_conflicting_action(self, agent: Character, command: str) -> tuple[Optional[AgentActionOutput], bool]:
+        """Let an agent whose command lost a conflict choose again against the updated world."""
+        conflict_note = (
+            f"Your action '{command}' could not be carried out because another agent changed the world first: "
+            f"{self.previous_action_results.get(agent.name, '')}\nChoose a different action."
+        )
+        self.previous_action_results[agent.name] = conflict_note
+        
+        previous_result = self._build_agent_feedback(agent)
+        new_command = await self._select_deferred_action(agent, previous_result)
+        log_agent_decision(agent.name, new_command, {"previous_result": previous_result, "execution": "replanned"})
+        return self._execute_command(agent, new_command)
+    
+    def _build_agent_feedback(self, agent: Character) -> str:
+        """Build the feedback an agent receives at the start of its turn."""
+        # Get the previous action result for this agent (empty string for first turn)
+        previous_result = self.previous_action_results.get(agent.name, "Welcome to the game! This is your first turn.")
+        
+        # Check for pending chat requests and include in feedback
+        pending_requests = self.chat_manager.get_pending_requests(agent.name)
+        if pending_requests:
+            chat_notifications = self._format_chat_notifications(pending_requests)
+            previous_result += "\n\n" + chat_notifications
+        
+        return previous_result
+    
+    def _execute_command(self, agent: Character, command: str) -> tuple[AgentActionOutput, bool]:
+        """
+        Execute a command for an agent through the game parser and record its result.
+        
+        Returns:
+            Tuple of (AgentActionOutput schema, action_ended_turn boolean)
+        """
+        tracer = get_tracer()
+        execution = ExecutionContext(actor=agent)
+        with tracer.span("parse_command"):
+            action_result = self.game.parser.parse_command(command, context=execution)
+        
+        # Get the schema immediately after execution
+        with tracer.span("get_schema"):
+            action_schema = self.game.schema_exporter.get_schema(execution)
+        
+        # Check if this was a noop action (non-fatal error)
+        is_noop = action_schema.action.action_type == "noop"
+        
+        # Extract and store action result for next turn
+        if is_noop:
+            # For noop actions, store error message
+            stored_result = f"Action failed: {action_schema.description or 'Unknown error'}"
+        else:
+            # For successful actions, store result description from ActionResult
+            stored_result = getattr(action_result, 'description', str(action_result))
+        
+        # Store the action result for this agent's next turn
+        self.previous_action_results[agent.name] = stored_result
+        
+        # Check if the action ended the turn
+        action_ended_turn = getattr(execution.action, 'ends_turn', True)
+        
+        return action_schema, action_ended_turn
     
     def get_world_state_for_agent(self, agent: Character) -> dict:
         """
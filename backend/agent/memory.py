@@ -0,0 +1,197 @@
+"""
+Conversation Memory - Bounded prompt construction for KaniAgent
+===============================================================
+Contains the ConversationMemory class that keeps an agent's prompt within a
+token budget.
+
+The chat history is split into rounds (one observation and the agent's
+function calls and results for it). The prompt always contains the system
+prompt, a rolling summary of evicted rounds, the latest known world state and
+the current round; older rounds are added newest first while they fit the
+budget. Rounds that no longer fit are removed from the chat history and
+folded into the summary, so prompt size (and per-turn latency and cost)
+plateaus instead of growing with the session.
+"""
+
+from typing import Awaitable, Callable, List, Optional
+import logging
+
+from kani import ChatMessage, ChatRole
+
+from ..config.models import MemoryConfig
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+SUMMARY_HEADER = "Summary of your earlier turns (oldest first):"
+WORLD_STATE_HEADER = "Your most recent observation of your surroundings (it may be outdated):"
+
+
+class ConversationMemory:
+    """
+    Token-budgeted view of a Kani agent's chat history with a rolling summary.
+    """
+
+    def __init__(self, config: Optional[MemoryConfig] = None,
+                 summarize: Optional[Callable[[str, str], Awaitable[str]]] = None):
+        """
+        Args:
+            config: Memory settings (defaults to MemoryConfig())
+            summarize: Coroutine (previous summary, evicted turns) -> new summary, used when
+                config.summarizer is "llm"; the extractive summarizer is used otherwise
+        """
+        self.config = config or MemoryConfig()
+        self.summarize = summarize
+        self.summary_lines: List[str] = []
+        self.llm_summary = ""
+        self.latest_world_state: Optional[str] = None
+        # The world state as it was sent in the chat history (compressed observations differ)
+        self.latest_world_state_sent: Optional[str] = None
+        self.evicted_rounds = 0
+
+    @property
+    def summary(self) -> str:
+        """The rolling summary of evicted rounds ("" if nothing was evicted)."""
+        if self.config.summarizer == "llm" and self.summarize is not None:
+            return self.llm_summary
+        return "\n".join(self.summary_lines)
+
+    def note_world_state(self, world_state: str, sent_text: Optional[str] = None):
+        """
+        Remember the latest full description of the agent's surroundings (pinned in the prompt).
+
+        Args:
+            world_state: The full description, pinned once the message carrying it is evicted
+            sent_text: The text that carried it in the chat history (world_state if None)
+        """
+        self.latest_world_state = world_state
+        self.latest_world_state_sent = sent_text
+
+    async def build_prompt(self, agent) -> List[ChatMessage]:
+        """
+        Return the prompt for the agent's next completion, evicting rounds that exceed the budget.
+
+        Args:
+            agent: The Kani agent (uses chat_history, always_included_messages and message_token_len)
+        """
+        rounds = split_rounds(agent.chat_history)
+        if not rounds:
+            return agent.always_included_messages
+
+        budget = self.config.context_token_budget - sum(agent.message_token_len(m) for m in agent.always_included_messages)
+
+        # The current round is always kept
+        kept = [rounds[-1]]
+        used = _rounds_len(agent, kept)
+
+        summary_message = self._summary_message()
+        world_state_message = self._world_state_message(rounds[-1])
+        for pinned in (summary_message, world_state_message):
+            if pinned is not None:
+                used += agent.message_token_len(pinned)
+
+        # Add older rounds newest first while they fit
+        for round_messages in reversed(rounds[:-1]):
+            round_len = _rounds_len(agent, [round_messages])
+            if used + round_len > budget:
+                break
+            kept.insert(0, round_messages)
+            used += round_len
+
+        evicted = rounds[:len(rounds) - len(kept)]
+        if evicted:
+            await self._evict(agent, evicted)
+            summary_message = self._summary_message()
+
+        # The world state only needs pinning if the message that carried it was evicted
+        kept_messages = [message for round_messages in kept for message in round_messages]
+        world_state_message = self._world_state_message(*kept)
+
+        prompt = list(agent.always_included_messages)
+        if summary_message is not None:
+            prompt.append(summary_message)
+        if world_state_message is not None:
+            prompt.append(world_state_message)
+        return prompt + kept_messages
+
+    # === Internals ===
+
+    async def _evict(self, agent, evicted: List[List[ChatMessage]]):
+        """Drop evicted rounds from the chat history and fold them into the summary."""
+        evicted_count = sum(len(round_messages) for round_messages in evicted)
+        del agent.chat_history[:evicted_count]
+        self.evicted_rounds += len(evicted)
+
+        turn_lines = [describe_round(round_messages) for round_messages in evicted]
+        if self.config.summarizer == "llm" and self.summarize is not None:
+            try:
+                self.llm_summary = await self.summarize(self.llm_summary, "\n".join(turn_lines))
+                return
+            except Exception as e:
+                logger.warning(f"LLM summary failed, keeping an extractive summary: {e}")
+                self.llm_summary = "\n".join(filter(None, [self.llm_summary] + turn_lines))
+                return
+
+        self.summary_lines.extend(turn_lines)
+        # Keep the summary itself bounded: forget the oldest turns first
+        while len(self.summary_lines) > 1 and sum(len(line) for line in self.summary_lines) // 4 > self.config.summary_max_tokens:
+            self.summary_lines.pop(0)
+
+    def _summary_message(self) -> Optional[ChatMessage]:
+        summary = self.summary
+        if not summary:
+            return None
+        return ChatMessage.system(f"{SUMMARY_HEADER}\n{summary}")
+
+    def _world_state_message(self, *kept: List[ChatMessage]) -> Optional[ChatMessage]:
+        if not self.config.pin_world_state or not self.latest_world_state:
+            return None
+        sent_text = self.latest_world_state_sent or self.latest_world_state
+        for round_messages in kept:
+            for message in round_messages:
+                if sent_text in (message.text or ""):
+                    return None
+        return ChatMessage.system(f"{WORLD_STATE_HEADER}\n{self.latest_world_state}")
+
+
+def split_rounds(messages: List[ChatMessage]) -> List[List[ChatMessage]]:
+    """Split a chat history into rounds, each starting at a user message."""
+    rounds: List[List[ChatMessage]] = []
+    for message in messages:
+        if message.role == ChatRole.USER or not rounds:
+            rounds.append([message])
+        else:
+            rounds[-1].append(message)
+    return rounds
+
+
+def describe_round(round_messages: List[ChatMessage]) -> str:
+    """One-line extractive summary of a round: the commands submitted and their results."""
+    commands = []
+    results = []
+    for message in round_messages:
+        for tool_call in message.tool_calls or []:
+            try:
+                command = tool_call.function.kwargs.get("command")
+            except Exception:
+                command = None
+            if command:
+                commands.append(command)
+        if message.role == ChatRole.FUNCTION and message.text:
+            results.append(_first_line(message.text))
+
+    if not commands:
+        return "- You did not submit a command."
+    line = f"- You did '{', '.join(commands)}'"
+    if results:
+        line += f": {' / '.join(results)}"
+    return line
+
+
+def _first_line(text: str, limit: int = 160) -> str:
+    line = text.strip().splitlines()[0] if text.strip() else ""
+    return line if len(line) <= limit else line[:limit - 3] + "..."
+
+
+def _rounds_len(agent, rounds: List[List[ChatMessage]]) -> int:
+    return sum(agent.message_token_len(message) for round_messages in rounds for message in round_messages)
@@ -0,0 +1,178 @@
+"""
+Mock Engine - Deterministic local Kani engine
+=============================================
+Contains the MockEngine class, a Kani engine that needs no API key or network.
+
+It answers every request by calling submit_command with a command taken from
+the "Available actions" of the latest observation in the prompt ("look" when
+the latest command result does not list them):
+
+- "random": a seeded random choice (the same seed gives the same run)
+- "scripted": commands from `script`, in order and repeating
+- "replay": commands from a trace file (one command per line, or JSON Lines
+  with "command" and an optional "agent" field)
+
+Latency can be simulated so the scheduler, connection limits and game loop
+can be load-tested at hundreds of agents. Select it in llm.yaml with an
+engine whose provider is "mock".
+"""
+
+from typing import List, Optional
+import asyncio
+import json
+import logging
+import math
+import random
+
+from kani import ChatMessage, ChatRole
+from kani.engines.base import BaseEngine, Completion
+from kani.models import FunctionCall, ToolCall
+
+from ..config.models import MockEngineConfig
+from .observation import BULLET, expand_action, split_action
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+ACTIONS_HEADER = "Available actions:"
+UNCHANGED_ACTIONS = "Available actions: unchanged"
+FALLBACK_COMMAND = "look"
+
+
+class MockEngine(BaseEngine):
+    """
+    Kani engine that picks commands locally (one instance per agent).
+    """
+
+    max_context_size = 128000
+
+    def __init__(self, config: Optional[MockEngineConfig] = None, agent_id: Optional[str] = None):
+        """
+        Args:
+            config: Mock settings (defaults to MockEngineConfig())
+            agent_id: Agent using this engine; seeds its choices and selects its replay trace lines
+        """
+        self.config = config or MockEngineConfig()
+        self.agent_id = agent_id
+        self.hyperparams = {}
+        self._rng = random.Random(f"{self.config.seed}:{agent_id}")
+        self._latency_rng = random.Random(f"{self.config.seed}:{agent_id}:latency")
+        self._step = 0
+        self._trace = self._load_trace() if self.config.mode == "replay" else []
+
+    # === Kani engine interface ===
+
+    def message_len(self, message: ChatMessage) -> int:
+        """Approximate token length (4 characters per token)."""
+        length = len(message.text or "") // 4 + 4
+        for tool_call in message.tool_calls or []:
+            length += len(tool_call.function.arguments) // 4 + 4
+        return length
+
+    def function_token_reserve(self, functions) -> int:
+        return 0
+
+    async def predict(self, messages: List[ChatMessage], functions=None, **hyperparams) -> Completion:
+        """Return a submit_command call (or a short acknowledgement when no functions are offered)."""
+        await self._simulate_latency()
+        prompt_tokens = sum(self.message_len(message) for message in messages)
+
+        if not functions or not any(function.name == "submit_command" for function in functions):
+            return Completion(ChatMessage.assistant("OK."), prompt_tokens=prompt_tokens, completion_tokens=1)
+
+        command = self.choose_command(available_actions(messages))
+        call = ToolCall.from_function_call(FunctionCall.with_args("submit_command", command=command))
+        message = ChatMessage.assistant(None, tool_calls=[call])
+        return Completion(message, prompt_tokens=prompt_tokens, completion_tokens=self.message_len(message))
+
+    # === Command selection ===
+
+    def choose_command(self, actions: List[str]) -> str:
+        """Pick the next command according to the configured mode."""
+        step = self._step
+        self._step += 1
+
+        if self.config.mode == "scripted" and self.config.script:
+            return self.config.script[step % len(self.config.script)]
+        if self.config.mode == "replay":
+            return self._trace[step] if step < len(self._trace) else FALLBACK_COMMAND
+        if not actions:
+            return FALLBACK_COMMAND
+        return self._rng.choice(actions)
+
+    def _load_trace(self) -> List[str]:
+        """Read this agent's commands from the replay trace."""
+        if not self.config.trace_path:
+            logger.warning("Mock engine in replay mode without trace_path; submitting 'look'")
+            return []
+        commands = []
+        with open(self.config.trace_path, encoding="utf-8") as trace_file:
+            for line in trace_file:
+                line = line.strip()
+                if not line:
+                    continue
+                if not line.startswith("{"):
+                    commands.append(line)
+                    continue
+                entry = json.loads(line)
+                if entry.get("agent") in (None, self.agent_id):
+                    commands.append(entry["command"])
+        return commands
+
+    async def _simulate_latency(self):
+        delay = sample_latency(self.config, self._latency_rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def sample_latency(config: MockEngineConfig, rng: random.Random) -> float:
+    """Draw one simulated response time in seconds."""
+    mean, stddev = config.latency_mean, config.latency_stddev
+    if mean <= 0:
+        return 0.0
+    if config.latency_distribution == "uniform":
+        return rng.uniform(max(0.0, mean - stddev), mean + stddev)
+    if config.latency_distribution == "normal":
+        return max(0.0, rng.gauss(mean, stddev))
+    if config.latency_distribution == "lognormal":
+        # Parameterized so the samples have the configured mean and standard deviation
+        variance_ratio = 1 + (stddev / mean) ** 2
+        sigma = variance_ratio ** 0.5
+        return rng.lognormvariate(math.log(mean / sigma), math.log(variance_ratio) ** 0.5)
+    return mean
+
+
+def available_actions(messages: List[ChatMessage]) -> List[str]:
+    """
+    Commands listed under "Available actions:" in the latest observation.
+
+    Returns [] (so the engine looks around) when the latest observation or
+    command result does not list actions, since the world may have changed.
+    Sections marked unchanged refer back to earlier observations.
+    """
+    referenced = False
+    for message in reversed(messages):
+        if message.role == ChatRole.ASSISTANT:
+            continue
+        text = message.text or ""
+        actions = _listed_actions(text)
+        if actions:
+            return actions
+        if UNCHANGED_ACTIONS in text:
+            referenced = True
+        elif not referenced and message.role != ChatRole.SYSTEM:
+            return []
+    return []
+
+
+def _listed_actions(text: str) -> List[str]:
+    start = text.rfind(ACTIONS_HEADER + "\n")
+    if start < 0:
+        return []
+    actions = []
+    for line in text[start + len(ACTIONS_HEADER) + 1:].splitlines():
+        if not line.startswith(BULLET):
+            break
+        command, _ = split_action(line[len(BULLET):])
+        actions.extend(expand_action(command))
+    return actions
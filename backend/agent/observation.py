@@ -0,0 +1,233 @@
+"""
+Observation Compressor - Smaller observations for LLM agents
+============================================================
+Contains the ObservationCompressor class that shrinks the world state text
+agents receive (the format produced by EnhancedLookAction._format_world_state)
+without dropping anything an agent could act on.
+
+- Templated actions are grouped: "take red quilt", "take blue quilt", ... become
+  a single line "take {x} quilt (x: red, blue, ...)". Every original command can
+  still be reconstructed from the grouped line.
+- List sections ("You can see:", "Available actions:", ...) that are identical
+  to the previous observation are replaced by a short "unchanged" note.
+- Token counts are reported per section (tiktoken when available, otherwise
+  an estimate of 4 characters per token).
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import logging
+import re
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+BULLET = "  - "
+PLACEHOLDER = "{x}"
+_GROUPED_COMMAND = re.compile(r"^(.*\{x\}.*) \(x: ([^)]+)\)$")
+_GROUPED_ENTRY = re.compile(r"^(.*\{x\}.* \(x: [^)]+\))(?:: (.*))?$")
+
+_encoding = None
+_encoding_loaded = False
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken's o200k_base encoding, or estimate if it is unavailable."""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            logger.debug(f"tiktoken unavailable, estimating token counts: {e}")
+            _encoding = None
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+@dataclass
+class CompressedObservation:
+    """Result of compressing one observation."""
+    text: str                      # Grouped and diffed against the previous observation
+    full_text: str                 # Grouped only (every section present)
+    original_tokens: int
+    compressed_tokens: int
+    section_tokens: Dict[str, int] = field(default_factory=dict)
+
+
+class ObservationCompressor:
+    """
+    Compresses observations for one agent, remembering the sections it sent last.
+    """
+
+    def __init__(self, group_actions: bool = True, drop_unchanged: bool = True):
+        self.group_actions = group_actions
+        self.drop_unchanged = drop_unchanged
+        self._last_sections: Dict[str, str] = {}
+
+    def compress(self, text: str) -> CompressedObservation:
+        """
+        Compress an observation.
+
+        Args:
+            text: Observation text; blocks separated by blank lines are treated as sections
+
+        Returns:
+            CompressedObservation with the compressed text and per-section token counts
+        """
+        full_blocks: List[str] = []
+        blocks: List[str] = []
+        section_tokens: Dict[str, int] = {}
+
+        for block in text.split("\n\n"):
+            title = _section_title(block)
+            if self.group_actions and _is_list_section(block):
+                block = _group_list_section(block)
+            full_blocks.append(block)
+
+            if _is_list_section(block):
+                if self.drop_unchanged and self._last_sections.get(title) == block:
+                    compressed = f"{title}: unchanged since your last observation."
+                else:
+                    compressed = block
+                self._last_sections[title] = block
+            else:
+                compressed = block
+            blocks.append(compressed)
+
+            if title:
+                section_tokens[title] = section_tokens.get(title, 0) + count_tokens(compressed)
+
+        compressed_text = "\n\n".join(blocks)
+        return CompressedObservation(
+            text=compressed_text,
+            full_text="\n\n".join(full_blocks),
+            original_tokens=count_tokens(text),
+            compressed_tokens=count_tokens(compressed_text),
+            section_tokens=section_tokens,
+        )
+
+    def reset(self):
+        """Forget the previously sent sections (the next observation is sent in full)."""
+        self._last_sections.clear()
+
+
+def group_actions(entries: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Group (command, description) pairs that differ only in one span of the command.
+
+    Commands are first grouped by their leading word ("take red quilt", "take blue
+    quilt"), then the remaining ones by their trailing word ("open closet",
+    "close closet"). Within a group the common leading and trailing words form the
+    template and the differing words become the choices; entries whose
+    descriptions do not follow the same template are kept apart. Groups appear at
+    the position of their first member.
+
+    Returns:
+        (command, description) pairs, grouped where possible
+    """
+    entries = _group_by(entries, lambda words: words[0])
+    return _group_by(entries, lambda words: words[-1])
+
+
+def split_action(entry: str) -> Tuple[str, str]:
+    """Split an action line (without its bullet) into command and description; grouped commands stay whole."""
+    match = _GROUPED_ENTRY.match(entry)
+    if match:
+        return match.group(1), match.group(2) or ""
+    command, _, description = entry.partition(": ")
+    return command, description
+
+
+def expand_action(command: str) -> List[str]:
+    """
+    Expand a grouped command back into the commands it stands for.
+
+    "go {x} (x: north, east)" -> ["go north", "go east"]; other commands are returned as they are.
+    """
+    match = _GROUPED_COMMAND.match(command)
+    if not match:
+        return [command]
+    template, choices = match.groups()
+    return [template.replace(PLACEHOLDER, choice.strip()) for choice in choices.split(",")]
+
+
+def _group_by(entries: List[Tuple[str, str]], key) -> List[Tuple[str, str]]:
+    candidates: Dict[str, List[int]] = {}
+    for index, (command, _) in enumerate(entries):
+        words = command.split()
+        # Single-word commands (e.g. "look" next to "look at x") and groups are kept as they are
+        if len(words) > 1 and PLACEHOLDER not in command:
+            candidates.setdefault(key(words), []).append(index)
+
+    replacement: Dict[int, Optional[Tuple[str, str]]] = {}
+    for indices in candidates.values():
+        if len(indices) < 2:
+            continue
+        for members, grouped_entry in _split_by_description(entries, indices):
+            if len(members) < 2:
+                continue
+            replacement[members[0]] = grouped_entry
+            for index in members[1:]:
+                replacement[index] = None
+
+    grouped = []
+    for index, entry in enumerate(entries):
+        if index not in replacement:
+            grouped.append(entry)
+        elif replacement[index] is not None:
+            grouped.append(replacement[index])
+    return grouped
+
+
+def _split_by_description(entries, indices):
+    """Yield (member indices, grouped entry) for members that share a description template."""
+    prefix, suffix = _common_affixes([entries[index][0].split() for index in indices])
+
+    by_description: Dict[str, List[Tuple[int, str]]] = {}
+    for index in indices:
+        command, description = entries[index]
+        words = command.split()
+        middle = " ".join(words[len(prefix):len(words) - len(suffix)])
+        description_template = re.sub(rf"\b{re.escape(middle)}\b", PLACEHOLDER, description)
+        by_description.setdefault(description_template, []).append((index, middle))
+
+    command_template = " ".join(prefix + [PLACEHOLDER] + suffix)
+    for description_template, members in by_description.items():
+        choices = ", ".join(middle for _, middle in members)
+        yield [index for index, _ in members], (f"{command_template} (x: {choices})", description_template)
+
+
+def _common_affixes(word_lists: List[List[str]]) -> Tuple[List[str], List[str]]:
+    """Longest common leading and trailing words that leave every command at least one varying word."""
+    limit = min(len(words) for words in word_lists) - 1
+    prefix_len = 0
+    while prefix_len < limit and len({words[prefix_len] for words in word_lists}) == 1:
+        prefix_len += 1
+    suffix_len = 0
+    while prefix_len + suffix_len < limit and len({words[-suffix_len - 1] for words in word_lists}) == 1:
+        suffix_len += 1
+    first = word_lists[0]
+    return first[:prefix_len], first[len(first) - suffix_len:]
+
+
+def _section_title(block: str) -> str:
+    first_line = block.strip().splitlines()[0] if block.strip() else ""
+    return first_line.split(":", 1)[0].strip().rstrip(".")
+
+
+def _is_list_section(block: str) -> bool:
+    lines = block.strip("\n").splitlines()
+    return len(lines) > 1 and lines[0].rstrip().endswith(":") and all(line.startswith(BULLET) for line in lines[1:])
+
+
+def _group_list_section(block: str) -> str:
+    lines = block.strip("\n").splitlines()
+    entries = []
+    for line in lines[1:]:
+        entries.append(split_action(line[len(BULLET):]))
+    grouped = group_actions(entries)
+    return "\n".join([lines[0]] + [f"{BULLET}{command}: {description}" if description else f"{BULLET}{command}"
+                                   for command, description in grouped])
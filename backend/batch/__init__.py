@@ -0,0 +1,13 @@
+"""
+Headless batch simulations across a process pool.
+
+Run with `python -m backend.batch --games 16 --engine mock` from the project
+root.
+
+This package contains:
+- runner: Game specs, the process pool runner and the per-game driver
+"""
+
+from .runner import GameSpec, make_specs, load_specs, run_batch, run_game
+
+__all__ = ["GameSpec", "make_specs", "load_specs", "run_batch", "run_game"]
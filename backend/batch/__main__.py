@@ -0,0 +1,60 @@
+"""
+Command line entry point for batch simulations.
+
+    python -m backend.batch --games 16 --turns 200 --engine mock --output data/batch
+
+Game summaries are appended to <output>/results.jsonl as games finish, and
+the action outputs and traces of every game are streamed to <output>/games
+and <output>/traces. A short line per game is printed to stderr.
+
+The scheduler budgets of llm.yaml are shared by all workers (the mock engine
+counts tokens too), so raise them for large offline runs.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from .runner import DEFAULT_BUILDER, load_specs, make_specs, run_batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m backend.batch", description="Run many headless games across a process pool.")
+    parser.add_argument("--games", type=int, default=4, help="Number of games (default: 4)")
+    parser.add_argument("--specs", help="JSON Lines file with one game spec per line (overrides --games)")
+    parser.add_argument("--turns", type=int, default=100, help="Turns per game (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first game; games get consecutive seeds")
+    parser.add_argument("--builder", default=DEFAULT_BUILDER,
+                        help=f"World builder as module:function (default: {DEFAULT_BUILDER})")
+    parser.add_argument("--turn-mode", choices=["sequential", "concurrent"], default="sequential",
+                        help="Turn mode of every game (default: sequential)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: number of CPUs)")
+    parser.add_argument("--engine", help="Engine used by every agent, e.g. 'mock' (default: agents.yaml)")
+    parser.add_argument("--output", default="data/batch", help="Output directory (default: data/batch)")
+    args = parser.parse_args(argv)
+
+    if args.specs:
+        specs = load_specs(args.specs, {"turns": args.turns, "builder": args.builder, "turn_mode": args.turn_mode})
+    else:
+        specs = make_specs(args.games, args.seed, args.turns, args.builder, args.turn_mode)
+
+    def progress(summary):
+        if "error" in summary:
+            print(f"game {summary['index']:>4} seed={summary['seed']} FAILED: {summary['error']}", file=sys.stderr)
+        else:
+            print(f"game {summary['index']:>4} seed={summary['seed']} turns={summary['turns']} "
+                  f"actions={summary['actions']} tokens={summary['tokens']} {summary['duration_s']}s", file=sys.stderr)
+
+    start = time.perf_counter()
+    summaries = run_batch(specs, args.output, workers=args.workers, engine=args.engine, progress=progress)
+    elapsed = time.perf_counter() - start
+    turns = sum(summary.get("turns", 0) for summary in summaries)
+    failed = sum("error" in summary for summary in summaries)
+    print(json.dumps({"games": len(summaries), "failed": failed, "turns": turns, "elapsed_s": round(elapsed, 3),
+                      "turns_per_second": round(turns / elapsed, 2) if elapsed else 0.0}))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""
+Batch runner: many independent headless games across a process pool.
+
+Each game is built by a builder function, gets its own AgentManager with a
+KaniAgent per agent character, and runs for a number of turns without any
+pacing. Games are sharded across worker processes, so the simulation part
+scales with the number of cores.
+
+LLM requests of the games in one worker go through that worker's scheduler.
+Schedulers cannot be shared between processes, so the configured request
+and token budgets are split evenly between the workers; together they stay
+within the limits of the LLM configuration.
+
+Output directory layout:
+- results.jsonl: one summary per game, appended as games finish
+- games/game-0001.jsonl: the game's action outputs, one per line, streamed
+  while it runs
+- traces/game-0001.jsonl: the game's tracing spans (see backend.tracing)
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import asyncio
+import importlib
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+
+from backend.agent.agent_strategies import KaniAgent
+from backend.agent.engine_registry import close_engine_registry
+from backend.agent.llm_scheduler import LLMScheduler, set_llm_scheduler
+from backend.agent.manager import AgentManager
+from backend.config.models import SchedulerConfig, TracingConfig
+from backend.config.yaml_config import get_config_manager
+from backend.text_adventure_games.actions.generic import EnhancedLookAction
+from backend.tracing import Tracer, set_tracer
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUILDER = "backend.text_adventure_games.world:build_house_game"
+
+# Safety limit for agents that never end their turn (look, chat responses, ...)
+MAX_ACTIONS_PER_TURN = 10
+
+
+@dataclass
+class GameSpec:
+    """One game of a batch."""
+    index: int
+    seed: int = 0
+    turns: int = 100
+    builder: str = DEFAULT_BUILDER
+    turn_mode: str = "sequential"
+    # Agent characters driven by a KaniAgent (default: the agents of agents.yaml
+    # found in the world, or else every character except the player)
+    agents: Optional[List[str]] = None
+    # Persona overrides by agent name
+    personas: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class WorkerSettings:
+    """Settings shared by every game of a worker process."""
+    output_dir: str
+    engine: Optional[str] = None
+    scheduler: Optional[Dict[str, Any]] = None
+    log_level: int = logging.WARNING
+
+
+def make_specs(games: int, seed: int = 0, turns: int = 100, builder: str = DEFAULT_BUILDER,
+               turn_mode: str = "sequential") -> List[GameSpec]:
+    """Specs for `games` games with consecutive seeds, starting at `seed`."""
+    return [GameSpec(index=index, seed=seed + index - 1, turns=turns, builder=builder, turn_mode=turn_mode)
+            for index in range(1, games + 1)]
+
+
+def load_specs(path: str, defaults: Dict[str, Any]) -> List[GameSpec]:
+    """
+    Read game specs from a JSON Lines file (one object of GameSpec fields per line).
+
+    Missing fields come from `defaults`; missing indices are numbered by line.
+    """
+    specs = []
+    with open(path, encoding="utf-8") as specs_file:
+        for number, line in enumerate((line for line in specs_file if line.strip()), start=1):
+            values = {**defaults, "index": number, **json.loads(line)}
+            specs.append(GameSpec(**values))
+    return specs
+
+
+def split_scheduler_config(config: SchedulerConfig, workers: int) -> SchedulerConfig:
+    """The share of the scheduler budgets for one of `workers` worker processes."""
+    def share(value):
+        return None if value is None else max(1, value // workers)
+
+    return config.model_copy(update={
+        "max_concurrent": max(1, config.max_concurrent // workers),
+        "requests_per_minute": share(config.requests_per_minute),
+        "tokens_per_minute": share(config.tokens_per_minute),
+    })
+
+
+def run_batch(specs: Iterable[GameSpec], output_dir: str, workers: Optional[int] = None,
+              engine: Optional[str] = None,
+              progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Run games across a process pool.
+
+    Args:
+        specs: Games to run
+        output_dir: Directory for results, action outputs and traces (created if missing)
+        workers: Worker processes (default: number of CPUs)
+        engine: Engine used by every agent (e.g. "mock"), overriding agents.yaml
+        progress: Called with each game's summary as it finishes
+
+    Returns:
+        Game summaries ordered by game index
+    """
+    specs = list(specs)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(specs) or 1))
+    os.makedirs(output_dir, exist_ok=True)
+
+    scheduler_config = split_scheduler_config(get_config_manager().llm_config.scheduler, workers)
+    settings = WorkerSettings(output_dir=output_dir, engine=engine, scheduler=scheduler_config.model_dump(),
+                              log_level=logging.getLogger().getEffectiveLevel())
+
+    summaries = []
+    results_path = os.path.join(output_dir, "results.jsonl")
+    # Spawned workers start clean (no inherited event loop, threads or logging handlers)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(settings,)) as pool, \
+            open(results_path, "a", encoding="utf-8") as results_file:
+        futures = {pool.submit(run_game, spec): spec for spec in specs}
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except Exception as e:  # The worker process died
+                spec = futures[future]
+                summary = {"index": spec.index, "seed": spec.seed, "error": f"{type(e).__name__}: {e}"}
+            results_file.write(json.dumps(summary) + "\n")
+            results_file.flush()
+            summaries.append(summary)
+            if progress:
+                progress(summary)
+    return sorted(summaries, key=lambda summary: summary["index"])
+
+
+# === Worker process ===
+
+_settings: Optional[WorkerSettings] = None
+
+
+def _init_worker(settings: WorkerSettings):
+    global _settings
+    _settings = settings
+    logging.basicConfig(level=settings.log_level, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    if settings.engine:
+        get_config_manager().llm_config.engine_override = settings.engine
+
+
+def run_game(spec: GameSpec) -> Dict[str, Any]:
+    """Run one game to completion in this process and return its summary."""
+    settings = _settings or WorkerSettings(output_dir=".")
+    start = time.perf_counter()
+    summary: Dict[str, Any] = {"index": spec.index, "seed": spec.seed, "builder": spec.builder, "pid": os.getpid()}
+    try:
+        summary.update(asyncio.run(_run_game(spec, settings)))
+    except Exception as e:
+        logger.error(f"Game {spec.index} failed: {e}")
+        summary["error"] = f"{type(e).__name__}: {e}"
+        summary["traceback"] = traceback.format_exc()
+    summary["duration_s"] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+async def _run_game(spec: GameSpec, settings: WorkerSettings) -> Dict[str, Any]:
+    """Build the game and its agents, play it and collect the summary."""
+    config_manager = get_config_manager()
+    for subdirectory in ("games", "traces"):
+        os.makedirs(os.path.join(settings.output_dir, subdirectory), exist_ok=True)
+    # Seed the mock engine's choices with the game's seed
+    for engine_config in config_manager.llm_config.engines.values():
+        engine_config.mock.seed = spec.seed
+
+    # Scheduler and tracer are per game: asyncio primitives belong to this game's event loop
+    scheduler_config = SchedulerConfig(**settings.scheduler) if settings.scheduler else None
+    scheduler = set_llm_scheduler(LLMScheduler(scheduler_config))
+    trace_path = os.path.join(settings.output_dir, "traces", f"game-{spec.index:04d}.jsonl")
+    tracer = set_tracer(Tracer(TracingConfig(export_path=trace_path)))
+
+    try:
+        game = _load_builder(spec.builder, spec.seed)
+        manager = AgentManager(game)
+        for name in _agent_names(game, spec.agents, config_manager):
+            character = game.characters[name]
+            manager.register_agent_strategy(name, KaniAgent(
+                name, spec.personas.get(name), _initial_world_state(game, character),
+                game=game, character=character, config_manager=config_manager))
+
+        events_path = os.path.join(settings.output_dir, "games", f"game-{spec.index:04d}.jsonl")
+        with open(events_path, "w", encoding="utf-8") as events_file:
+            turns, actions, noops = await _play(manager, spec, events_file)
+
+        llm_metrics = scheduler.get_metrics()
+        return {
+            "agents": list(manager.active_agents),
+            "turns": turns,
+            "actions": actions,
+            "noop_actions": noops,
+            "game_over": bool(game.game_over),
+            "tokens": llm_metrics["tokens_used"],
+            "turn_latency_ms": tracer.get_metrics()["phases"].get("turn"),
+            "llm": llm_metrics,
+        }
+    finally:
+        set_tracer(None)
+        set_llm_scheduler(None)
+        await close_engine_registry()
+
+
+async def _play(manager: AgentManager, spec: GameSpec, events_file) -> tuple:
+    """Play the game's turns, streaming every action output; returns (turns, actions, noop actions)."""
+    turns = actions = noops = 0
+
+    def record(action_schema):
+        nonlocal actions, noops
+        actions += 1
+        if action_schema.action.action_type == "noop":
+            noops += 1
+        events_file.write(action_schema.model_dump_json() + "\n")
+
+    while turns < spec.turns and actions < spec.turns * MAX_ACTIONS_PER_TURN and not manager.game.game_over:
+        if spec.turn_mode == "concurrent":
+            results = await manager.execute_concurrent_round()
+            if not results:
+                break
+            for _, action_schema, action_ended_turn in results:
+                if action_schema:
+                    record(action_schema)
+                turns += action_ended_turn
+        else:
+            agent = manager.get_next_agent()
+            if agent is None:
+                break
+            action_schema, action_ended_turn = await manager.execute_agent_turn(agent)
+            if action_schema:
+                record(action_schema)
+            if action_ended_turn:
+                manager.advance_turn()
+                turns += 1
+        events_file.flush()
+    return turns, actions, noops
+
+
+def _load_builder(builder: str, seed: int):
+    """Build a game with a "module:function" builder, passing the seed if the builder takes one."""
+    module_name, _, function_name = builder.partition(":")
+    build = getattr(importlib.import_module(module_name), function_name or "build_game")
+    if "seed" in inspect.signature(build).parameters:
+        return build(seed=seed)
+    return build()
+
+
+def _agent_names(game, requested: Optional[List[str]], config_manager) -> List[str]:
+    """Names of the characters driven by agents."""
+    if requested:
+        missing = [name for name in requested if name not in game.characters]
+        if missing:
+            raise ValueError(f"Agents not in the world: {', '.join(missing)}")
+        return list(requested)
+    try:
+        configured = [name for name in config_manager.agents_config.agents if name in game.characters]
+    except Exception as e:
+        logger.warning(f"Failed to load agents from configuration: {e}")
+        configured = []
+    return configured or [name for name, character in game.characters.items() if character is not game.player]
+
+
+def _initial_world_state(game, character) -> str:
+    """The character's first view of the world (a look)."""
+    look_action = EnhancedLookAction(game, "look")
+    look_action.character = character
+    result = look_action.apply_effects()
+    return result.description if result and result.description else "You are in an unknown location."
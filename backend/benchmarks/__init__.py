@@ -0,0 +1,15 @@
+"""
+Benchmarks for the simulation hot paths.
+
+Run with `python -m backend.benchmarks` from the project root. No LLM or
+API key is needed: agents pick random available actions.
+
+This package contains:
+- worlds: Synthetic worlds made of scaled copies of the house
+- suite: The benchmarks and the runner that produces machine-readable results
+"""
+
+from .worlds import build_scaled_house_game
+from .suite import BENCHMARKS, BenchmarkResult, RandomActionStrategy, run_benchmarks
+
+__all__ = ["build_scaled_house_game", "BENCHMARKS", "BenchmarkResult", "RandomActionStrategy", "run_benchmarks"]
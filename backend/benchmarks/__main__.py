@@ -0,0 +1,59 @@
+"""
+Command line entry point for the benchmarks.
+
+    python -m backend.benchmarks --scales 1,10,100 --output results.json
+
+Results are written as JSON (to stdout unless --output is given); a short
+summary is printed to stderr.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+
+from .suite import BENCHMARKS, run_benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks", description="Benchmark the simulation hot paths.")
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated house copies per world (default: 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per micro-benchmark (default: 200)")
+    parser.add_argument("--turns", type=int, default=500, help="Agent turns for the end-to-end benchmark (default: 500)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the agents' random choices")
+    parser.add_argument("--only", help=f"Comma-separated benchmarks to run ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    scales = [int(scale) for scale in args.scales.split(",")]
+    only = args.only.split(",") if args.only else None
+    unknown = set(only or []) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    def progress(result):
+        summary = result.to_dict()
+        print(f"{summary['benchmark']:>18} x{summary['scale']:<4} n={summary['count']:<5} "
+              f"mean={summary['mean_ms']}ms p95={summary['p95_ms']}ms ops/s={summary['ops_per_s']}", file=sys.stderr)
+
+    results = asyncio.run(run_benchmarks(scales, args.repeat, args.turns, args.seed, only, progress))
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"scales": scales, "repeat": args.repeat, "turns": args.turns, "seed": args.seed},
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Benchmarks for the simulation hot paths.
+
+Each benchmark returns a BenchmarkResult with timing statistics in
+milliseconds. No LLM is involved: agent turns are driven by
+RandomActionStrategy, which picks a seeded random available action.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import random
+import time
+
+from backend.text_adventure_games.actions.base import ExecutionContext
+from backend.text_adventure_games.actions.discovery import get_available_actions
+from backend.agent.manager import AgentManager
+from .worlds import build_scaled_house_game
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark at one world scale."""
+    name: str
+    scale: int
+    samples: List[float]  # Seconds per operation
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Machine-readable summary (times in milliseconds)."""
+        samples = sorted(self.samples)
+        total = sum(samples)
+        result = {
+            "benchmark": self.name,
+            "scale": self.scale,
+            "count": len(samples),
+            "total_s": round(total, 6),
+            "ops_per_s": round(len(samples) / total, 2) if total else None,
+        }
+        for label, value in _stats_ms(samples).items():
+            result[label] = value
+        result.update(self.extra)
+        return result
+
+
+class RandomActionStrategy:
+    """
+    Agent strategy that picks a random available action (seeded), for benchmarks without an LLM.
+    """
+
+    def __init__(self, character, game, seed: int = 0):
+        self.character = character
+        self.game = game
+        self.rng = random.Random(f"{seed}:{character.name}")
+
+    async def select_action(self, action_result: str) -> str:
+        actions = get_available_actions(self.character, self.game.parser)
+        if not actions:
+            return "look"
+        return self.rng.choice(actions)['command']
+
+
+# === Benchmarks ===
+
+def bench_build_world(scale: int, repeat: int) -> BenchmarkResult:
+    """Construct the (scaled) house game."""
+    samples = _time_calls(lambda: build_scaled_house_game(scale), repeat)
+    return BenchmarkResult("build_world", scale, samples)
+
+
+def bench_parse_command(game, scale: int, repeat: int) -> BenchmarkResult:
+    """Parse and execute read-only commands ('look' and 'examine <item>') in an agent's room."""
+    agent = _first_agent(game)
+    commands = ["look"] + [f"examine {name}" for name in agent.location.items]
+    calls = [commands[i % len(commands)] for i in range(repeat)]
+    samples = [_time_call(lambda: game.parser.parse_command(command, context=ExecutionContext(actor=agent)))
+               for command in calls]
+    return BenchmarkResult("parse_command", scale, samples, {"commands": len(commands)})
+
+
+def bench_available_actions(game, scale: int) -> BenchmarkResult:
+    """get_available_actions in every room, uncached (samples) and cached (warm stats)."""
+    probe = game.player
+    per_room = {}
+    warm = []
+    for location in list(game.locations.values()):
+        if probe.location is not None:
+            probe.location.remove_character(probe)
+        location.add_character(probe)
+        game.available_actions_cache.clear()
+        per_room[location.name] = _time_call(lambda: get_available_actions(probe, game.parser))
+        warm.append(_time_call(lambda: get_available_actions(probe, game.parser)))
+
+    slowest = sorted(per_room.items(), key=lambda entry: entry[1], reverse=True)[:5]
+    return BenchmarkResult("available_actions", scale, list(per_room.values()), {
+        "rooms": len(per_room),
+        "slowest_rooms_ms": {name: round(seconds * 1000, 4) for name, seconds in slowest},
+        "warm": _stats_ms(sorted(warm)),
+    })
+
+
+def bench_world_state(game, scale: int) -> BenchmarkResult:
+    """WorldStateManager.get_world_state_for_agent for every agent, uncached (samples) and cached (warm stats)."""
+    manager = game.world_state_manager
+    agents = [character for character in game.characters.values() if character is not game.player]
+    game.available_actions_cache.clear()
+    samples = [_time_call(lambda: manager.get_world_state_for_agent(agent)) for agent in agents]
+    warm = [_time_call(lambda: manager.get_world_state_for_agent(agent)) for agent in agents]
+    return BenchmarkResult("world_state", scale, samples, {"agents": len(agents), "warm": _stats_ms(sorted(warm))})
+
+
+def bench_get_schema(game, scale: int, repeat: int) -> BenchmarkResult:
+    """SchemaExporter.get_schema for an executed 'look'."""
+    execution = ExecutionContext(actor=_first_agent(game))
+    game.parser.parse_command("look", context=execution)
+    samples = _time_calls(lambda: game.schema_exporter.get_schema(execution), repeat)
+    return BenchmarkResult("get_schema", scale, samples)
+
+
+async def bench_turns(scale: int, turns: int, seed: int) -> BenchmarkResult:
+    """End-to-end agent turns through AgentManager.execute_agent_turn with RandomActionStrategy."""
+    game = build_scaled_house_game(scale)
+    manager = AgentManager(game)
+    for character in game.characters.values():
+        if character is not game.player:
+            manager.register_agent_strategy(character.name, RandomActionStrategy(character, game, seed))
+
+    samples = []
+    failed = 0
+    for _ in range(turns):
+        agent = manager.get_next_agent()
+        start = time.perf_counter()
+        action_schema, _ = await manager.execute_agent_turn(agent)
+        samples.append(time.perf_counter() - start)
+        if action_schema is None or action_schema.action.action_type == "noop":
+            failed += 1
+        manager.advance_turn()
+    return BenchmarkResult("agent_turn", scale, samples, {"agents": len(manager.active_agents), "failed_turns": failed})
+
+
+BENCHMARKS = ["build_world", "parse_command", "available_actions", "world_state", "get_schema", "agent_turn"]
+
+
+async def run_benchmarks(scales: List[int], repeat: int = 200, turns: int = 500, seed: int = 0,
+                         only: Optional[List[str]] = None,
+                         progress: Optional[Callable[[BenchmarkResult], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Run the benchmarks at each world scale.
+
+    Args:
+        scales: House copies per world (1 is the canonical house)
+        repeat: Calls per micro-benchmark
+        turns: Agent turns for the end-to-end benchmark
+        seed: Seed for the agents' random choices
+        only: Benchmark names to run (all if None)
+        progress: Called with each result as it completes
+
+    Returns:
+        List of result dicts (see BenchmarkResult.to_dict)
+    """
+    selected = only or BENCHMARKS
+    results = []
+
+    def record(result: BenchmarkResult):
+        results.append(result.to_dict())
+        if progress is not None:
+            progress(result)
+
+    for scale in scales:
+        if "build_world" in selected:
+            record(bench_build_world(scale, max(1, repeat // scale)))
+        if "parse_command" in selected:
+            record(bench_parse_command(build_scaled_house_game(scale), scale, repeat))
+        if "available_actions" in selected:
+            record(bench_available_actions(build_scaled_house_game(scale), scale))
+        if "world_state" in selected:
+            record(bench_world_state(build_scaled_house_game(scale), scale))
+        if "get_schema" in selected:
+            record(bench_get_schema(build_scaled_house_game(scale), scale, repeat))
+        if "agent_turn" in selected:
+            record(await bench_turns(scale, turns, seed))
+    return results
+
+
+# === Helpers ===
+
+def _time_call(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _time_calls(fn: Callable[[], Any], repeat: int) -> List[float]:
+    return [_time_call(fn) for _ in range(repeat)]
+
+
+def _stats_ms(samples: List[float]) -> Dict[str, Optional[float]]:
+    """Mean and percentiles of sorted samples, in milliseconds."""
+    if not samples:
+        return {"mean_ms": None, "p50_ms": None, "p95_ms": None, "max_ms": None}
+
+    def percentile(fraction):
+        return round(samples[min(len(samples) - 1, int(len(samples) * fraction))] * 1000, 4)
+
+    return {
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 4),
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "max_ms": round(samples[-1] * 1000, 4),
+    }
+
+
+def _first_agent(game):
+    for character in game.characters.values():
+        if character is not game.player:
+            return character
+    return game.player
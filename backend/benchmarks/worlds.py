@@ -0,0 +1,58 @@
+"""
+Synthetic worlds for benchmarks.
+
+The canonical house is replicated `scale` times (8 rooms, 35 items and 2
+agents per copy). Copies are linked as a binary tree so every room stays
+reachable and the layout stays shallow.
+"""
+
+from backend.text_adventure_games import games, things
+from backend.text_adventure_games.world import build_house_game
+from backend.text_adventure_games.world.layout import create_house_locations, connect_house_locations
+from backend.text_adventure_games.world.items import place_items_in_locations
+from backend.text_adventure_games.world.characters import create_player_character
+
+AGENTS_PER_HOUSE = 2
+
+
+def build_scaled_house_game(scale: int = 1) -> games.Game:
+    """
+    Build a game with `scale` copies of the house.
+
+    Scale 1 is the canonical house from build_house_game. Larger scales name
+    rooms "<Room> <copy>" and agents "agent_<n>", starting each copy's agents
+    in its Bedroom and Kitchen.
+
+    Returns:
+        games.Game: The scaled game
+    """
+    if scale <= 1:
+        return build_house_game()
+
+    houses = []
+    npcs = []
+    for copy in range(scale):
+        locations = create_house_locations()
+        for location in locations.values():
+            location.name = f"{location.name} {copy + 1}"
+        connect_house_locations(locations)
+        place_items_in_locations(locations)
+
+        for room in ("bedroom", "kitchen")[:AGENTS_PER_HOUSE]:
+            agent = things.Character(
+                name=f"agent_{len(npcs) + 1:04d}",
+                description="A benchmark agent exploring the house.",
+                persona="I am a benchmark agent."
+            )
+            locations[room].add_character(agent)
+            npcs.append(agent)
+
+        if copy > 0:
+            # Copy n hangs off the Living Room (odd n) or Bathroom (even n) of copy (n - 1) // 2
+            parent = houses[(copy - 1) // 2]
+            # (the reverse exit is added to the Entry Room as south or west, which are free there)
+            parent_room, direction = (parent["living"], "north") if copy % 2 else (parent["bathroom"], "east")
+            parent_room.add_connection(direction, locations["entry"])
+        houses.append(locations)
+
+    return games.Game(houses[0]["entry"], create_player_character(), characters=npcs)
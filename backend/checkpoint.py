@@ -0,0 +1,232 @@
+"""
+Checkpoint Store - Crash-safe persistence of a running simulation
+=================================================================
+Contains the CheckpointStore class used by the GameLoop so a crash or restart
+does not lose a long run.
+
+- Every event is appended to a journal (journal.jsonl) with its id and turn.
+  After a checkpoint is written, the journal is cut down to the events the
+  kept checkpoints still need, so it does not grow with the length of a run.
+- Every few turns the GameLoop stores a checkpoint: a snapshot of the world,
+  turn counter, chat state and agent conversations (see GameLoop.snapshot).
+  Checkpoint files are written atomically and carry a checksum; the newest
+  few are kept.
+- Writes are buffered and flushed in batches by a background task, which
+  writes and fsyncs in a worker thread so the event loop never waits on disk.
+- On resume the newest valid checkpoint is loaded, and the journaled events
+  up to that checkpoint are read back into the event log.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import os
+import re
+import zlib
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_MAGIC = b"CKPT"
+CHECKPOINT_PATTERN = re.compile(r"^checkpoint-(\d+)\.ckpt$")
+
+
+class CheckpointStore:
+    """
+    Directory of checkpoints plus an event journal, written in the background.
+    """
+
+    JOURNAL_NAME = "journal.jsonl"
+
+    def __init__(self, directory: str, keep: int = 3, flush_interval: float = 1.0):
+        """
+        Args:
+            directory: Directory for checkpoint files and the journal (created if missing)
+            keep: Number of checkpoint files kept on disk
+            flush_interval: Seconds between background flushes
+        """
+        self.directory = directory
+        self.keep = max(1, keep)
+        self.flush_interval = flush_interval
+        self.journal_path = os.path.join(directory, self.JOURNAL_NAME)
+
+        self._lines: List[str] = []
+        self._pending_checkpoint: Optional[Tuple[int, bytes, Optional[int]]] = None
+        # First journaled event id each checkpoint written by this store needs
+        self._first_event_ids: Dict[int, int] = {}
+        self._write_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        os.makedirs(directory, exist_ok=True)
+        sequences = [sequence for sequence, _ in self._checkpoint_files()]
+        self._next_sequence = max(sequences, default=0) + 1
+
+    # === Writing ===
+
+    def journal(self, event_id: int, turn: int, event: Any):
+        """Buffer an event for the journal."""
+        data = event.model_dump(mode="json") if hasattr(event, "model_dump") else event
+        self._lines.append(json.dumps({"id": event_id, "turn": turn, "event": data}) + "\n")
+
+    def checkpoint(self, data: bytes, first_event_id: Optional[int] = None):
+        """
+        Buffer a checkpoint; only the newest buffered checkpoint is written.
+
+        Args:
+            data: The checkpoint data
+            first_event_id: Oldest journaled event the checkpoint reads back on resume
+                (None keeps the whole journal)
+        """
+        self._pending_checkpoint = (self._next_sequence, data, first_event_id)
+        self._next_sequence += 1
+
+    def start(self):
+        """Start the background flush task (no-op if it is running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self):
+        """Write everything buffered so far (journal first, then the checkpoint)."""
+        if not self._lines and self._pending_checkpoint is None:
+            return
+        lines, self._lines = self._lines, []
+        pending, self._pending_checkpoint = self._pending_checkpoint, None
+        # Batches are written in the order they were taken
+        async with self._write_lock:
+            try:
+                await asyncio.to_thread(self._write, lines, pending)
+            except OSError as e:
+                logger.error(f"Failed to write checkpoint data to {self.directory}: {e}")
+
+    async def close(self):
+        """Stop the background task and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass  # Expected
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _write(self, lines: List[str], pending: Optional[Tuple[int, bytes, Optional[int]]]):
+        """Append journal lines and write a checkpoint, fsyncing both (runs in a worker thread)."""
+        if lines:
+            with open(self.journal_path, "a", encoding="utf-8") as journal_file:
+                journal_file.write("".join(lines))
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+        if pending is not None:
+            sequence, data, first_event_id = pending
+            path = os.path.join(self.directory, f"checkpoint-{sequence:08d}.ckpt")
+            temporary_path = path + ".tmp"
+            with open(temporary_path, "wb") as checkpoint_file:
+                checkpoint_file.write(CHECKPOINT_MAGIC + zlib.crc32(data).to_bytes(4, "big") + data)
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(temporary_path, path)
+            self._fsync_directory()
+
+            if first_event_id is not None:
+                self._first_event_ids[sequence] = first_event_id
+            for old_sequence, old_path in self._checkpoint_files()[self.keep:]:
+                os.remove(old_path)
+                self._first_event_ids.pop(old_sequence, None)
+
+            # Checkpoints of an earlier process may need any part of the journal
+            kept = [kept_sequence for kept_sequence, _ in self._checkpoint_files()]
+            if all(kept_sequence in self._first_event_ids for kept_sequence in kept):
+                self._trim_journal(min(self._first_event_ids[kept_sequence] for kept_sequence in kept))
+
+    def _trim_journal(self, first_id: int):
+        """Drop journal entries older than first_id (and torn lines), replacing the file atomically."""
+        if not os.path.exists(self.journal_path):
+            return
+        kept_lines = []
+        dropped = 0
+        with open(self.journal_path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    keep = json.loads(line)["id"] >= first_id and line.endswith("\n")
+                except (ValueError, KeyError, TypeError):
+                    keep = False
+                if keep:
+                    kept_lines.append(line)
+                else:
+                    dropped += 1
+        if not dropped:
+            return
+
+        temporary_path = self.journal_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as journal_file:
+            journal_file.write("".join(kept_lines))
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temporary_path, self.journal_path)
+        self._fsync_directory()
+
+    def _fsync_directory(self):
+        """Make the rename durable (not supported on every platform)."""
+        try:
+            directory_fd = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(directory_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(directory_fd)
+
+    # === Reading ===
+
+    def checkpoints(self) -> Iterator[bytes]:
+        """Yield the data of the valid checkpoints on disk, newest first."""
+        for _, path in self._checkpoint_files():
+            try:
+                with open(path, "rb") as checkpoint_file:
+                    content = checkpoint_file.read()
+            except OSError as e:
+                logger.warning(f"Failed to read checkpoint {path}: {e}")
+                continue
+            data = content[8:]
+            if content[:4] != CHECKPOINT_MAGIC or zlib.crc32(data).to_bytes(4, "big") != content[4:8]:
+                logger.warning(f"Skipping corrupt checkpoint {path}")
+                continue
+            yield data
+
+    def read_journal(self, first_id: int, last_id: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Return (id, event data) pairs for first_id <= id <= last_id, oldest first.
+
+        Ids written again after a resume replace the earlier entries, and a
+        torn last line (crash during a write) is ignored.
+        """
+        events: Dict[int, Dict[str, Any]] = {}
+        if not os.path.exists(self.journal_path):
+            return []
+        with open(self.journal_path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if first_id <= entry["id"] <= last_id:
+                    events[entry["id"]] = entry["event"]
+        return sorted(events.items())
+
+    def _checkpoint_files(self) -> List[Tuple[int, str]]:
+        """(sequence, path) of the checkpoint files, newest first."""
+        files = []
+        for name in os.listdir(self.directory):
+            match = CHECKPOINT_PATTERN.match(name)
+            if match:
+                files.append((int(match.group(1)), os.path.join(self.directory, name)))
+        return sorted(files, reverse=True)
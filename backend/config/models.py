@@ -12,24 +12,64 @@ from typing import Dict, List, Optional, Any, Union
 import os
 
 
+class MockEngineConfig(BaseModel):
+    """Settings for the local mock engine (no API key or network needed)."""
+    mode: str = Field(default="random", description="'random' (seeded), 'scripted' or 'replay'")
+    seed: int = Field(default=0, description="Seed for random choices and simulated latency")
+    script: List[str] = Field(default_factory=list, description="Commands submitted in order by 'scripted' mode (repeating)")
+    trace_path: Optional[str] = Field(default=None, description="Trace replayed by 'replay' mode (commands or JSON Lines)")
+    latency_mean: float = Field(default=0.0, ge=0.0, description="Mean simulated response time in seconds")
+    latency_stddev: float = Field(default=0.0, ge=0.0, description="Standard deviation of the simulated response time")
+    latency_distribution: str = Field(default="fixed", description="'fixed', 'uniform', 'normal' or 'lognormal'")
+
+
 class EngineConfig(BaseModel):
     """Configuration for an LLM engine (OpenAI, Anthropic, etc.)."""
-    api_key_env: str = Field(..., description="Environment variable name for API key")
+    provider: str = Field(default="openai", description="'openai' or 'mock' (local engine for offline runs)")
+    api_key_env: Optional[str] = Field(default=None, description="Environment variable name for API key")
     model: str = Field(..., description="Model identifier")
     temperature: float = Field(default=0.7, ge=0.0, le=2.0, description="Sampling temperature")
     max_tokens: Optional[int] = Field(default=None, ge=1, description="Maximum tokens to generate")
     timeout: int = Field(default=30, ge=1, description="Request timeout in seconds")
     retry_attempts: int = Field(default=3, ge=0, description="Number of retry attempts")
+    mock: MockEngineConfig = Field(default_factory=MockEngineConfig, description="Mock engine settings (provider 'mock')")
+    
+    @property
+    def requires_api_key(self) -> bool:
+        """Whether this engine calls a remote API."""
+        return self.provider != "mock"
     
     def get_api_key(self) -> Optional[str]:
         """Get the API key from environment variable."""
-        return os.getenv(self.api_key_env)
+        return os.getenv(self.api_key_env) if self.api_key_env else None
+
+
+class HttpPoolConfig(BaseModel):
+    """Connection pool shared by all LLM clients in the process."""
+    max_connections: int = Field(default=20, ge=1, description="Maximum concurrent connections (caps in-flight LLM requests)")
+    max_keepalive_connections: int = Field(default=10, ge=0, description="Idle connections kept open for reuse")
+    keepalive_expiry: float = Field(default=30.0, ge=0.0, description="Seconds an idle connection is kept open")
+    request_timeout: float = Field(default=60.0, ge=1.0, description="Default request timeout in seconds")
+    pool_timeout: Optional[float] = Field(default=None, description="Seconds to wait for a free connection (None waits forever)")
+
+
+class SchedulerConfig(BaseModel):
+    """Limits for the global LLM request scheduler."""
+    max_concurrent: int = Field(default=8, ge=1, description="Maximum LLM requests in flight")
+    requests_per_minute: Optional[int] = Field(default=500, ge=1, description="Request budget per minute (None for no limit)")
+    tokens_per_minute: Optional[int] = Field(default=200000, ge=1, description="Token budget per minute (None for no limit)")
+    default_retry_attempts: int = Field(default=3, ge=0, description="Retries when the engine does not specify retry_attempts")
+    backoff_base: float = Field(default=1.0, gt=0.0, description="First retry delay in seconds (doubles per attempt)")
+    backoff_max: float = Field(default=30.0, gt=0.0, description="Maximum retry delay in seconds")
 
 
 class LLMConfig(BaseModel):
     """Top-level LLM configuration containing multiple engines."""
     engines: Dict[str, EngineConfig] = Field(..., description="Available engines")
     default_engine: str = Field(..., description="Default engine to use")
+    engine_override: Optional[str] = Field(default=None, description="Engine used by every agent, overriding agents.yaml (e.g. 'mock')")
+    http_pool: HttpPoolConfig = Field(default_factory=HttpPoolConfig, description="Shared HTTP connection pool")
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig, description="Global LLM request scheduler")
     
     def get_engine(self, engine_name: Optional[str] = None) -> EngineConfig:
         """Get engine config, falling back to default if not specified."""
@@ -132,9 +172,47 @@ class PromptsConfig(BaseModel):
         return composition.separator.join(template_parts)
 
 
+class MemoryConfig(BaseModel):
+    """Conversation memory settings for LLM agents."""
+    enabled: bool = Field(default=True, description="Bound the prompt to the token budget (False keeps the full history)")
+    context_token_budget: int = Field(default=4000, ge=256, description="Approximate prompt token budget per request")
+    summary_max_tokens: int = Field(default=400, ge=0, description="Approximate size limit of the rolling summary")
+    summarizer: str = Field(default="extractive", description="'extractive' (no LLM calls) or 'llm'")
+    pin_world_state: bool = Field(default=True, description="Always include the latest full world state observation")
+    compress_observations: bool = Field(default=True, description="Group templated actions and drop sections unchanged since the last observation")
+
+
+class CheckpointConfig(BaseModel):
+    """Crash-safe checkpointing of running simulations."""
+    enabled: bool = Field(default=False, description="Journal events and write checkpoints while the game runs")
+    directory: str = Field(default="data/checkpoints", description="Directory for checkpoint files and the event journal")
+    every_turns: int = Field(default=5, ge=1, description="Turns between checkpoints")
+    keep: int = Field(default=3, ge=1, description="Checkpoint files kept on disk")
+    flush_interval: float = Field(default=1.0, gt=0, description="Seconds between background writes")
+
+
+class TracingConfig(BaseModel):
+    """Per-phase latency tracing of agent turns."""
+    enabled: bool = Field(default=True, description="Time the phases of agent turns for /metrics")
+    export_path: Optional[str] = Field(default=None, description="Optional JSON Lines file that receives every finished span")
+    window: int = Field(default=1000, ge=1, description="Latest durations kept per phase for the percentiles")
+
+
+class PacingConfig(BaseModel):
+    """Pacing of the game loop between turns."""
+    mode: str = Field(default="fixed", description="'fast' (no waiting), 'fixed' (at least tick_seconds per turn) or 'realtime' (one turn per tick_seconds, with catch-up)")
+    tick_seconds: float = Field(default=1.0, ge=0, description="Seconds per turn (the frontend's animation budget)")
+    max_catch_up_ticks: int = Field(default=5, ge=0, description="Ticks 'realtime' may fall behind before the backlog is dropped")
+    idle_seconds: float = Field(default=1.0, gt=0, description="Wait after an iteration in which no agent acted (every mode)")
+
+
 class DefaultsConfig(BaseModel):
     """Default values and fallbacks for the configuration system."""
     llm_defaults: Dict[str, Any] = Field(default_factory=dict, description="Default LLM settings")
     agent_defaults: Dict[str, Any] = Field(default_factory=dict, description="Default agent settings")
+    memory_defaults: Dict[str, Any] = Field(default_factory=dict, description="Default conversation memory settings")
+    checkpoint_defaults: Dict[str, Any] = Field(default_factory=dict, description="Default checkpoint settings")
+    tracing_defaults: Dict[str, Any] = Field(default_factory=dict, description="Default tracing settings")
+    pacing_defaults: Dict[str, Any] = Field(default_factory=dict, description="Default game loop pacing settings")
     prompt_defaults: Dict[str, Any] = Field(default_factory=dict, description="Default prompt settings")
     system_defaults: Dict[str, Any] = Field(default_factory=dict, description="System-wide defaults")
\ No newline at end of file
@@ -191,12 +191,24 @@ class GameEvent(BaseModel):
 
 class GameEventList(BaseModel):
     events: List[GameEvent]
+    has_more: bool = False
+    last_event_id: Optional[int] = None
 
 class WorldStateResponse(BaseModel):
     agents: Dict[str, Any]
     objects: List[Any]
     locations: Dict[str, Any]
     game_status: Dict[str, Any]
+    version: Optional[int] = None
+
+class WorldStatePatch(BaseModel):
+    since_version: int
+    version: int
+    agents: Dict[str, Any]
+    objects: List[Any]
+    removed_objects: List[str]
+    locations: Dict[str, Any]
+    game_status: Dict[str, Any]
 
 class GameStatus(BaseModel):
     status: str
@@ -206,6 +218,34 @@ class GameStatus(BaseModel):
     locations: int
     characters: int
 
+class LLMSchedulerMetrics(BaseModel):
+    submitted: int
+    completed: int
+    failed: int
+    retries: int
+    rate_limited: int
+    tokens_used: int
+    queued: int
+    active: int
+    queue_wait_avg: float
+    queue_wait_p95: float
+    queue_wait_max: float
+
+class LatencyStats(BaseModel):
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    count: Optional[int] = None
+
+class TracingMetrics(BaseModel):
+    enabled: bool
+    turns: int
+    turns_per_second: float
+    tokens_per_turn: LatencyStats
+    phases: Dict[str, LatencyStats]  # Durations in milliseconds
+
 # ------------------------------
 # (expand as needed for objects, agents, locations, etc.)
 # ------------------------------
@@ -0,0 +1,211 @@
+"""
+Event Log - Bounded, indexed store for frontend events
+======================================================
+Contains the EventLog class used by the GameLoop to keep agent action events
+for the frontend.
+
+- Every event gets a monotonically increasing integer id (never reused, even
+  across resets), and lookup by id is O(1).
+- Only the newest `capacity` events are kept in memory in a ring buffer.
+  Evicted events can optionally be spilled to a JSON Lines file.
+- Each client keeps its own read cursor, so several frontends or dashboards
+  can consume the same stream without stealing each other's events.
+- "Since timestamp" queries are answered by bisection (events are appended in
+  timestamp order), and serialized forms of events are cached per event.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+import bisect
+import json
+import logging
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+
+class EventLog:
+    """
+    Ring buffer of events with integer ids and per-client cursors.
+    """
+
+    DEFAULT_CLIENT_ID = "default"
+
+    def __init__(self, capacity: int = 10000, spill_path: Optional[str] = None, max_clients: int = 256):
+        """
+        Args:
+            capacity: Maximum number of events kept in memory
+            spill_path: Optional JSON Lines file that receives evicted events
+            max_clients: Maximum number of client cursors tracked (least recently used are dropped)
+        """
+        if capacity < 1:
+            raise ValueError("Event log capacity must be at least 1")
+
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.max_clients = max_clients
+
+        self._slots: List[Any] = [None] * capacity
+        self._serialized: List[Optional[str]] = [None] * capacity
+        self._first_id = 1  # Oldest id still in memory
+        self._next_id = 1   # Id the next appended event will get
+
+        self._cursors: "OrderedDict[str, int]" = OrderedDict()
+        self._spill_file: Optional[TextIO] = None
+
+    # === Writing ===
+
+    def append(self, event: Any) -> int:
+        """Add an event and return its id."""
+        event_id = self._next_id
+        slot = (event_id - 1) % self.capacity
+
+        # Evict the oldest event when the ring is full
+        if event_id - self._first_id >= self.capacity:
+            self._spill(self._first_id, self._slots[slot])
+            self._first_id += 1
+
+        self._slots[slot] = event
+        self._serialized[slot] = None
+        self._next_id += 1
+        return event_id
+
+    def clear(self):
+        """Drop all in-memory events. Ids keep increasing so existing cursors stay valid."""
+        self._slots = [None] * self.capacity
+        self._serialized = [None] * self.capacity
+        self._first_id = self._next_id
+
+    def load(self, events: List[Any], next_id: int):
+        """
+        Replace the in-memory events, e.g. with events read back from a checkpoint journal.
+
+        Args:
+            events: The events preceding next_id, oldest first (only the newest `capacity` are kept)
+            next_id: Id the next appended event will get
+        """
+        self.clear()
+        events = events[-self.capacity:]
+        self._first_id = self._next_id = next_id - len(events)
+        for event in events:
+            self.append(event)
+
+    def close(self):
+        """Close the spill file, if one is open."""
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+
+    # === Reading ===
+
+    @property
+    def first_id(self) -> int:
+        """Id of the oldest event still in memory (equals next id when empty)."""
+        return self._first_id
+
+    @property
+    def latest_id(self) -> int:
+        """Id of the newest event, or 0 if no event was ever added."""
+        return self._next_id - 1
+
+    def __len__(self) -> int:
+        return self._next_id - self._first_id
+
+    def __iter__(self) -> Iterator[Any]:
+        for event_id in range(self._first_id, self._next_id):
+            yield self._slots[(event_id - 1) % self.capacity]
+
+    def get(self, event_id: int) -> Optional[Any]:
+        """Return the event with the given id, or None if it is unknown or evicted."""
+        if self._first_id <= event_id < self._next_id:
+            return self._slots[(event_id - 1) % self.capacity]
+        return None
+
+    def events_after(self, last_event_id: int, limit: Optional[int] = None) -> List[tuple[int, Any]]:
+        """
+        Return (id, event) pairs with ids greater than last_event_id, oldest first.
+
+        Events that were already evicted are skipped silently.
+        """
+        start = max(last_event_id + 1, self._first_id)
+        end = self._next_id if limit is None else min(self._next_id, start + limit)
+        return [(event_id, self._slots[(event_id - 1) % self.capacity]) for event_id in range(start, end)]
+
+    def events_since_timestamp(self, timestamp: str, limit: Optional[int] = None) -> List[tuple[int, Any]]:
+        """
+        Return (id, event) pairs whose timestamp is greater than the given ISO timestamp.
+
+        Events are appended in timestamp order, so the first match is found by
+        bisection instead of comparing every event.
+        """
+        ids = range(self._first_id, self._next_id)
+        index = bisect.bisect_right(ids, timestamp, key=lambda event_id: self._timestamp_of(event_id))
+        if index == len(ids):
+            return []
+        return self.events_after(ids[index] - 1, limit)
+
+    def serialized(self, event_id: int, serializer: Callable[[int, Any], str]) -> str:
+        """
+        Return the serialized form of an event, computing it once per event.
+
+        Args:
+            event_id: Id of an event still in memory
+            serializer: Called with (event_id, event) the first time the event is serialized
+        """
+        if not self._first_id <= event_id < self._next_id:
+            raise KeyError(f"Event {event_id} is not in the event log")
+
+        slot = (event_id - 1) % self.capacity
+        cached = self._serialized[slot]
+        if cached is None:
+            cached = serializer(event_id, self._slots[slot])
+            self._serialized[slot] = cached
+        return cached
+
+    # === Per-client cursors ===
+
+    def read_unserved(self, client_id: Optional[str] = None, limit: Optional[int] = None) -> List[Any]:
+        """
+        Return events this client has not received yet and advance its cursor.
+
+        New clients start from the oldest event still in memory.
+        """
+        client_id = client_id or self.DEFAULT_CLIENT_ID
+        cursor = self._cursors.pop(client_id, 0)
+
+        events = self.events_after(cursor, limit)
+        if events:
+            cursor = events[-1][0]
+
+        # Re-insert as most recently used and drop the stalest clients
+        self._cursors[client_id] = cursor
+        while len(self._cursors) > self.max_clients:
+            self._cursors.popitem(last=False)
+
+        return [event for _, event in events]
+
+    def get_cursor(self, client_id: Optional[str] = None) -> int:
+        """Return the id of the last event served to this client (0 if none)."""
+        return self._cursors.get(client_id or self.DEFAULT_CLIENT_ID, 0)
+
+    # === Internals ===
+
+    def _timestamp_of(self, event_id: int) -> str:
+        """Timestamp of an in-memory event ("" if it has none)."""
+        return getattr(self._slots[(event_id - 1) % self.capacity], "timestamp", None) or ""
+
+    def _spill(self, event_id: int, event: Any):
+        """Append an evicted event to the spill file."""
+        if not self.spill_path:
+            return
+
+        try:
+            if self._spill_file is None:
+                self._spill_file = open(self.spill_path, "a", encoding="utf-8", buffering=1)
+            if hasattr(event, "model_dump"):
+                data: Dict[str, Any] = event.model_dump(mode="json")
+            else:
+                data = event
+            self._spill_file.write(json.dumps({"id": event_id, "event": data}) + "\n")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to spill event {event_id} to {self.spill_path}: {e}")
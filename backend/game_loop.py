@@ -13,12 +13,13 @@ This implements:
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 import logging
 
 # Text adventure games imports
 from .text_adventure_games.games import Game
+from .text_adventure_games.things import Character, Location
 
 # Agent management
 from .agent import AgentManager
@@ -26,10 +27,16 @@ from .agent.agent_strategies import KaniAgent, ManualAgent
 
 # --- Canonical world setup from canonical_demo.py ---
 from .text_adventure_games.world import build_house_game
+from .text_adventure_games.state.snapshot import dump_game, load_game
 
-from .config.schema import AgentActionOutput
+from .config.schema import AgentActionOutput, GameEvent
+from .event_log import EventLog
+from .checkpoint import CheckpointStore
+from .config.models import CheckpointConfig, PacingConfig
 from .config.yaml_config import get_config_manager
-from .log_config import log_game_event, log_action_execution
+from .log_config import log_game_event, log_action_execution, LazyMessage
+from .tracing import get_tracer
+from .pacing import Pacer
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -40,7 +47,8 @@ class GameLoop:
     Also enqueues events for the frontend to consume.
     """
     
-    def __init__(self, agent_config: Optional[Dict[str, str]] = None):
+    def __init__(self, agent_config: Optional[Dict[str, str]] = None, turn_mode: Optional[str] = None,
+                 resume: bool = False, pacing_mode: Optional[str] = None):
         self.game: Optional[Game] = None
         self.agent_manager: AgentManager  # Will be initialized in initialize()
         self.is_running = False
@@ -50,23 +58,50 @@ class GameLoop:
         self.agent_config = agent_config or {}
         
         # Event system for frontend (only AgentActionOutput objects)
-        self.event_queue: List[AgentActionOutput] = []
-        self.event_id_counter = 0
+        self.event_log = self._create_event_log()
         
         # Turn management
         self.turn_counter = 0
         self.max_turns_per_session = 1000
         
+        # Turn mode: "sequential" (one agent per tick) or "concurrent" (all agents
+        # deliberate at once and their commands are committed in turn order)
+        self.turn_mode = turn_mode or self._get_configured_turn_mode()
+        
         # Objects registry for frontend
         self.objects_registry: Dict[str, Dict] = {}
+        self._objects_registry_version = 0
+        
+        # Wake-up signals for push (SSE) connections waiting on new events
+        self._event_listeners: Set[asyncio.Event] = set()
+        
+        # Snapshot of the freshly built world; resets restore it instead of rebuilding
+        self._initial_snapshot: Optional[bytes] = None
+        
+        # Crash-safe checkpoints and event journal (also opened just to resume)
+        self.checkpoint_config = self._load_checkpoint_config()
+        self.checkpoints: Optional[CheckpointStore] = None
+        if self.checkpoint_config.enabled or resume:
+            self.checkpoints = CheckpointStore(self.checkpoint_config.directory, keep=self.checkpoint_config.keep,
+                                               flush_interval=self.checkpoint_config.flush_interval)
+        self._resume_pending = resume
+        self._checkpoint_turn = 0
         
-        # Track served events for polling endpoint
-        self.last_served_event_index = 0
+        # Wait between turns ("fast", "fixed" or "realtime"; see pacing.py)
+        self.pacer = Pacer(self._load_pacing_config(pacing_mode))
     
     async def start(self):
         """Initialize and start the game loop in the background."""
         if not self.is_running:
-            await self.initialize()
+            resumed = False
+            if self._resume_pending:
+                self._resume_pending = False
+                resumed = await self._resume_from_checkpoint()
+            if not resumed:
+                await self.initialize()
+            if self.checkpoint_config.enabled and self.checkpoints:
+                self._write_checkpoint()
+                self.checkpoints.start()
             self.is_running = True
             self.task = asyncio.create_task(self.run_game_loop())
             logger.info("Game loop started in the background")
@@ -81,9 +116,14 @@ class GameLoop:
             except asyncio.CancelledError:
                 pass  # Expected
             logger.info("Game loop stopped")
+            
+            if self.checkpoint_config.enabled and self.checkpoints:
+                self._write_checkpoint()
+                await self.checkpoints.flush()
 
     async def run_game_loop(self):
         """The main game loop where agents take turns."""
+        self.pacer.start()
         while self.is_running:
             if self.turn_counter >= self.max_turns_per_session:
                 logger.warning("Max turns reached, stopping game.")
@@ -93,49 +133,206 @@ class GameLoop:
                 logger.error("Agent manager not initialized, stopping game.")
                 break
 
-            agent = self.agent_manager.get_next_agent()
-            if agent:
-                # Execute turn and get schema and turn-ending status
-                action_schema, action_ended_turn = await self.agent_manager.execute_agent_turn(agent)
-                
-                # Only process if an action was actually taken
-                if action_schema:
-                    # Log the turn
-                    turn_status = "ended turn" if action_ended_turn else "continued turn"
-                    log_game_event("turn_end", {
-                        "agent": agent.name,
-                        "turn": self.turn_counter,
-                        "action": getattr(action_schema.action, 'action_type', 'unknown'),
-                        "status": turn_status
-                    })
-                    
-                    # Add the action schema directly as an event
-                    self._add_action_event(action_schema)
-                
-                # Only advance to the next agent if the action ended the turn
-                if action_ended_turn:
-                    self.agent_manager.advance_turn()
-                    self.turn_counter += 1
+            turn = self.turn_counter
+            if self.turn_mode == "concurrent":
+                acted = await self._run_concurrent_round()
+            else:
+                acted = await self._run_sequential_turn()
+            
+            if (self.checkpoint_config.enabled and self.checkpoints
+                    and self.turn_counter - self._checkpoint_turn >= self.checkpoint_config.every_turns):
+                self._write_checkpoint()
 
-            # Small delay to prevent a tight loop
-            await asyncio.sleep(1)  # Adjust as needed
+            # Wait for the rest of the tick (actions that did not end a turn are not paced;
+            # an iteration without any action backs off instead of spinning)
+            with get_tracer().span("loop_delay", mode=self.pacer.mode):
+                await self.pacer.wait(turn_ended=self.turn_counter != turn, idle=not acted)
     
-    async def initialize(self):
-        """Initialize the game world and agents."""
-        # Build the house environment
-        self.game = self._build_house_environment()
+    async def _run_sequential_turn(self) -> bool:
+        """Let the next agent in turn order act; returns whether it did anything."""
+        agent = self.agent_manager.get_next_agent()
+        if not agent:
+            return False
+        
+        # Execute turn and get schema and turn-ending status
+        action_schema, action_ended_turn = await self.agent_manager.execute_agent_turn(agent)
+        
+        # Only process if an action was actually taken
+        if action_schema:
+            self._record_turn(agent.name, action_schema, action_ended_turn)
+        
+        # Only advance to the next agent if the action ended the turn
+        if action_ended_turn:
+            self.agent_manager.advance_turn()
+            self.turn_counter += 1
+        return bool(action_schema) or action_ended_turn
+    
+    async def _run_concurrent_round(self) -> bool:
+        """Let every agent act once, deliberating concurrently and committing in turn order; returns whether any did."""
+        results = await self.agent_manager.execute_concurrent_round()
+        
+        acted = False
+        for agent, action_schema, action_ended_turn in results:
+            if action_schema:
+                self._record_turn(agent.name, action_schema, action_ended_turn)
+            if action_ended_turn:
+                self.turn_counter += 1
+            acted = acted or bool(action_schema) or action_ended_turn
+        return acted
+    
+    def _record_turn(self, agent_name: str, action_schema: AgentActionOutput, action_ended_turn: bool):
+        """Log a completed action and enqueue it for the frontend."""
+        turn_status = "ended turn" if action_ended_turn else "continued turn"
+        log_game_event("turn_end", {
+            "agent": agent_name,
+            "turn": self.turn_counter,
+            "action": getattr(action_schema.action, 'action_type', 'unknown'),
+            "status": turn_status
+        })
+        
+        # Add the action schema directly as an event
+        self._add_action_event(action_schema)
+    
+    def _get_configured_turn_mode(self) -> str:
+        """Read the turn mode from the system defaults (falls back to sequential)."""
+        try:
+            turn_mode = get_config_manager().defaults_config.system_defaults.get("turn_mode", "sequential")
+        except Exception as e:
+            logger.warning(f"Failed to read turn mode from configuration: {e}. Using sequential turns.")
+            return "sequential"
+        
+        if turn_mode not in ("sequential", "concurrent"):
+            logger.warning(f"Unknown turn mode '{turn_mode}'. Using sequential turns.")
+            return "sequential"
+        return turn_mode
+    
+    async def initialize(self, snapshot: Optional[bytes] = None):
+        """
+        Initialize the game world and agents.
+        
+        Args:
+            snapshot: Snapshot (see snapshot()) to restore instead of the initial world
+        """
+        extra: Dict[str, Any] = {}
+        if snapshot is not None:
+            self.game, extra = load_game(snapshot)
+        elif self._initial_snapshot is not None:
+            self.game, extra = load_game(self._initial_snapshot)
+        else:
+            # Build the house environment
+            self.game = self._build_house_environment()
+            self._initial_snapshot = dump_game(self.game)
         
         # Initialize agent manager
         self.agent_manager = AgentManager(self.game)
         
         # Create and register AI agents
         await self._setup_agents()
+        self._restore_runtime_state(extra)
         
         # Initialize objects registry
         self._initialize_objects_registry()
         
         logger.info("Game controller initialized successfully")
     
+    def snapshot(self) -> bytes:
+        """
+        Snapshot the world together with the turn counter, turn position, chat state,
+        agent conversations and the range of event ids in the event log.
+        """
+        if not self.game:
+            raise RuntimeError("Game not initialized")
+        chat_manager = self.agent_manager.chat_manager
+        agents = {name: strategy.get_checkpoint_state()
+                  for name, strategy in self.agent_manager.agent_strategies.items()
+                  if hasattr(strategy, "get_checkpoint_state")}
+        return dump_game(self.game, {
+            "turn_counter": self.turn_counter,
+            "events": {"first_id": self.event_log.first_id, "last_id": self.event_log.latest_id},
+            "agents": agents,
+            "current_agent_index": self.agent_manager.current_agent_index,
+            "previous_action_results": self.agent_manager.previous_action_results,
+            "chat": {
+                "pending_requests": chat_manager.pending_requests,
+                "active_conversations": chat_manager.active_conversations,
+                "request_counter": chat_manager.request_counter,
+            },
+        })
+    
+    async def restore(self, snapshot: bytes):
+        """Replace the game with a snapshot, recreating the agents; the loop keeps running if it was."""
+        was_running = self.is_running
+        await self.stop()
+        await self.initialize(snapshot)
+        if was_running:
+            self.is_running = True
+            self.task = asyncio.create_task(self.run_game_loop())
+    
+    def _restore_runtime_state(self, extra: Dict[str, Any]):
+        """Apply the loop and agent manager state stored with a snapshot."""
+        if "turn_counter" in extra:
+            self.turn_counter = extra["turn_counter"]
+        if "current_agent_index" in extra:
+            self.agent_manager.current_agent_index = extra["current_agent_index"]
+        self.agent_manager.previous_action_results.update(extra.get("previous_action_results", {}))
+        chat_state = extra.get("chat")
+        if chat_state:
+            chat_manager = self.agent_manager.chat_manager
+            chat_manager.pending_requests = chat_state["pending_requests"]
+            chat_manager.active_conversations = chat_state["active_conversations"]
+            chat_manager.request_counter = chat_state["request_counter"]
+        for name, agent_state in extra.get("agents", {}).items():
+            strategy = self.agent_manager.agent_strategies.get(name)
+            if hasattr(strategy, "load_checkpoint_state"):
+                strategy.load_checkpoint_state(agent_state)
+        
+        # Events come back from the checkpoint journal
+        events = extra.get("events")
+        if events and self.checkpoints:
+            entries = self.checkpoints.read_journal(events["first_id"], events["last_id"])
+            self.event_log.load([AgentActionOutput.model_validate(event) for _, event in entries],
+                                next_id=events["last_id"] + 1)
+    
+    async def _resume_from_checkpoint(self) -> bool:
+        """Initialize from the newest valid checkpoint; returns False if there is none."""
+        if not self.checkpoints:
+            return False
+        for data in self.checkpoints.checkpoints():
+            try:
+                await self.initialize(data)
+            except Exception as e:
+                logger.warning(f"Failed to resume from a checkpoint: {e}. Trying an older one.")
+                continue
+            self._checkpoint_turn = self.turn_counter
+            logger.info(f"Resumed from checkpoint at turn {self.turn_counter}")
+            return True
+        logger.warning(f"No checkpoint found in {self.checkpoints.directory}; starting a new game")
+        return False
+    
+    def _write_checkpoint(self):
+        """Queue a checkpoint of the current state (written by the checkpoint store in the background)."""
+        self.checkpoints.checkpoint(self.snapshot(), first_event_id=self.event_log.first_id)
+        self._checkpoint_turn = self.turn_counter
+    
+    def _load_checkpoint_config(self) -> CheckpointConfig:
+        """Load the checkpoint settings from the defaults."""
+        try:
+            return CheckpointConfig(**get_config_manager().defaults_config.checkpoint_defaults)
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoint settings from configuration: {e}. Checkpointing disabled.")
+            return CheckpointConfig()
+    
+    def _load_pacing_config(self, mode: Optional[str] = None) -> PacingConfig:
+        """Load the pacing settings from the defaults (mode overrides the configured mode)."""
+        try:
+            pacing_config = PacingConfig(**get_config_manager().defaults_config.pacing_defaults)
+        except Exception as e:
+            logger.warning(f"Failed to load pacing settings from configuration: {e}. Using defaults.")
+            pacing_config = PacingConfig()
+        if mode:
+            pacing_config = pacing_config.model_copy(update={"mode": mode})
+        return pacing_config
+    
     def _build_house_environment(self) -> Game:
         """
         Create a house environment matching the canonical canonical_demo.py world.
@@ -252,13 +449,46 @@ class GameLoop:
             
         for location_name, location in self.game.locations.items():
             for item_name, item in location.items.items():
-                self.objects_registry[item_name] = {
-                    "name": item_name,
-                    "description": item.description,
-                    "location": location_name,
-                    "state": "default",  # You can expand this based on item properties
-                    "gettable": item.get_property("gettable") if item.get_property("gettable") is not None else True
-                }
+                self.objects_registry[item_name] = self._get_object_state(item)
+        
+        # Registry entries are refreshed from the revision journal from here on
+        self._objects_registry_version = self.game.revision_tracker.version
+    
+    def _get_object_state(self, item) -> Dict:
+        """Build the frontend entry for an item or object."""
+        holder = item.location or getattr(item, 'owner', None)
+        return {
+            "name": item.name,
+            "description": item.description,
+            "location": holder.name if holder else None,
+            "state": "default",  # You can expand this based on item properties
+            "gettable": item.get_property("gettable") if item.get_property("gettable") is not None else True
+        }
+    
+    def _sync_objects_registry(self) -> tuple[List[Dict], List[str]]:
+        """
+        Bring objects registry entries up to date with changes since the last sync.
+        
+        Returns:
+            Tuple of (updated object entries, names of objects no longer in the world)
+        """
+        updated, removed = [], []
+        if not self.game:
+            return updated, removed
+        
+        tracker = self.game.revision_tracker
+        for thing in tracker.changed_since(self._objects_registry_version):
+            if isinstance(thing, (Character, Location)):
+                continue
+            if thing.location is None and getattr(thing, 'owner', None) is None:
+                # Consumed or otherwise taken out of the world
+                if self.objects_registry.pop(thing.name, None) is not None:
+                    removed.append(thing.name)
+            else:
+                self.objects_registry[thing.name] = self._get_object_state(thing)
+                updated.append(self.objects_registry[thing.name])
+        self._objects_registry_version = tracker.version
+        return updated, removed
     
     def get_world_state(self) -> Dict[str, Any]:
         """
@@ -271,6 +501,48 @@ class GameLoop:
             "agents": self.get_all_agent_states(),
             "objects": self.get_all_objects(),
             "locations": self.get_all_location_states(),
+            "game_status": self.get_game_status(),
+            "version": self.game.revision_tracker.version
+        }
+    
+    def get_world_state_since(self, since_version: int) -> Dict[str, Any]:
+        """
+        Get only the parts of the world that changed after since_version.
+        
+        Returns the full world state instead if since_version predates the
+        current game (e.g. from before a reset), which clients can tell by the
+        missing since_version key.
+        """
+        if not self.game or not self.agent_manager:
+            return {"status": "not_initialized"}
+        
+        tracker = self.game.revision_tracker
+        if since_version < tracker.base_version:
+            return self.get_world_state()
+        
+        # Bring the registry up to date first so it does not re-report these changes
+        self._sync_objects_registry()
+        
+        agents, objects, locations = {}, [], {}
+        removed_objects = []
+        for thing in tracker.changed_since(since_version):
+            if isinstance(thing, Character):
+                if thing.name in self.game.characters:
+                    agents[thing.name] = self.get_agent_state(thing.name)
+            elif isinstance(thing, Location):
+                locations[thing.name] = self._get_location_state(thing)
+            elif thing.name in self.objects_registry:
+                objects.append(self.objects_registry[thing.name])
+            else:
+                removed_objects.append(thing.name)
+        
+        return {
+            "since_version": since_version,
+            "version": tracker.version,
+            "agents": agents,
+            "objects": objects,
+            "removed_objects": removed_objects,
+            "locations": locations,
             "game_status": self.get_game_status()
         }
 
@@ -291,73 +563,67 @@ class GameLoop:
 
         states = {}
         for loc_name, location in self.game.locations.items():
-            states[loc_name] = {
-                "name": loc_name,
-                "description": location.description,
-                "items": list(location.items.keys()),
-                "characters": list(location.characters.keys()),
-                "connections": {d: l.name for d, l in location.connections.items()}
-            }
+            states[loc_name] = self._get_location_state(location)
         return states
     
+    def _get_location_state(self, location: Location) -> Dict:
+        """Build the frontend entry for a location."""
+        return {
+            "name": location.name,
+            "description": location.description,
+            "items": list(location.items.keys()),
+            "characters": list(location.characters.keys()),
+            "connections": {d: l.name for d, l in location.connections.items()}
+        }
+    
     
     
     def _add_action_event(self, action_output: AgentActionOutput):
-        """Add an AgentActionOutput to the event queue."""
-        self.event_id_counter += 1
-        
+        """Add an AgentActionOutput to the event log."""
         # Print the AgentActionOutput in readable format
         self._print_action_output(action_output)
         
-        self.event_queue.append(action_output)
+        event_id = self.event_log.append(action_output)
+        if self.checkpoint_config.enabled and self.checkpoints:
+            self.checkpoints.journal(event_id, self.turn_counter, action_output)
+        
+        # Wake up any push connections waiting for new events
+        for listener in self._event_listeners:
+            listener.set()
     
     def _print_action_output(self, action_output: AgentActionOutput):
         """Print AgentActionOutput in a readable format."""
-        # Check if this is a noop action (non-fatal error)
+        # Noop actions (non-fatal errors) are abnormal behavior: WARNING.
+        # Normal actions are INFO (verbose mode only).
         is_noop = action_output.action.action_type == "noop"
-        
+        level = logging.WARNING if is_noop else logging.INFO
+        if logger.isEnabledFor(level):
+            # The message is built on the logging thread, off the turn's critical path
+            logger.log(level, "%s", LazyMessage(self._format_action_output, action_output, is_noop))
+    
+    def _format_action_output(self, action_output: AgentActionOutput, is_noop: bool) -> str:
+        """Build the log line for an action output."""
+        details = []
+        details.append(f"Agent: {action_output.agent_id}")
+        details.append(f"Location: {action_output.current_room or 'Unknown'}")
         if is_noop:
-            # Log action error as WARNING level (abnormal behavior)
-            error_details = []
-            error_details.append(f"Agent: {action_output.agent_id}")
-            error_details.append(f"Location: {action_output.current_room or 'Unknown'}")
-            error_details.append(f"Error Type: Invalid Action (noop)")
-            
-            # Add action fields for debugging
-            action_fields = self._get_action_fields(action_output.action)
-            if action_fields:
-                for field_name, field_value in action_fields.items():
-                    if field_value is not None:
-                        error_details.append(f"{field_name.title()}: {field_value}")
-            
-            error_details.append(f"Timestamp: {action_output.timestamp}")
-            
-            if action_output.description:
-                error_details.append(f"Error Details: {action_output.description}")
-            
-            # Log as warning since this is abnormal behavior
-            logger.warning("ACTION ERROR - " + " | ".join(error_details))
+            details.append(f"Error Type: Invalid Action (noop)")
         else:
-            # Normal action output - log as INFO (verbose mode only)
-            success_details = []
-            success_details.append(f"Agent: {action_output.agent_id}")
-            success_details.append(f"Location: {action_output.current_room or 'Unknown'}")
-            success_details.append(f"Action: {action_output.action.action_type}")
-            
-            # Add action fields dynamically (excluding action_type which we already showed)
-            action_fields = self._get_action_fields(action_output.action)
-            if action_fields:
-                for field_name, field_value in action_fields.items():
-                    if field_value is not None:  # Only show fields with values
-                        success_details.append(f"{field_name.title()}: {field_value}")
-            
-            success_details.append(f"Timestamp: {action_output.timestamp}")
-            
-            if action_output.description:
-                success_details.append(f"Result: {action_output.description}")
-            
-            # Log as info (only shown in verbose mode)
-            logger.info("ACTION EXECUTED - " + " | ".join(success_details))
+            details.append(f"Action: {action_output.action.action_type}")
+        
+        # Add action fields dynamically (excluding action_type which we already showed)
+        action_fields = self._get_action_fields(action_output.action)
+        if action_fields:
+            for field_name, field_value in action_fields.items():
+                if field_value is not None:  # Only show fields with values
+                    details.append(f"{field_name.title()}: {field_value}")
+        
+        details.append(f"Timestamp: {action_output.timestamp}")
+        
+        if action_output.description:
+            details.append(f"{'Error Details' if is_noop else 'Result'}: {action_output.description}")
+        
+        return ("ACTION ERROR - " if is_noop else "ACTION EXECUTED - ") + " | ".join(details)
     
     def _get_action_fields(self, action) -> dict:
         """Extract all fields from an action object, excluding action_type."""
@@ -392,14 +658,95 @@ class GameLoop:
         """Get events since the specified timestamp."""
         if not last_timestamp:
             return self.event_queue
-        return [event for event in self.event_queue if event.timestamp and event.timestamp > last_timestamp]
+        return [event for _, event in self.event_log.events_since_timestamp(last_timestamp)]
+    
+    def get_serialized_game_events(self, since_timestamp: str = "", after_id: Optional[int] = None,
+                                   limit: Optional[int] = None) -> tuple[List[str], bool, Optional[int]]:
+        """
+        Get events as serialized GameEvent JSON, newest last.
+        
+        Args:
+            since_timestamp: Only return events newer than this ISO timestamp
+            after_id: Only return events with a greater id (takes precedence over since_timestamp)
+            limit: Maximum number of events to return
+            
+        Returns:
+            Tuple of (GameEvent JSON strings, whether more events are available, id of the last returned event)
+        """
+        # Fetch one extra event to know whether there is another page
+        fetch_limit = limit + 1 if limit is not None else None
+        if after_id is not None:
+            events = self.event_log.events_after(after_id, fetch_limit)
+        elif since_timestamp:
+            events = self.event_log.events_since_timestamp(since_timestamp, fetch_limit)
+        else:
+            events = self.event_log.events_after(0, fetch_limit)
+        
+        has_more = limit is not None and len(events) > limit
+        if has_more:
+            events = events[:limit]
+        
+        serialized = [self.event_log.serialized(event_id, self._serialize_game_event) for event_id, _ in events]
+        last_event_id = events[-1][0] if events else None
+        return serialized, has_more, last_event_id
+    
+    @staticmethod
+    def _serialize_game_event(event_id: int, event: AgentActionOutput) -> str:
+        """Convert an AgentActionOutput to GameEvent JSON."""
+        return GameEvent(
+            id=event_id,
+            type="agent_action",
+            timestamp=event.timestamp or "",
+            data=event.model_dump()
+        ).model_dump_json()
     
-    def get_unserved_events(self) -> List[AgentActionOutput]:
-        """Get events that haven't been served to the polling endpoint yet."""
-        unserved_events = self.event_queue[self.last_served_event_index:]
-        # Update the index to mark these as served
-        self.last_served_event_index = len(self.event_queue)
-        return unserved_events
+    def get_events_after_id(self, last_event_id: int, limit: Optional[int] = None) -> List[tuple[int, AgentActionOutput]]:
+        """
+        Get events with an id greater than last_event_id, oldest first.
+        
+        Event ids increase monotonically (also across resets); events already
+        evicted from the event log are skipped.
+        """
+        return self.event_log.events_after(last_event_id, limit)
+    
+    def subscribe_events(self) -> asyncio.Event:
+        """Register a push connection; the returned event is set whenever a new event is added."""
+        listener = asyncio.Event()
+        self._event_listeners.add(listener)
+        return listener
+    
+    def unsubscribe_events(self, listener: asyncio.Event):
+        """Remove a push connection registered with subscribe_events."""
+        self._event_listeners.discard(listener)
+    
+    def get_unserved_events(self, client_id: Optional[str] = None) -> List[AgentActionOutput]:
+        """
+        Get events that haven't been served to this polling client yet.
+        Each client id keeps its own cursor; clients without an id share the default one.
+        """
+        return self.event_log.read_unserved(client_id)
+    
+    @property
+    def event_queue(self) -> List[AgentActionOutput]:
+        """Events currently held in memory, oldest first."""
+        return list(self.event_log)
+    
+    @property
+    def event_id_counter(self) -> int:
+        """Id of the newest event."""
+        return self.event_log.latest_id
+    
+    def _create_event_log(self) -> EventLog:
+        """Create the event log using the sizes from the system defaults."""
+        capacity = 10000
+        spill_path = None
+        try:
+            system_defaults = get_config_manager().defaults_config.system_defaults
+            capacity = int(system_defaults.get("event_log_capacity", capacity))
+            spill_path = system_defaults.get("event_log_spill_path")
+        except Exception as e:
+            logger.warning(f"Failed to read event log settings from configuration: {e}. Using defaults.")
+        return EventLog(capacity=capacity, spill_path=spill_path)
     
     
     
@@ -421,6 +768,7 @@ class GameLoop:
     
     def get_all_objects(self) -> List[Dict]:
         """Get all objects and their states."""
+        self._sync_objects_registry()
         return list(self.objects_registry.values())
     
     
@@ -428,10 +776,13 @@ class GameLoop:
     async def reset(self):
         """Reset the entire game."""
         await self.stop()
-        self.event_queue.clear()
-        self.event_id_counter = 0
+        self.event_log.clear()
         self.turn_counter = 0
         await self.start()
+        
+        # Let push connections notice the reset
+        for listener in self._event_listeners:
+            listener.set()
     
     def get_game_status(self) -> Dict:
         """Get current game status."""
@@ -442,7 +793,7 @@ class GameLoop:
             "status": "running",
             "turn_counter": self.turn_counter,
             "active_agents": len(self.agent_manager.active_agents),
-            "total_events": len(self.event_queue),
+            "total_events": len(self.event_log),
             "locations": len(self.game.locations),
             "characters": len(self.game.characters)
         } 
\ No newline at end of file
@@ -12,7 +12,9 @@ It includes:
 5. **Utility Functions**: Helper functions for logging game events, agent actions, etc.
 
 Key Features:
-- Debug logs go to debug.log file with detailed formatting
+- Debug logs go to debug.log file with detailed formatting, rotated by size
+- Records are handed to a background thread (QueueHandler/QueueListener) that
+  pretty-prints, formats and writes them, so disk writes never stall the event loop
 - Console shows only INFO and above for clean development experience
 - Kani logs with long content are automatically pretty-printed
 - Turn-based game system logging utilities
@@ -30,18 +32,87 @@ Usage:
     log_agent_decision("alex_001", "go north", {"reasoning": "exploring"})
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
 import pprint
-from typing import Dict, Any, Optional, List
+import queue
+from typing import Callable, Dict, Any, Optional, List
 import re
 
-def setup_logging(verbose: bool = False):
+# Size-based rotation of the debug log
+DEFAULT_LOG_FILE = "debug.log"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+# Loggers whose long messages are rewritten by KaniPrettyFilter
+PRETTY_LOGGERS = ("kani.messages", "kani", "backend.agent_manager")
+
+# Handlers and listener installed by setup_logging (replaced when it is called again)
+_installed_handlers: List[logging.Handler] = []
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class LazyMessage:
+    """
+    Log message argument that is only built when a handler formats the record
+    (on the listener thread in queued mode, and never if the level is disabled).
+
+    Usage:
+        logger.info("%s", LazyMessage(build_summary, event))
+    """
+
+    __slots__ = ("build", "args", "_text")
+
+    def __init__(self, build: Callable[..., str], *args):
+        self.build = build
+        self.args = args
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        # Built once, even when several handlers format the record
+        if self._text is None:
+            self._text = self.build(*self.args)
+        return self._text
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+
+    The standard QueueHandler formats every record before queueing it. Records
+    whose arguments are immutable (or LazyMessage) are queued as they are
+    instead, so building the message, pretty-printing and formatting all
+    happen on the listener thread. Other records are formatted right away,
+    since their arguments could change before the listener gets to them.
+    """
+
+    _SAFE_ARGUMENT_TYPES = (str, int, float, bool, type(None), LazyMessage)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args if isinstance(record.args, tuple) else ()
+        if record.exc_info is None and isinstance(record.args, (tuple, type(None))) \
+                and all(isinstance(arg, self._SAFE_ARGUMENT_TYPES) for arg in args):
+            return record
+        return super().prepare(record)
+
+
+def setup_logging(verbose: bool = False, log_file: str = DEFAULT_LOG_FILE, max_bytes: int = DEFAULT_MAX_BYTES,
+                  backup_count: int = DEFAULT_BACKUP_COUNT, use_queue: bool = True):
     """Set up comprehensive logging for the Multi-Agent Playground backend.
     
     Args:
         verbose: If True, console shows INFO+ messages. If False, only WARNING+ messages.
+        log_file: Debug log file (rotated when it reaches max_bytes)
+        max_bytes: Size at which the debug log is rotated (0 never rotates)
+        backup_count: Rotated debug logs kept (debug.log.1, debug.log.2, ...)
+        use_queue: Hand records to a background thread that formats and writes them, so
+            the event loop never waits on disk or console output
     """
+    global _listener
+    shutdown_logging()
+    
     # Create formatters with clean spacing
     detailed_formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(name)s.%(funcName)s: %(message)s"
@@ -49,23 +120,37 @@ def setup_logging(verbose: bool = False):
     simple_formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(message)s"
     )
+    pretty_filter = KaniPrettyFilter()
     
     # Create handlers
-    # Debug file handler - captures ALL levels including DEBUG
-    debug_file_handler = logging.FileHandler("debug.log")
+    # Debug file handler - captures ALL levels including DEBUG, rotated by size
+    debug_file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True
+    )
     debug_file_handler.setLevel(logging.DEBUG)
     debug_file_handler.setFormatter(detailed_formatter)
+    debug_file_handler.addFilter(pretty_filter)
     
     # Console handler - level depends on verbose flag
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO if verbose else logging.WARNING)
     console_handler.setFormatter(simple_formatter)
+    console_handler.addFilter(pretty_filter)
     
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Capture everything
-    root_logger.addHandler(debug_file_handler)
-    root_logger.addHandler(console_handler)
+    if use_queue:
+        # Pretty-printing, formatting and writing run on the listener thread
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _installed_handlers.append(DeferredQueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, debug_file_handler, console_handler,
+                                                   respect_handler_level=True)
+        _listener.start()
+    else:
+        _installed_handlers.extend([debug_file_handler, console_handler])
+    for handler in _installed_handlers:
+        root_logger.addHandler(handler)
     
     # Filter out external library noise (affects both console and debug.log)
     logging.getLogger("openai").setLevel(logging.WARNING)
@@ -86,133 +171,100 @@ def setup_logging(verbose: bool = False):
     logging.getLogger("backend.text_adventure_games").setLevel(logging.INFO)
     logging.getLogger("backend.lru_llm").setLevel(logging.INFO)
     
-    # Set up pretty-printing for Kani logs with long content
-    _setup_kani_pretty_handlers()
+    # Kani logs reach the root handlers, whose KaniPrettyFilter pretty-prints them
+    for name in PRETTY_LOGGERS:
+        pretty_logger = logging.getLogger(name)
+        pretty_logger.handlers = []
+        pretty_logger.propagate = True
 
-def _setup_kani_pretty_handlers():
-    """Set up custom handlers for pretty-printing Kani logs with long content."""
-    
-    # Handler for kani.messages logs (completion responses with long content)
-    class KaniMessagesPrettyHandler(logging.Handler):
-        def emit(self, record):
-            msg = record.getMessage()
-            # Only pretty-print if the message contains content with \n
-            if 'content="' in msg and '\\n' in msg:
-                match = re.search(r'role=(.*?) content="(.*?)"', msg)
-                if match:
-                    role = match.group(1)
-                    content = match.group(2)
-                    indented_content = "\n    ".join(content.split("\\n"))
-                    indented_content = "    " + indented_content
-                    # Create a new record with pretty content
-                    pretty_record = logging.LogRecord(
-                        name="kani.messages.pretty",
-                        level=record.levelno,
-                        pathname=record.pathname,
-                        lineno=record.lineno,
-                        msg=f"[KANI] role: {role}\ncontent:\n{indented_content}",
-                        args=(),
-                        exc_info=None
-                    )
-                    pretty_record.asctime = str(getattr(record, 'asctime', record.created))
-                    # Let the root logger handle this record
-                    logging.getLogger().handle(pretty_record)
-                    return  # Don't let the original log through
-            # For logs without \n, let them pass through normally
+
+def shutdown_logging():
+    """Stop the listener thread (writing out queued records) and remove the handlers set up by setup_logging."""
+    global _listener
+    root_logger = logging.getLogger()
+    for handler in _installed_handlers:
+        root_logger.removeHandler(handler)
+    _installed_handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+class KaniPrettyFilter(logging.Filter):
+    """
+    Pretty-prints Kani messages and tool calls with long content.
     
-    # Handler for agent tool call messages (from KaniAgent loggers)
-    class AgentToolCallPrettyHandler(logging.Handler):
-        def emit(self, record):
-            msg = record.getMessage()
-            # Pretty-print tool call messages from agent code
-            if 'Received message:' in msg and 'tool_calls=[' in msg and 'ToolCall(' in msg:
-                # Extract the tool call information
-                tool_call_match = re.search(r'tool_calls=\[(.*?)\]', msg)
-                if tool_call_match:
-                    tool_call_str = tool_call_match.group(1)
-                    # Parse the tool call details
-                    func_match = re.search(r"FunctionCall\(name='([^']+)', arguments='([^']+)'\)", tool_call_str)
-                    if func_match:
-                        func_name = func_match.group(1)
-                        func_args = func_match.group(2)
-                        try:
-                            # Parse and pretty-print the arguments
-                            args_dict = json.loads(func_args)
-                            pretty_args = json.dumps(args_dict, indent=4, ensure_ascii=False)
-                        except:
-                            pretty_args = func_args
-                        
-                        # Create a new record with pretty content
-                        pretty_record = logging.LogRecord(
-                            name="agent.toolcall.pretty",
-                            level=record.levelno,
-                            pathname=record.pathname,
-                            lineno=record.lineno,
-                            msg=f"[AGENT TOOL CALL]\n  Function: {func_name}\n  Arguments:\n{pretty_args}",
-                            args=(),
-                            exc_info=None
-                        )
-                        pretty_record.asctime = str(getattr(record, 'asctime', record.created))
-                        # Let the root logger handle this record
-                        logging.getLogger().handle(pretty_record)
-                        return  # Don't let the original log through
-            # For logs without tool calls, let them pass through normally
+    Runs as a handler filter, so in queued mode the regex work happens on the
+    listener thread. Records from PRETTY_LOGGERS that have nothing to
+    pretty-print are dropped; all other records pass unchanged.
+    """
     
-    # Handler for kani tool call messages
-    class KaniToolCallPrettyHandler(logging.Handler):
-        def emit(self, record):
+    def filter(self, record: logging.LogRecord):
+        if _under(record.name, "kani.messages"):
+            pretty = _pretty_kani_message(record.getMessage())
+            name = "kani.messages.pretty"
+        elif _under(record.name, "backend.agent_manager"):
             msg = record.getMessage()
-            # Pretty-print tool call messages
-            if 'tool_calls=[' in msg and 'ToolCall(' in msg:
-                # Extract the tool call information
-                tool_call_match = re.search(r'tool_calls=\[(.*?)\]', msg)
-                if tool_call_match:
-                    tool_call_str = tool_call_match.group(1)
-                    # Parse the tool call details
-                    func_match = re.search(r"FunctionCall\(name='([^']+)', arguments='([^']+)'\)", tool_call_str)
-                    if func_match:
-                        func_name = func_match.group(1)
-                        func_args = func_match.group(2)
-                        try:
-                            # Parse and pretty-print the arguments
-                            args_dict = json.loads(func_args)
-                            pretty_args = json.dumps(args_dict, indent=4, ensure_ascii=False)
-                        except:
-                            pretty_args = func_args
-                        
-                        # Create a new record with pretty content
-                        pretty_record = logging.LogRecord(
-                            name="kani.toolcall.pretty",
-                            level=record.levelno,
-                            pathname=record.pathname,
-                            lineno=record.lineno,
-                            msg=f"[KANI TOOL CALL]\n  Function: {func_name}\n  Arguments:\n{pretty_args}",
-                            args=(),
-                            exc_info=None
-                        )
-                        pretty_record.asctime = str(getattr(record, 'asctime', record.created))
-                        # Let the root logger handle this record
-                        logging.getLogger().handle(pretty_record)
-                        return  # Don't let the original log through
-            # For logs without tool calls, let them pass through normally
-    
-    # Configure kani.messages logger
-    kani_messages_logger = logging.getLogger("kani.messages")
-    kani_messages_logger.handlers = []
-    kani_messages_logger.addHandler(KaniMessagesPrettyHandler())
-    kani_messages_logger.propagate = False
-    
-    # Configure kani logger for tool calls
-    kani_logger = logging.getLogger("kani")
-    kani_logger.handlers = []
-    kani_logger.addHandler(KaniToolCallPrettyHandler())
-    kani_logger.propagate = False
-    
-    # Configure agent loggers for tool calls (covering both old and new systems)
-    agent_logger = logging.getLogger("backend.agent_manager")
-    agent_logger.handlers = []
-    agent_logger.addHandler(AgentToolCallPrettyHandler())
-    agent_logger.propagate = False
+            pretty = _pretty_tool_call(msg, "[AGENT TOOL CALL]") if 'Received message:' in msg else None
+            name = "agent.toolcall.pretty"
+        elif _under(record.name, "kani"):
+            pretty = _pretty_tool_call(record.getMessage(), "[KANI TOOL CALL]")
+            name = "kani.toolcall.pretty"
+        else:
+            return True
+        if pretty is None:
+            return False
+        
+        pretty_record = logging.makeLogRecord(record.__dict__)
+        pretty_record.name = name
+        pretty_record.msg = pretty
+        pretty_record.args = ()
+        pretty_record.exc_info = None
+        return pretty_record
+
+
+def _under(name: str, parent: str) -> bool:
+    """Whether a logger name is the parent logger or one of its children."""
+    return name == parent or name.startswith(parent + ".")
+
+
+def _pretty_kani_message(msg: str) -> Optional[str]:
+    """Indent the content of a Kani completion message that contains newlines."""
+    # Only pretty-print if the message contains content with \n
+    if 'content="' not in msg or '\\n' not in msg:
+        return None
+    match = re.search(r'role=(.*?) content="(.*?)"', msg)
+    if not match:
+        return None
+    role = match.group(1)
+    content = match.group(2)
+    indented_content = "    " + "\n    ".join(content.split("\\n"))
+    return f"[KANI] role: {role}\ncontent:\n{indented_content}"
+
+
+def _pretty_tool_call(msg: str, title: str) -> Optional[str]:
+    """Show the function name and indented JSON arguments of a logged tool call."""
+    if 'tool_calls=[' not in msg or 'ToolCall(' not in msg:
+        return None
+    tool_call_match = re.search(r'tool_calls=\[(.*?)\]', msg)
+    if not tool_call_match:
+        return None
+    func_match = re.search(r"FunctionCall\(name='([^']+)', arguments='([^']+)'\)", tool_call_match.group(1))
+    if not func_match:
+        return None
+    func_name = func_match.group(1)
+    func_args = func_match.group(2)
+    try:
+        # Parse and pretty-print the arguments
+        pretty_args = json.dumps(json.loads(func_args), indent=4, ensure_ascii=False)
+    except ValueError:
+        pretty_args = func_args
+    return f"{title}\n  Function: {func_name}\n  Arguments:\n{pretty_args}"
 
 # ===== GAME SYSTEM LOGGING UTILITIES =====
 
@@ -318,6 +370,8 @@ def log_agent_action(agent_id: str, action_type: str, details: Dict[str, Any]):
 def log_perception(agent_id: str, perception: Dict[str, Any]):
     """Log perception data in readable format"""
     logger = logging.getLogger(__name__)
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     logger.debug(f"[Agent {agent_id}] Perception:")
     
     if perception.get('visible_objects'):
@@ -332,6 +386,8 @@ def log_perception(agent_id: str, perception: Dict[str, Any]):
 def log_full_debug(obj: Any, context: str, agent_id: Optional[str] = None):
     """Full debug dump when needed"""
     logger = logging.getLogger(__name__)
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     pp = pprint.PrettyPrinter(indent=2)
     
     prefix = f"[Agent {agent_id}] " if agent_id else ""
@@ -12,36 +12,51 @@ This combines:
 """
 
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import asyncio
 import argparse
+import json
 import sys
 import os
 from contextlib import asynccontextmanager
 
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 
 # Import the game controller and logging
 from .game_loop import GameLoop
-from .config.schema import WorldStateResponse, GameEvent, GameEventList, StatusMsg, GameStatus, AgentStateResponse, GameObject, AgentActionOutput
+from .agent.engine_registry import close_engine_registry
+from .agent.llm_scheduler import get_llm_scheduler
+from .tracing import get_tracer, close_tracer
+from .config.schema import WorldStateResponse, WorldStatePatch, GameEvent, GameEventList, StatusMsg, GameStatus, AgentStateResponse, GameObject, AgentActionOutput, LLMSchedulerMetrics, TracingMetrics
 from .log_config import setup_logging
 
 # Setup logging based on environment variable (for uvicorn compatibility)
 verbose_mode = os.getenv("VERBOSE", "false").lower() in ("true", "1", "yes")
 setup_logging(verbose=verbose_mode)
 
+# Resume from the last checkpoint on startup (set by --resume, or directly for uvicorn)
+resume_mode = os.getenv("RESUME", "false").lower() in ("true", "1", "yes")
+
+# Game loop pacing override: "fast", "fixed" or "realtime" (set by --pacing; see pacing_defaults)
+pacing_mode = os.getenv("PACING") or None
+
 # Global game controller instance
 game_controller: Optional[GameLoop] = None
 
+# Event stream settings
+STREAM_HEARTBEAT_SECONDS = 15.0
+STREAM_BATCH_SIZE = 50
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown."""
     # Startup
     global game_controller
-    game_controller = GameLoop()
+    game_controller = GameLoop(resume=resume_mode, pacing_mode=pacing_mode)
     await game_controller.start()
     
     yield
@@ -49,6 +64,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if game_controller:
         await game_controller.stop()
+        game_controller.event_log.close()
+        if game_controller.checkpoints:
+            await game_controller.checkpoints.close()
+    await close_engine_registry()
+    close_tracer()
 
 app = FastAPI(title="Multi-Agent Playground", version="1.0.0", lifespan=lifespan)
 
@@ -62,19 +82,75 @@ app.add_middleware(
 
 
 @app.get("/agent_act/next", response_model=List[AgentActionOutput])
-async def get_latest_agent_actions():
+async def get_latest_agent_actions(client_id: Optional[str] = None):
     """
     Poll the latest planned actions for all agents.
-    Returns only the actions that haven't been served yet.
+    Returns only the actions that haven't been served yet to this client.
     Each returned action is marked as served to prevent duplicate delivery.
+    Clients that pass their own client_id get an independent cursor.
     """
     if not game_controller:
         raise HTTPException(status_code=500, detail="Game not initialized")
     
-    # Get unserved events from the event queue
-    unserved_events = game_controller.get_unserved_events()
+    # Get unserved events from the event log
+    unserved_events = game_controller.get_unserved_events(client_id)
     return unserved_events
 
+@app.get("/agent_act/stream")
+async def stream_agent_actions(request: Request, last_event_id: Optional[int] = None,
+                               last_event_id_header: Optional[str] = Header(default=None, alias="Last-Event-ID")):
+    """
+    Push agent actions to the client as Server-Sent Events.
+    
+    Each connection keeps its own cursor, so it does not interfere with other
+    clients or with /agent_act/next. Every event carries its id; reconnecting
+    clients resume after the last id they saw, either automatically through the
+    Last-Event-ID header or explicitly with the last_event_id query parameter.
+    Events are read from the event queue at the client's own pace, so a slow
+    client never blocks the game loop.
+    """
+    if not game_controller:
+        raise HTTPException(status_code=500, detail="Game not initialized")
+    
+    cursor = last_event_id
+    if cursor is None and last_event_id_header:
+        try:
+            cursor = int(last_event_id_header)
+        except ValueError:
+            cursor = None
+    
+    controller = game_controller
+    
+    async def event_stream(cursor: int):
+        listener = controller.subscribe_events()
+        try:
+            # Tell the browser how long to wait before reconnecting
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                listener.clear()
+                events = controller.get_events_after_id(cursor, limit=STREAM_BATCH_SIZE)
+                if events:
+                    chunk = []
+                    for event_id, event in events:
+                        chunk.append(f"id: {event_id}\nevent: agent_action\ndata: {event.model_dump_json()}\n\n")
+                        cursor = event_id
+                    yield "".join(chunk)
+                    continue
+                
+                try:
+                    await asyncio.wait_for(listener.wait(), timeout=STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+        finally:
+            controller.unsubscribe_events(listener)
+    
+    return StreamingResponse(
+        event_stream(cursor or 0),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # check if this is the same as get world state, and do we need this?
 @app.get("/agents/states", response_model=List[AgentStateResponse])
 async def get_agents_states(agent_ids: List[str]):
@@ -102,32 +178,41 @@ async def get_objects():
 
 
 
-@app.get("/world_state")
-async def get_world_state():
+@app.get("/world_state", response_model=Union[WorldStatePatch, WorldStateResponse])
+async def get_world_state(since_version: Optional[int] = None):
     """
     Return the complete state of the game world, including agents, 
     objects, and locations.
+    
+    With since_version (the version of a previous response), only the agents,
+    objects and locations that changed since then are returned as a patch.
+    The full state is returned if since_version belongs to an earlier game.
     """
     if not game_controller:
         raise HTTPException(status_code=500, detail="Game not initialized")
-    state = game_controller.get_world_state()
+    if since_version is not None:
+        state = game_controller.get_world_state_since(since_version)
+        if "since_version" in state:
+            return WorldStatePatch(**state)
+    else:
+        state = game_controller.get_world_state()
     return WorldStateResponse(**state)
 
 @app.get("/game/events", response_model=GameEventList)
-async def get_game_events(since_timestamp: str = ""):
+async def get_game_events(since_timestamp: str = "", after_id: Optional[int] = None,
+                          limit: Optional[int] = Query(default=None, ge=1, le=1000)):
+    """
+    Return events newer than since_timestamp (or after the event id after_id).
+    Use limit together with the returned last_event_id and has_more to page through events.
+    """
     if not game_controller:
         raise HTTPException(status_code=500, detail="Game not initialized")
-    events = game_controller.get_events_since(since_timestamp)
-    # Convert AgentActionOutput to GameEvent format
-    game_events = []
-    for event in events:
-        game_events.append(GameEvent(
-            id=hash(event.timestamp) if event.timestamp else 0,
-            type="agent_action",
-            timestamp=event.timestamp or "",
-            data=event.dict()
-        ))
-    return GameEventList(events=game_events)
+    events, has_more, last_event_id = game_controller.get_serialized_game_events(since_timestamp, after_id, limit)
+    # Events are cached as GameEvent JSON, so assemble the response body directly
+    body = '{"events":[%s],"has_more":%s,"last_event_id":%s}' % (
+        ",".join(events), json.dumps(has_more), json.dumps(last_event_id)
+    )
+    return Response(content=body, media_type="application/json")
 
 @app.post("/game/reset", response_model=StatusMsg)
 async def reset_game():
@@ -141,6 +226,16 @@ async def get_game_status():
         raise HTTPException(status_code=500, detail="Game not initialized")
     return GameStatus(**game_controller.get_game_status())
 
+@app.get("/llm/metrics", response_model=LLMSchedulerMetrics)
+async def get_llm_metrics():
+    """Request, retry and queue-wait statistics of the shared LLM scheduler."""
+    return LLMSchedulerMetrics(**get_llm_scheduler().get_metrics())
+
+@app.get("/metrics", response_model=TracingMetrics)
+async def get_metrics():
+    """Latency percentiles per turn phase (ms), tokens per turn and turns per second."""
+    return TracingMetrics(**get_tracer().get_metrics())
+
 @app.post("/game/pause", response_model=StatusMsg)
 async def pause_game():
     """Pause the game loop."""
@@ -171,8 +266,19 @@ if __name__ == "__main__":
                        help="Enable auto-reload for development")
     parser.add_argument("--port", type=int, default=8000,
                        help="Port to run the server on (default: 8000)")
+    parser.add_argument("--resume", action="store_true",
+                       help="Resume from the last checkpoint (see checkpoint_defaults in defaults.yaml)")
+    parser.add_argument("--pacing", choices=["fast", "fixed", "realtime"],
+                       help="Game loop pacing (default: pacing_defaults in defaults.yaml)")
     args = parser.parse_args()
     
+    if args.resume:
+        os.environ["RESUME"] = "true"
+        resume_mode = True
+    if args.pacing:
+        os.environ["PACING"] = args.pacing
+        pacing_mode = args.pacing
+    
     # Setup logging based on verbose flag
     setup_logging(verbose=args.verbose)
     
@@ -0,0 +1,99 @@
+"""
+Pacing - How long the game loop waits between iterations
+========================================================
+Contains the Pacer used by the GameLoop instead of a flat sleep after every
+iteration. The wait is computed from how long the turn actually took:
+
+- "fast": no waiting at all (the loop only yields to the event loop), for
+  headless and batch simulations.
+- "fixed": every turn takes at least tick_seconds (the frontend's animation
+  budget); a turn that took longer is not made up for.
+- "realtime": turns follow a wall-clock schedule of one turn per
+  tick_seconds; after slow turns the loop runs without waiting until it is
+  back on schedule, dropping the backlog if it falls behind by more than
+  max_catch_up_ticks.
+
+Actions that do not end a turn (look, chat responses, ...) belong to the
+current turn and are never waited on. An iteration in which no agent acted
+(no active agents) waits idle_seconds in every mode, so an idle loop does not
+spin, and the schedule restarts after it.
+"""
+
+from typing import Awaitable, Callable, Optional
+import asyncio
+import logging
+import time
+
+from .config.models import PacingConfig
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+PACING_MODES = ("fast", "fixed", "realtime")
+
+
+class Pacer:
+    """
+    Computes and performs the wait after each game loop iteration.
+    """
+
+    def __init__(self, config: Optional[PacingConfig] = None, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        """
+        Args:
+            config: Pacing settings (defaults to PacingConfig())
+            clock: Monotonic clock in seconds
+            sleep: Coroutine function used to wait
+        """
+        self.config = config or PacingConfig()
+        if self.config.mode not in PACING_MODES:
+            logger.warning(f"Unknown pacing mode '{self.config.mode}'. Using fixed ticks.")
+            self.config = self.config.model_copy(update={"mode": "fixed"})
+        self._clock = clock
+        self._sleep = sleep
+        # Start of the current turn ("fixed") or when the next turn is due ("realtime")
+        self._turn_start = 0.0
+        self._deadline = 0.0
+        self.start()
+
+    @property
+    def mode(self) -> str:
+        return self.config.mode
+
+    def start(self):
+        """Restart the schedule (when the loop starts or resumes after a pause)."""
+        self._turn_start = self._deadline = self._clock()
+
+    def delay(self, turn_ended: bool = True, idle: bool = False) -> float:
+        """
+        Seconds to wait after an iteration, and advance the schedule.
+
+        Args:
+            turn_ended: Whether the iteration ended a turn
+            idle: Whether no agent acted in the iteration
+        """
+        if idle:
+            delay = self.config.idle_seconds
+            self._turn_start = self._deadline = self._clock() + delay
+            return delay
+        if self.config.mode == "fast" or not turn_ended:
+            return 0.0
+
+        now = self._clock()
+        tick = self.config.tick_seconds
+        if self.config.mode == "fixed":
+            delay = max(0.0, tick - (now - self._turn_start))
+            self._turn_start = now + delay
+            return delay
+
+        # realtime
+        self._deadline += tick
+        delay = self._deadline - now
+        if delay < -tick * self.config.max_catch_up_ticks:
+            logger.debug("Game loop is %.2fs behind schedule, dropping the backlog", -delay)
+            self._deadline = now
+        return max(0.0, delay)
+
+    async def wait(self, turn_ended: bool = True, idle: bool = False):
+        """Wait as long as the pacing mode requires (always yields to the event loop)."""
+        await self._sleep(self.delay(turn_ended, idle))
@@ -27,15 +27,19 @@ class AgentTestRunner:
     Executes agent goal tests and provides detailed results.
     """
     
-    def __init__(self, game_builder_func: Callable = build_house_game):
+    def __init__(self, game_builder_func: Callable = build_house_game, turn_delay: float = 0.1):
         self.game_builder = game_builder_func
+        # Pause after each agent turn (0 for mock engines)
+        self.turn_delay = turn_delay
     
-    async def run_test(self, test: AgentGoalTest) -> TestResult:
+    async def run_test(self, test: AgentGoalTest, timeout_seconds: Optional[float] = None) -> TestResult:
         """
         Run a single agent goal test.
         
         Args:
             test: The AgentGoalTest to execute
+            timeout_seconds: Wall-clock limit for the test (default: test.timeout_seconds; 0 for none).
+                The test is cancelled when it runs out, even in the middle of an LLM request.
             
         Returns:
             TestResult with detailed information about the test execution
@@ -48,6 +52,7 @@ class AgentTestRunner:
         start_time = time.time()
         action_history = []
         error_message = None
+        timeout = test.timeout_seconds if timeout_seconds is None else timeout_seconds
         
         try:
             # Build the game world
@@ -70,54 +75,13 @@ class AgentTestRunner:
             
             # No special goal tracking needed - criteria handle everything
             
-            # Main test loop
-            for turn in range(test.max_turns):
-                logger.info(f"--- Turn {turn + 1} ---")
-                
-                # Get current game state
-                current_state = self._get_current_state(agent_char, game)
-                
-                # Check for success
-                success, success_reasons = test.check_success(current_state, action_history)
-                if success:
-                    logger.info(f"[SUCCESS] Test PASSED after {turn + 1} turns!")
-                    for reason in success_reasons:
-                        logger.info(f"  - {reason}")
-                    break
-                
-                # Check for failure
-                failed, failure_reasons = test.check_failure(current_state, action_history)
-                if failed:
-                    logger.warning(f"[FAILURE] Test FAILED after {turn + 1} turns!")
-                    for reason in failure_reasons:
-                        logger.warning(f"  - {reason}")
-                    break
-                
-                # Execute agent turn
-                try:
-                    action_output, action_ended_turn = await agent_manager.execute_agent_turn(agent_char)
-                    if action_output:
-                        action_history.append(action_output)
-                        turn_status = " (ended turn)" if action_ended_turn else " (continued turn)"
-                        logger.info(f"Agent action: {action_output.action.action_type}{turn_status}")
-                        # Check if the action has a target attribute (some actions like LookAction and NoOpAction don't)
-                        action = action_output.action
-                        target = getattr(action, 'target', None)
-                        if target is not None:
-                            logger.info(f"  Target: {target}")
-                        logger.info(f"  Location: {action_output.current_room}")
-                        if action_output.description:
-                            logger.info(f"  Result: {action_output.description}")
-                    else:
-                        logger.warning("No action output received")
-                        
-                except Exception as e:
-                    logger.error(f"Error during agent turn: {e}")
-                    error_message = str(e)
-                    break
-                
-                # Small delay to prevent overwhelming the system
-                await asyncio.sleep(0.1)
+            timed_out = False
+            try:
+                async with asyncio.timeout(timeout or None):
+                    error_message = await self._run_turns(test, game, agent_char, agent_manager, action_history)
+            except TimeoutError:
+                timed_out = True
+                logger.warning(f"[TIMEOUT] Test {test.name} cancelled after {timeout}s")
             
             # Final state check
             final_state = self._get_current_state(agent_char, game)
@@ -126,7 +90,10 @@ class AgentTestRunner:
             success, success_reasons = test.check_success(final_state, action_history)
             failed, failure_reasons = test.check_failure(final_state, action_history)
             
-            if not success and not failed:
+            if timed_out and not success:
+                failed = True
+                failure_reasons = [f"Test timed out after {timeout}s"] + failure_reasons
+            elif not success and not failed:
                 # Test didn't succeed but also didn't explicitly fail
                 failed = True
                 failure_reasons = ["Test completed without achieving goal"]
@@ -174,13 +141,75 @@ class AgentTestRunner:
         
         return result
     
-    async def run_test_suite(self, tests: List[AgentGoalTest], suite_name: str = "Agent Test Suite") -> TestSuiteResult:
+    async def _run_turns(self, test: AgentGoalTest, game: Game, agent_char: Character,
+                         agent_manager: AgentManager, action_history: List[AgentActionOutput]) -> Optional[str]:
+        """
+        Let the agent act until the test succeeds or fails (appending to action_history).
+        
+        Returns:
+            Error message if an agent turn raised, otherwise None
+        """
+        for turn in range(test.max_turns):
+            logger.info(f"--- {test.name}: Turn {turn + 1} ---")
+            
+            # Get current game state
+            current_state = self._get_current_state(agent_char, game)
+            
+            # Check for success
+            success, success_reasons = test.check_success(current_state, action_history)
+            if success:
+                logger.info(f"[SUCCESS] Test PASSED after {turn + 1} turns!")
+                for reason in success_reasons:
+                    logger.info(f"  - {reason}")
+                return None
+            
+            # Check for failure (a TimeoutCriterion ends the test before another LLM request)
+            failed, failure_reasons = test.check_failure(current_state, action_history)
+            if failed:
+                logger.warning(f"[FAILURE] Test FAILED after {turn + 1} turns!")
+                for reason in failure_reasons:
+                    logger.warning(f"  - {reason}")
+                return None
+            
+            # Execute agent turn
+            try:
+                action_output, action_ended_turn = await agent_manager.execute_agent_turn(agent_char)
+                if action_output:
+                    action_history.append(action_output)
+                    turn_status = " (ended turn)" if action_ended_turn else " (continued turn)"
+                    logger.info(f"Agent action: {action_output.action.action_type}{turn_status}")
+                    # Check if the action has a target attribute (some actions like LookAction and NoOpAction don't)
+                    action = action_output.action
+                    target = getattr(action, 'target', None)
+                    if target is not None:
+                        logger.info(f"  Target: {target}")
+                    logger.info(f"  Location: {action_output.current_room}")
+                    if action_output.description:
+                        logger.info(f"  Result: {action_output.description}")
+                else:
+                    logger.warning("No action output received")
+                    
+            except Exception as e:
+                logger.error(f"Error during agent turn: {e}")
+                return str(e)
+            
+            # Small delay to prevent overwhelming the system
+            await asyncio.sleep(self.turn_delay)
+        return None
+    
+    async def run_test_suite(self, tests: List[AgentGoalTest], suite_name: str = "Agent Test Suite",
+                             concurrency: int = 1, timeout_seconds: Optional[float] = None) -> TestSuiteResult:
         """
         Run multiple tests and aggregate results.
         
+        Every test builds its own game and agent, so tests can run concurrently.
+        Results keep the order of `tests` whatever order they finish in.
+        
         Args:
             tests: List of AgentGoalTest instances
             suite_name: Name for the test suite
+            concurrency: Maximum number of tests running at once
+            timeout_seconds: Wall-clock limit per test (default: each test's timeout_seconds)
             
         Returns:
             TestSuiteResult with aggregated information
@@ -189,20 +218,17 @@ class AgentTestRunner:
         logger.info(f"Total tests: {len(tests)}")
         
         start_time = time.time()
-        results = []
-        passed = 0
-        failed = 0
+        results: List[Optional[TestResult]] = [None] * len(tests)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
         
-        for i, test in enumerate(tests, 1):
-            logger.info(f"[{i}/{len(tests)}] Starting test: {test.name}")
-            
-            result = await self.run_test(test)
-            results.append(result)
-            
-            if result.success:
-                passed += 1
-            else:
-                failed += 1
+        async def run_one(index: int, test: AgentGoalTest):
+            async with semaphore:
+                logger.info(f"[{index + 1}/{len(tests)}] Starting test: {test.name}")
+                results[index] = await self.run_test(test, timeout_seconds)
+        
+        await asyncio.gather(*(run_one(index, test) for index, test in enumerate(tests)))
+        passed = sum(1 for result in results if result.success)
+        failed = len(results) - passed
         
         end_time = time.time()
         total_duration = end_time - start_time
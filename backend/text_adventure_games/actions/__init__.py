@@ -1,5 +1,7 @@
 from .base import (
     Action,
+    ActionResult,
+    ExecutionContext,
     ActionSequence,
     Quit,
     Look,
@@ -20,6 +22,8 @@ from .generic import (
 
 __all__ = [
     "Action",
+    "ActionResult",
+    "ExecutionContext",
     "ActionSequence",
     "Quit",
     "Look",
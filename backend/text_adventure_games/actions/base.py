@@ -1,5 +1,7 @@
 from ..things import Thing, Character, Item, Location
+from ..command.matcher import get_character_from_command
 from ...config.schema import NoOpAction, LookAction
+from dataclasses import dataclass
 from typing import Optional, Any, List
 
 class ActionResult:
@@ -10,6 +12,21 @@ class ActionResult:
         self.house_action = house_action
         self.object_id = object_id
 
+
+@dataclass
+class ExecutionContext:
+    """
+    State of a single command execution or precondition probe.
+    
+    Carries the acting character in and the error message, result and action
+    out, so executions for different characters never share game-level slots.
+    """
+    actor: Optional[Character] = None
+    last_error_message: Optional[str] = None
+    result: Optional[ActionResult] = None
+    action: Optional["Action"] = None
+
+
 class Action:
     """
     In the game, rather than allowing players to do anything, we have a
@@ -34,9 +51,19 @@ class Action:
     # Turn management - whether this action ends the agent's turn
     ends_turn: bool = True  # Default: all actions end turns for backward compatibility
 
-    def __init__(self, game):
+    def __init__(self, game, context: Optional[ExecutionContext] = None):
         self.game = game
         self.parser = game.parser
+        # Acting character and result sink (defaults to the game's player)
+        self.context = context if context is not None else ExecutionContext(actor=game.player)
+        self.context.action = self
+
+    def get_character(self, command: str) -> Character:
+        """
+        Returns the character named in the command, or the acting character
+        of this execution if no character is named.
+        """
+        return get_character_from_command(command, self.game, default=self.context.actor)
 
     def check_preconditions(self) -> bool:
         """
@@ -65,22 +92,14 @@ class Action:
             else:
                 # Fallback - create ActionResult from string
                 schema = ActionResult(description=str(result))
-            
-            # Store last action result in the game for schema export
-            if hasattr(self.game, '_last_action_result'):
-                self.game._last_action_result = schema
-            else:
-                self.game._last_action_result = schema
-            return schema
         else:
             # On precondition failure, return ActionResult with error message
-            error_message = self.parser.last_error_message or "Action could not be performed."
+            error_message = self.context.last_error_message or "Action could not be performed."
             schema = ActionResult(description=error_message)
-            if hasattr(self.game, '_last_action_result'):
-                self.game._last_action_result = schema
-            else:
-                self.game._last_action_result = schema
-            return schema
+        
+        # Store the result in the execution context for schema export
+        self.context.result = schema
+        return schema
 
 
     ###
@@ -98,7 +117,7 @@ class Action:
                 name=thing.name.capitalize(), loc=location.name
             )
             if describe_error:
-                self.parser.last_error_message = message
+                self.context.last_error_message = message
             return False
         else:
             return True
@@ -115,7 +134,7 @@ class Action:
                 location_name=location.name.capitalize(), direction=direction
             )
             if describe_error:
-                self.parser.last_error_message = message
+                self.context.last_error_message = message
             return False
         else:
             return True
@@ -129,7 +148,7 @@ class Action:
         if location.is_blocked(direction):
             message = location.get_block_description(direction)
             if describe_error:
-                self.parser.last_error_message = message
+                self.context.last_error_message = message
             return True
         else:
             return False
@@ -155,7 +174,7 @@ class Action:
                         value=property_value,
                     )
                 if describe_error:
-                    self.parser.last_error_message = error_message
+                    self.context.last_error_message = error_message
             return False
         else:
             if display_message_upon is True:
@@ -166,7 +185,7 @@ class Action:
                         value=property_value,
                     )
                 if describe_error:
-                    self.parser.last_error_message = error_message
+                    self.context.last_error_message = error_message
             return True
 
     def has_property(
@@ -187,7 +206,7 @@ class Action:
                         name=thing.name.capitalize(), property_name=property_name
                     )
                 if describe_error:
-                    self.parser.last_error_message = error_message
+                    self.context.last_error_message = error_message
             return False
         else:
             if display_message_upon is True:
@@ -196,7 +215,7 @@ class Action:
                         name=thing.name.capitalize(), property_name=property_name
                     )
                 if describe_error:
-                    self.parser.last_error_message = error_message
+                    self.context.last_error_message = error_message
             return True
 
     def loc_has_item(
@@ -213,7 +232,7 @@ class Action:
                 loc=location.name, item=item.name
             )
             if describe_error:
-                self.parser.last_error_message = message
+                self.context.last_error_message = message
             return False
 
     def is_in_inventory(
@@ -227,7 +246,7 @@ class Action:
                 name=character.name.capitalize(), item_name=item.name
             )
             if describe_error:
-                self.parser.last_error_message = message
+                self.context.last_error_message = message
             return False
         else:
             return True
@@ -245,7 +264,7 @@ class Action:
             if not error_message:
                 message = "Something was not matched by the self.parser."
             if describe_error:
-                self.parser.last_error_message = error_message
+                self.context.last_error_message = error_message
             return False
         else:
             return True
@@ -384,8 +403,9 @@ class ActionSequence(Action):
         self,
         game,
         command: str,
+        context: Optional[ExecutionContext] = None,
     ):
-        super().__init__(game)
+        super().__init__(game, context)
         self.command = command
 
     def check_preconditions(self) -> bool:
@@ -395,7 +415,7 @@ class ActionSequence(Action):
         responses = []
         for cmd in self.command.split(","):
             cmd = cmd.strip()
-            responses.append(self.parser.parse_command(cmd))
+            responses.append(self.parser.parse_command(cmd, context=ExecutionContext(actor=self.context.actor)))
         return ActionResult(description="Sequence of actions executed.")
 
 
@@ -409,8 +429,9 @@ class Quit(Action):
         self,
         game,
         command: str,
+        context: Optional[ExecutionContext] = None,
     ):
-        super().__init__(game)
+        super().__init__(game, context)
         self.command = command
 
     def check_preconditions(self) -> bool:
@@ -435,8 +456,9 @@ class Look(Action):
         self,
         game,
         command: str,
+        context: Optional[ExecutionContext] = None,
     ):
-        super().__init__(game)
+        super().__init__(game, context)
         self.command = command
 
     def check_preconditions(self) -> bool:
@@ -444,10 +466,11 @@ class Look(Action):
 
     def apply_effects(self):
         # Get basic location description
-        base_description = self.game.description_manager.describe_full_location()
+        character = self.context.actor
+        base_description = self.game.description_manager.describe_full_location(character)
         
         # Get available actions from parser
-        available_actions = self.parser.get_available_actions(self.game.player)
+        available_actions = self.parser.get_available_actions(character)
         
         # Create enhanced description with available actions
         enhanced_description = base_description
@@ -460,5 +483,5 @@ class Look(Action):
         return ActionResult(
             description=enhanced_description,
             house_action=look_action,
-            object_id=self.game.player.location.name if self.game.player.location else None
+            object_id=character.location.name if character.location else None
         )
@@ -3,9 +3,56 @@ Action discovery and availability system.
 """
 
 import logging
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
 from backend.text_adventure_games.things import Character
 from .preconditions import test_action_preconditions
+from backend.tracing import get_tracer
+
+
+class AvailableActionsCache:
+    """
+    Cache of available actions per character and location.
+    
+    An entry is keyed by the contents revision of the character's location and
+    of the character itself. Any change to the room, the things in it (including
+    open containers and other characters) or the character's inventory gives the
+    location a new contents revision, so only the entries of that room go stale;
+    looks in unchanged rooms are served from the cache.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        # (character name, location name) -> (revision key, available actions)
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _revision_key(character: Character) -> tuple:
+        return (character.location.contents_revision, character.contents_revision)
+    
+    def get(self, character: Character) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached actions for a character, or None if missing or stale."""
+        entry_key = (character.name, character.location.name)
+        entry = self._entries.get(entry_key)
+        if entry is None or entry[0] != self._revision_key(character):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, character: Character, actions: List[Dict[str, Any]]):
+        """Store the actions computed for a character in its current state."""
+        self._entries[(character.name, character.location.name)] = (self._revision_key(character), actions)
+        self._entries.move_to_end((character.name, character.location.name))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
 
 
 def discover_action_classes():
@@ -49,16 +96,26 @@ def get_available_actions(character: Character, parser) -> List[Dict[str, Any]]:
     Returns:
         List of dicts with 'command' and 'description' keys
     """
+    with get_tracer().span("available_actions"):
+        return _find_available_actions(character, parser)
+
+
+def _find_available_actions(character: Character, parser) -> List[Dict[str, Any]]:
+    """Discover the available actions (see get_available_actions)."""
+    # Serve repeated requests for an unchanged room from the game's cache
+    cache = getattr(parser.game, 'available_actions_cache', None)
+    if cache is not None and character.location is not None:
+        cached = cache.get(character)
+        if cached is not None:
+            return list(cached)
+    
     available = []
     location = character.location
     
-    # Auto-discover actions using the pattern system
-    action_classes = discover_action_classes()
+    # Auto-discover actions using the compiled pattern table shared with the parser
+    from backend.text_adventure_games.command.patterns import get_command_table
     
-    for action_class in action_classes:
-        # Get all possible command patterns for this action
-        patterns = action_class.get_command_patterns()
-        
+    for action_class, patterns in get_command_table().iter_patterns():
         # Get all applicable combinations for this action 
         try:
             combinations = list(action_class.get_applicable_combinations(character, parser))
@@ -92,4 +149,6 @@ def get_available_actions(character: Character, parser) -> List[Dict[str, Any]]:
                     # Pattern couldn't be filled with this combination, skip
                     continue
     
+    if cache is not None and character.location is not None:
+        cache.put(character, list(available))
     return available
\ No newline at end of file
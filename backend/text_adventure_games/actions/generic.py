@@ -3,7 +3,8 @@ Generic action classes that delegate to object capabilities.
 These actions replace the 20+ specific action classes with a flexible system
 where objects define their own behavior through capability protocols.
 """
-from .base import Action, ActionResult
+from typing import Optional
+from .base import Action, ActionResult, ExecutionContext
 from ...config.schema import (
     SetToStateAction as SetToStateSchema, StartUsingAction as StartUsingSchema,
     StopUsingAction as StopUsingSchema, TakeAction as TakeSchema, DropAction as DropSchema,
@@ -40,10 +41,10 @@ class GenericSetToStateAction(Action):
                 hasattr(item, 'get_object_capabilities')):
                 combinations.append({"target": item_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse the command to extract target and state
         self.target = None
         self.target_name = ""
@@ -77,20 +78,20 @@ class GenericSetToStateAction(Action):
                 self.target = location.items[self.target_name]
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't see a {self.target_name} here."
+            self.context.last_error_message = f"You don't see a {self.target_name} here."
             return False
         # Check if target has the required capability for this state
         if self.state in ["on", "off"]:
             if not isinstance(self.target, Activatable):
-                self.parser.last_error_message = f"The {self.target_name} cannot be turned on or off."
+                self.context.last_error_message = f"The {self.target_name} cannot be turned on or off."
                 return False
         elif self.state in ["open", "close"]:
             if not isinstance(self.target, Openable):
-                self.parser.last_error_message = f"The {self.target_name} cannot be opened or closed."
+                self.context.last_error_message = f"The {self.target_name} cannot be opened or closed."
                 return False
         elif self.state in ["lock", "unlock"]:
             if not isinstance(self.target, Lockable):
-                self.parser.last_error_message = f"The {self.target_name} cannot be locked or unlocked."
+                self.context.last_error_message = f"The {self.target_name} cannot be locked or unlocked."
                 return False
         return True
     def apply_effects(self):
@@ -142,10 +143,10 @@ class GenericStartUsingAction(Action):
             if isinstance(item, Usable):
                 combinations.append({"target": item_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse target from command
         self.target = None
         self.target_name = ""
@@ -163,10 +164,10 @@ class GenericStartUsingAction(Action):
                 self.target = location.items[self.target_name]
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't see a {self.target_name} here."
+            self.context.last_error_message = f"You don't see a {self.target_name} here."
             return False
         if not isinstance(self.target, Usable):
-            self.parser.last_error_message = f"You can't use the {self.target_name}."
+            self.context.last_error_message = f"You can't use the {self.target_name}."
             return False
         return True
     def apply_effects(self):
@@ -204,10 +205,10 @@ class GenericStopUsingAction(Action):
             if isinstance(item, Usable) and item.is_being_used_by(character):
                 combinations.append({"target": item_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse target from command
         self.target = None
         self.target_name = ""
@@ -225,13 +226,13 @@ class GenericStopUsingAction(Action):
                 self.target = location.items[self.target_name]
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't see a {self.target_name} here."
+            self.context.last_error_message = f"You don't see a {self.target_name} here."
             return False
         if not isinstance(self.target, Usable):
-            self.parser.last_error_message = f"You can't use the {self.target_name}."
+            self.context.last_error_message = f"You can't use the {self.target_name}."
             return False
         if not self.target.is_being_used_by(self.character):
-            self.parser.last_error_message = f"You're not using the {self.target_name}."
+            self.context.last_error_message = f"You're not using the {self.target_name}."
             return False
         return True
     def apply_effects(self):
@@ -270,10 +271,10 @@ class GenericTakeAction(Action):
             if item.get_property("gettable", False):
                 combinations.append({"target": item_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse target from command
         self.target = None
         self.target_name = ""
@@ -299,11 +300,11 @@ class GenericTakeAction(Action):
                             break
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't see a {self.target_name} here."
+            self.context.last_error_message = f"You don't see a {self.target_name} here."
             return False
         # Check if item can be taken (default to False for safety)
         if not self.target.get_property("gettable", False):
-            self.parser.last_error_message = f"You can't take the {self.target_name}."
+            self.context.last_error_message = f"You can't take the {self.target_name}."
             return False
         return True
     def apply_effects(self):
@@ -339,10 +340,10 @@ class GenericDropAction(Action):
         for item_name in character.inventory:
             combinations.append({"target": item_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse target from command
         self.target = None
         self.target_name = ""
@@ -357,7 +358,7 @@ class GenericDropAction(Action):
             self.target = self.character.inventory[self.target_name]
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't have a {self.target_name}."
+            self.context.last_error_message = f"You don't have a {self.target_name}."
             return False
         return True
     def apply_effects(self):
@@ -401,10 +402,10 @@ class GenericPlaceAction(Action):
                 if recipient != character and isinstance(recipient, Recipient):
                     combinations.append({"target": item_name, "recipient": recipient_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse target and recipient from command
         self.target = None
         self.target_name = ""
@@ -434,14 +435,14 @@ class GenericPlaceAction(Action):
                     self.recipient = location.characters[self.recipient_name]
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't have a {self.target_name}."
+            self.context.last_error_message = f"You don't have a {self.target_name}."
             return False
         if not self.recipient:
-            self.parser.last_error_message = f"You don't see a {self.recipient_name} here."
+            self.context.last_error_message = f"You don't see a {self.recipient_name} here."
             return False
         # Check if recipient can receive items
         if not isinstance(self.recipient, (Container, Recipient)):
-            self.parser.last_error_message = f"You can't put things in/on the {self.recipient_name}."
+            self.context.last_error_message = f"You can't put things in/on the {self.recipient_name}."
             return False
         return True
     def apply_effects(self):
@@ -479,10 +480,10 @@ class GenericConsumeAction(Action):
             if isinstance(item, Consumable):
                 combinations.append({"target": item_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse target from command
         self.target = None
         self.target_name = ""
@@ -497,10 +498,10 @@ class GenericConsumeAction(Action):
             self.target = self.character.inventory[self.target_name]
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't have a {self.target_name}."
+            self.context.last_error_message = f"You don't have a {self.target_name}."
             return False
         if not isinstance(self.target, Consumable):
-            self.parser.last_error_message = f"You can't consume the {self.target_name}."
+            self.context.last_error_message = f"You can't consume the {self.target_name}."
             return False
         return True
     def apply_effects(self):
@@ -545,10 +546,10 @@ class GenericExamineAction(Action):
         for item_name in character.inventory:
             combinations.append({"target": item_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse target from command
         self.target = None
         self.target_name = ""
@@ -573,15 +574,15 @@ class GenericExamineAction(Action):
                     self.target = self.character.inventory[self.target_name]
     def check_preconditions(self) -> bool:
         if not self.target:
-            self.parser.last_error_message = f"You don't see a {self.target_name} here."
+            self.context.last_error_message = f"You don't see a {self.target_name} here."
             return False
         return True
     def apply_effects(self):
         try:
             # Ensure target exists (should be guaranteed by preconditions)
             if self.target is None:
-                self.parser.last_error_message = f"You don't see a {self.target_name} here."
-                return ActionResult(description=self.parser.last_error_message)
+                self.context.last_error_message = f"You don't see a {self.target_name} here."
+                return ActionResult(description=self.context.last_error_message)
             # Use object's examine capability if available, otherwise basic description
             if isinstance(self.target, Examinable):
                 result = self.target.examine(self.character)
@@ -617,10 +618,10 @@ class MoveAction(Action):
         for direction in location.connections.keys():
             combinations.append({"direction": direction})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.lower().strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse direction from command using existing parser logic
         self.direction = None
         self.target_location = None
@@ -633,14 +634,14 @@ class MoveAction(Action):
                 self.target_location = current_location.connections[self.direction]
     def check_preconditions(self) -> bool:
         if not self.direction:
-            self.parser.last_error_message = f"No valid direction found in command '{self.command}'"
+            self.context.last_error_message = f"No valid direction found in command '{self.command}'"
             return False
         if not self.target_location:
-            self.parser.last_error_message = f"You can't go {self.direction} from here."
+            self.context.last_error_message = f"You can't go {self.direction} from here."
             return False
         current_location = self.character.location
         if current_location and current_location.is_blocked(self.direction):
-            self.parser.last_error_message = f"The way {self.direction} is blocked."
+            self.context.last_error_message = f"The way {self.direction} is blocked."
             return False
         return True
     def apply_effects(self):
@@ -680,10 +681,10 @@ class EnhancedLookAction(Action):
     def get_applicable_combinations(cls, character, parser):
         """Look is always available"""
         return [{}]
-    def __init__(self, game, command: str = ""):
-        super().__init__(game)
+    def __init__(self, game, command: str = "", context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command
-        self.character = self.parser.get_character(command) if command else game.player_character
+        self.character = self.get_character(command) if command else self.context.actor
     def check_preconditions(self) -> bool:
         return True
     def apply_effects(self):
@@ -770,10 +771,10 @@ class GenericChatRequestAction(Action):
             if char.location == location and char.name != character.name:
                 combinations.append({"recipient": char_name})
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse recipient and message from command
         self.recipient = None
         self.message = ""
@@ -787,14 +788,14 @@ class GenericChatRequestAction(Action):
                 self.recipient = self.game.characters[recipient_name]
     def check_preconditions(self) -> bool:
         if not self.recipient:
-            self.parser.last_error_message = "You need to specify a valid recipient."
+            self.context.last_error_message = "You need to specify a valid recipient."
             return False
         if not self.message:
-            self.parser.last_error_message = "You need to provide a message explaining why you want to chat."
+            self.context.last_error_message = "You need to provide a message explaining why you want to chat."
             return False
         # Check if recipient is in the same location
         if self.recipient.location != self.character.location:
-            self.parser.last_error_message = f"{self.recipient.name} is not here."
+            self.context.last_error_message = f"{self.recipient.name} is not here."
             return False
         return True
     def apply_effects(self):
@@ -856,10 +857,10 @@ class GenericChatResponseAction(Action):
                 "response": "reject"
             })
         return combinations
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse request_id and response from command
         self.request_id = ""
         self.accepted = False
@@ -871,21 +872,21 @@ class GenericChatResponseAction(Action):
             self.accepted = response in ["accept", "yes", "true"]
     def check_preconditions(self) -> bool:
         if not self.request_id:
-            self.parser.last_error_message = "You need to specify a request ID."
+            self.context.last_error_message = "You need to specify a request ID."
             return False
         # Check if chat manager exists
         if not hasattr(self.game, 'agent_manager') or not hasattr(self.game.agent_manager, 'chat_manager'):
-            self.parser.last_error_message = "Chat system not available."
+            self.context.last_error_message = "Chat system not available."
             return False
         # Check if the request exists
         chat_manager = self.game.agent_manager.chat_manager
         request = chat_manager.get_request_by_id(self.request_id)
         if not request:
-            self.parser.last_error_message = f"No chat request found with ID: {self.request_id}"
+            self.context.last_error_message = f"No chat request found with ID: {self.request_id}"
             return False
         # Check if this agent is the recipient
         if request.recipient_id != self.character.name:
-            self.parser.last_error_message = "You can only respond to your own chat requests."
+            self.context.last_error_message = "You can only respond to your own chat requests."
             return False
         return True
     def apply_effects(self):
@@ -940,10 +941,10 @@ class GenericChatAction(Action):
         if conversation_partner:
             return [{"recipient": conversation_partner}]
         return []
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command.strip()
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         # Parse recipient and message from command
         self.recipient = None
         self.message = ""
@@ -957,26 +958,26 @@ class GenericChatAction(Action):
                 self.recipient = self.game.characters[recipient_name]
     def check_preconditions(self) -> bool:
         if not self.recipient:
-            self.parser.last_error_message = "You need to specify a valid recipient."
+            self.context.last_error_message = "You need to specify a valid recipient."
             return False
         if not self.message:
-            self.parser.last_error_message = "You need to provide a message."
+            self.context.last_error_message = "You need to provide a message."
             return False
         # Check if recipient is in the same location
         if self.recipient.location != self.character.location:
-            self.parser.last_error_message = f"{self.recipient.name} is not here."
+            self.context.last_error_message = f"{self.recipient.name} is not here."
             return False
         # Check if there's an active conversation
         if not hasattr(self.game, 'agent_manager') or not hasattr(self.game.agent_manager, 'chat_manager'):
-            self.parser.last_error_message = "Chat system not available."
+            self.context.last_error_message = "Chat system not available."
             return False
         chat_manager = self.game.agent_manager.chat_manager
         conversation_partner = chat_manager.get_conversation_partner(self.character.name)
         if not conversation_partner:
-            self.parser.last_error_message = "You need to have an accepted chat request before sending messages."
+            self.context.last_error_message = "You need to have an accepted chat request before sending messages."
             return False
         if conversation_partner != self.recipient.name:
-            self.parser.last_error_message = f"You can only chat with {conversation_partner} right now."
+            self.context.last_error_message = f"You can only chat with {conversation_partner} right now."
             return False
         return True
     def apply_effects(self):
@@ -1,3 +1,4 @@
+from typing import Optional
 from . import base
 from ...config.schema import GoToAction
 
@@ -28,10 +29,11 @@ class Go(base.Action):
         self,
         game,
         command: str,
+        context: Optional[base.ExecutionContext] = None,
         # location: Location, direction: str
     ):
-        super().__init__(game)
-        self.character = self.parser.get_character(command)
+        super().__init__(game, context)
+        self.character = self.get_character(command)
         self.location = self.character.location
         self.direction = self.parser.get_direction(command, self.location)
         self.command = command
@@ -48,7 +50,7 @@ class Go(base.Action):
                 name=self.character.capitalize(),
                 location_name=self.location.name.capitalize(),
             )
-            self.parser.last_error_message = message
+            self.context.last_error_message = message
             return False
 
         if not self.location.get_connection(self.direction):
@@ -56,7 +58,7 @@ class Go(base.Action):
             description = d.format(
                 location_name=self.location.name.capitalize(), direction=self.direction
             )
-            self.parser.last_error_message = description
+            self.context.last_error_message = description
             return False
 
         if self.location.is_blocked(self.direction):
@@ -67,7 +69,7 @@ class Go(base.Action):
                     location_name=self.location.name.capitalize(),
                     direction=self.direction,
                 )
-            self.parser.last_error_message = description
+            self.context.last_error_message = description
             return False
 
         return True
@@ -76,7 +78,8 @@ class Go(base.Action):
         """
         Moves a character. (Assumes that the preconditions are met.)
         """
-        is_main_player = self.character == self.game.player
+        # Whether the acting character moves itself (not a character named in the command)
+        is_main_player = self.character == self.context.actor
 
         # move from
         from_loc = self.location
@@ -95,7 +98,7 @@ class Go(base.Action):
         # )
 
         # Some locations finish game
-        if to_loc.get_property("game_over") and is_main_player:
+        if to_loc.get_property("game_over", False) and is_main_player:
             self.game.game_over = True
             self.game.game_over_description = to_loc.description
             return base.ActionResult(description=to_loc.description)
@@ -103,8 +106,10 @@ class Go(base.Action):
             # Create proper GoToAction schema
             move_action = GoToAction(action_type="go_to", target=to_loc.name)
             
-            # Get description from Describe action
-            action = base.Look(self.game, command=self.command)
+            # Get description from Describe action (of the moved character's new room;
+            # a separate context keeps this execution's action and result)
+            action = base.Look(self.game, command=self.command,
+                               context=base.ExecutionContext(actor=self.character))
             look_result = action()
             
             # Extract description from ActionResult
@@ -7,6 +7,7 @@ import inspect
 from typing import Type
 from backend.text_adventure_games.things import Character
 from backend.text_adventure_games import actions
+from backend.text_adventure_games.actions.base import ExecutionContext
 
 
 def test_action_preconditions(action_class: Type[actions.Action], command: str, character: Character, parser) -> bool:
@@ -24,24 +25,19 @@ def test_action_preconditions(action_class: Type[actions.Action], command: str,
     """
     
     try:
-        # Temporarily set the game player to the specified character for action instantiation
-        original_player = parser.game.player
-        parser.game.player = character
+        # The probe gets its own context, so it never touches shared game or parser state
+        context = ExecutionContext(actor=character)
         
+        # Create a temporary instance of the action
+        # Most actions now take (game, command, context) as parameters
         try:
-            # Create a temporary instance of the action
-            # Most actions now take (game, command) as parameters
-            try:
-                action_instance = action_class(parser.game, command)  # type: ignore
-            except TypeError:
-                # Fall back to single argument constructor for legacy actions
-                action_instance = action_class(parser.game)  # type: ignore
-            
-            # Test its preconditions
-            result = action_instance.check_preconditions()
-        finally:
-            # Always restore the original player
-            parser.game.player = original_player
+            action_instance = action_class(parser.game, command, context)  # type: ignore
+        except TypeError:
+            # Fall back to the context-only constructor for legacy actions
+            action_instance = action_class(parser.game, context=context)  # type: ignore
+        
+        # Test its preconditions
+        result = action_instance.check_preconditions()
         
         # Debug logging for Get action failures
         logger = logging.getLogger(__name__)
@@ -52,7 +48,7 @@ def test_action_preconditions(action_class: Type[actions.Action], command: str,
                 logger.debug(f"Character: {character.name} at {character.location.name}")
             else:
                 logger.debug(f"Character: {character.name} at unknown location")
-            logger.debug(f"Parser last error: {parser.last_error_message}")
+            logger.debug(f"Last error: {context.last_error_message}")
             
             # Try to understand what failed by checking each condition manually
             if hasattr(action_instance, 'item'):
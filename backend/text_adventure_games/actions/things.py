@@ -1,3 +1,4 @@
+from typing import Optional
 from . import base
 from ...config.schema import TakeAction, DropAction
 from ..utils import remove_item_safely
@@ -9,9 +10,9 @@ class Get(base.Action):
     ACTION_ALIASES = ["take"]
     COMMAND_PATTERNS = ["get {item}"]
 
-    def __init__(self, game, command: str):
-        super().__init__(game)
-        self.character = self.parser.get_character(command)
+    def __init__(self, game, command: str, context: Optional[base.ExecutionContext] = None):
+        super().__init__(game, context)
+        self.character = self.get_character(command)
         self.location = self.character.location
         self.item = self.parser.match_item(command, self.location.items)
 
@@ -25,21 +26,21 @@ class Get(base.Action):
         """
         if not self.was_matched(self.item, "I don't see it."):
             message = "I don't see it."
-            self.parser.last_error_message = message
+            self.context.last_error_message = message
             return False
         if not self.location.here(self.character):
             message = "{name} is not here.".format(name=self.character.name)
-            self.parser.last_error_message = message
+            self.context.last_error_message = message
             return False
         if not self.location.here(self.item):
             message = "There is no {name} here.".format(name=self.item.name)
-            self.parser.last_error_message = message
+            self.context.last_error_message = message
             return False
         if not self.item.get_property("gettable"):
             error_message = "{name} is not {property_name}.".format(
                 name=self.item.name.capitalize(), property_name="gettable"
             )
-            self.parser.last_error_message = error_message
+            self.context.last_error_message = error_message
             return False
         return True
 
@@ -73,9 +74,10 @@ class Drop(base.Action):
         self,
         game,
         command: str,
+        context: Optional[base.ExecutionContext] = None,
     ):
-        super().__init__(game)
-        self.character = self.parser.get_character(command)
+        super().__init__(game, context)
+        self.character = self.get_character(command)
         self.location = self.character.location
         self.item = self.parser.match_item(command, self.character.inventory)
 
@@ -91,7 +93,7 @@ class Drop(base.Action):
             description = d.format(
                 character_name=self.character.name, item_name=self.item.name
             )
-            self.parser.last_error_message = description
+            self.context.last_error_message = description
             return False
         return True
 
@@ -132,9 +134,10 @@ class Inventory(base.Action):
         self,
         game,
         command: str,
+        context: Optional[base.ExecutionContext] = None,
     ):
-        super().__init__(game)
-        self.character = self.parser.get_character(command)
+        super().__init__(game, context)
+        self.character = self.get_character(command)
 
     def check_preconditions(self) -> bool:
         if self.character is None:
@@ -165,9 +168,10 @@ class Examine(base.Action):
         self,
         game,
         command: str,
+        context: Optional[base.ExecutionContext] = None,
     ):
-        super().__init__(game)
-        self.character = self.parser.get_character(command)
+        super().__init__(game, context)
+        self.character = self.get_character(command)
         self.matched_item = self.parser.match_item(
             command, self.parser.get_items_in_scope(self.character)
         )
@@ -201,8 +205,8 @@ class Give(base.Action):
     ACTION_ALIASES = ["hand"]
     COMMAND_PATTERNS = ["give {item} to {character}"]
 
-    def __init__(self, game, command: str):
-        super().__init__(game)
+    def __init__(self, game, command: str, context: Optional[base.ExecutionContext] = None):
+        super().__init__(game, context)
         give_words = ["give", "hand"]
         command_before_word = ""
         command_after_word = command
@@ -213,8 +217,8 @@ class Give(base.Action):
                 command_before_word = parts[0]
                 command_after_word = parts[1]
                 break
-        self.giver = self.parser.get_character(command_before_word)
-        self.recipient = self.parser.get_character(command_after_word)
+        self.giver = self.get_character(command_before_word)
+        self.recipient = self.get_character(command_after_word)
         self.item = self.parser.match_item(command, self.giver.inventory)
 
     def check_preconditions(self) -> bool:
@@ -259,10 +263,10 @@ class Unlock_Door(base.Action):
     ACTION_NAME = "unlock door"
     ACTION_DESCRIPTION = "Unlock a door"
 
-    def __init__(self, game, command):
-        super().__init__(game)
+    def __init__(self, game, command, context: Optional[base.ExecutionContext] = None):
+        super().__init__(game, context)
         self.command = command
-        self.character = self.parser.get_character(command)
+        self.character = self.get_character(command)
         self.key = self.parser.match_item(
             "key", self.parser.get_items_in_scope(self.character)
         )
@@ -2,14 +2,97 @@
 Item and object matching utilities for command processing.
 """
 
-from typing import Dict, Optional
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
 from backend.text_adventure_games.things import Item, Character, Location
 
 
+# Names and commands are compared as sequences of word tokens
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Split text into lower-case word tokens."""
+    return tuple(_TOKEN_RE.findall(text.lower()))
+
+
+class NameIndex:
+    """
+    Token index over entity names for matching names in commands.
+    
+    Names are indexed by their first token, so finding every name mentioned in
+    a command takes a single pass over the command's tokens instead of a
+    substring scan per name. When several names match, the longest one wins
+    ("coffee table" over "table"); ties go to the name added first.
+    """
+    
+    def __init__(self, names: Iterable[str] = ()):
+        # first token -> [(name tokens, name)]
+        self._by_first_token: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        # name -> insertion order, for tie breaking
+        self._order: Dict[str, int] = {}
+        for name in names:
+            self.add(name)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._order
+    
+    def add(self, name: str):
+        """Index a name (no-op if it is already indexed)."""
+        tokens = tokenize(name)
+        if name in self._order or not tokens:
+            return
+        self._order[name] = len(self._order)
+        self._by_first_token.setdefault(tokens[0], []).append((tokens, name))
+    
+    def remove(self, name: str):
+        """Remove a name from the index."""
+        if self._order.pop(name, None) is None:
+            return
+        tokens = tokenize(name)
+        entries = self._by_first_token.get(tokens[0], [])
+        entries[:] = [entry for entry in entries if entry[1] != name]
+        if not entries:
+            self._by_first_token.pop(tokens[0], None)
+    
+    def find(self, command: str) -> Optional[str]:
+        """Return the longest indexed name mentioned in the command, or None."""
+        words = tokenize(command)
+        best_name = None
+        best_rank = None
+        for start, word in enumerate(words):
+            for tokens, name in self._by_first_token.get(word, ()):
+                if words[start:start + len(tokens)] != tokens:
+                    continue
+                rank = (len(tokens), len(name), -self._order[name])
+                if best_rank is None or rank > best_rank:
+                    best_name, best_rank = name, rank
+        return best_name
+
+
+class ItemScope(dict):
+    """
+    Items in a character's scope (name -> Item) with a name index that is
+    built on first use and reused for every match against this scope.
+    """
+    
+    _name_index: Optional[NameIndex] = None
+    
+    @property
+    def name_index(self) -> NameIndex:
+        if self._name_index is None:
+            self._name_index = NameIndex(self.keys())
+        return self._name_index
+
+
 def match_item(command: str, item_dict: Dict[str, Item]) -> Item:
     """
     Check whether the name any of the items in this dictionary match the
-    command. If so, return Item, else raise ValueError.
+    command. If so, return Item, else raise ValueError. When several item
+    names match, the longest one wins.
     
     Args:
         command: The command string to search for item names
@@ -21,10 +104,13 @@ def match_item(command: str, item_dict: Dict[str, Item]) -> Item:
     Raises:
         ValueError: If no item matches the command
     """
-    for item_name in item_dict:
-        if item_name in command:
-            item = item_dict[item_name]
-            return item
+    if isinstance(item_dict, ItemScope):
+        index = item_dict.name_index
+    else:
+        index = NameIndex(item_dict.keys())
+    item_name = index.find(command)
+    if item_name is not None:
+        return item_dict[item_name]
     raise ValueError(f"No item found matching '{command}'")
 
 
@@ -32,6 +118,10 @@ def get_items_in_scope(character: Optional[Character] = None, game=None) -> Dict
     """
     Returns a list of items in character's location, their inventory, and in open containers in the location (recursively).
     
+    The scope is cached per character on the game and rebuilt only when the
+    contents revision of the character or its location changes, so callers
+    must treat the returned dict as read-only.
+    
     Args:
         character: The character to get items for (defaults to game player)
         game: The game instance
@@ -52,6 +142,14 @@ def get_items_in_scope(character: Optional[Character] = None, game=None) -> Dict
         
     assert character.location is not None, f"Character {character.name} has no location"
     
+    scope_cache = getattr(game, '_item_scope_cache', None)
+    revision_key = (character.location, character.location.contents_revision, character.contents_revision)
+    if scope_cache is not None:
+        cached = scope_cache.get(character.name)
+        if cached is not None and cached[0] == revision_key:
+            return cached[1]
+    
+    items_in_scope = ItemScope()
     for item_name, item in character.location.items.items():
         items_in_scope[item_name] = item
         # If the item is a container and open, add its contents
@@ -70,26 +168,38 @@ def get_items_in_scope(character: Optional[Character] = None, game=None) -> Dict
     for item_name, item in character.inventory.items():
         items_in_scope[item_name] = item
     
+    if scope_cache is not None:
+        scope_cache[character.name] = (revision_key, items_in_scope)
     return items_in_scope
 
 
-def get_character_from_command(command: str, game) -> Character:
+def get_character_from_command(command: str, game, default: Optional[Character] = None) -> Character:
     """
     This method tries to match a character's name in the command.
-    If no names are matched, it returns the player character.
+    If no names are matched, it returns the default character (the acting
+    character of an execution) or, failing that, the player character.
     
     Args:
         command: The command string to search for character names
         game: The game instance
+        default: Character to return when no name matches
         
     Returns:
-        Character: The matched character or player character
+        Character: The matched character or the default/player character
     """
+    if default is None:
+        default = game.player
+    
+    index = getattr(game, 'character_index', None)
+    if index is not None:
+        name = index.find(command)
+        return game.characters[name] if name is not None else default
+    
     command = command.lower()
     for name in game.characters.keys():
         if name.lower() in command:
             return game.characters[name]
-    return game.player
+    return default
 
 
 def get_direction_from_command(command: str, location: Location) -> Optional[str]:
@@ -5,8 +5,10 @@ Core command parsing and intent detection.
 from typing import Optional
 from backend.text_adventure_games.things import Character
 from backend.text_adventure_games import actions
+from backend.text_adventure_games.actions.base import ActionResult, ExecutionContext
 from backend.text_adventure_games.actions.generic import MoveAction
 from .matcher import get_character_from_command, get_direction_from_command
+from .patterns import get_command_table
 
 
 class CommandParser:
@@ -31,19 +33,20 @@ class CommandParser:
         """
         self.blocks[block.__class__.__name__] = block
 
-    def determine_intent(self, command: str):
+    def determine_intent(self, command: str, actor: Optional[Character] = None):
         """
         This function determines what command the player wants to do.
         Only handles sequences and directions - all other actions use pattern-based discovery.
         
         Args:
             command: The command string to analyze
+            actor: The acting character (defaults to the player)
             
         Returns:
             str: The intent ("sequence", "direction", or None)
         """
-        # check which character is acting (defaults to the player)
-        character = get_character_from_command(command, self.game)
+        # check which character is acting
+        character = get_character_from_command(command, self.game, default=actor)
         command = command.lower()
         if "," in command:
             # Let the player type in a comma separted sequence of commands
@@ -53,13 +56,14 @@ class CommandParser:
             return "direction"
         return None
 
-    def parse_action(self, command: str) -> actions.Action:
+    def parse_action(self, command: str, context: Optional[ExecutionContext] = None) -> actions.Action:
         """
         Routes an action described in a command to the right action class for
         performing the action. Uses only pattern-based discovery.
         
         Args:
             command: The command string to parse
+            context: Execution context of the action (defaults to one for the player)
             
         Returns:
             actions.Action: The parsed action instance
@@ -67,78 +71,86 @@ class CommandParser:
         Raises:
             ValueError: If no action can be found for the command
         """
+        if context is None:
+            context = ExecutionContext(actor=self.game.player)
+        
         command = command.lower().strip()
         if command == "":
             raise ValueError("Empty command provided")
             
-        intent = self.determine_intent(command)
+        intent = self.determine_intent(command, context.actor)
         if intent == "sequence":
-            return actions.ActionSequence(self.game, command)
+            return actions.ActionSequence(self.game, command, context)
         elif intent == "direction":
-            return MoveAction(self.game, command)
+            return MoveAction(self.game, command, context)
         else:
-            # Use pattern-based discovery for all other actions
-            action_classes = self.discover_action_classes()
-            for action_class in action_classes:
-                patterns = action_class.get_command_patterns()
-                for pattern in patterns:
-                    # Check if command matches pattern (basic word matching)
-                    pattern_words = pattern.lower().split()
-                    command_words = command.split()
-                    if len(command_words) >= len(pattern_words):
-                        # Check if non-placeholder words match
-                        matches = True
-                        for i, pattern_word in enumerate(pattern_words):
-                            if not pattern_word.startswith('{') and not pattern_word.endswith('}'):
-                                if i >= len(command_words) or command_words[i] != pattern_word:
-                                    matches = False
-                                    break
-                        if matches:
-                            return action_class(self.game, command)
+            # Use the compiled pattern table for all other actions
+            action_class = get_command_table().match(command)
+            if action_class is not None:
+                return action_class(self.game, command, context)
             
-        self.last_error_message = f"No action found for {command}"
+        context.last_error_message = f"No action found for {command}"
         raise ValueError(f"No action found for {command}")
 
-    def parse_command(self, command: str, character: Optional[Character] = None):
+    def parse_command(self, command: str, character: Optional[Character] = None,
+                      context: Optional[ExecutionContext] = None):
         """
         Parse and execute a command, optionally for a specific character.
         
+        The acting character, error message and result travel in an
+        ExecutionContext instead of game-level state, so commands for
+        different characters can be executed or probed independently.
+        
         Args:
             command: The command string to parse
             character: Optional character to execute the command (defaults to player)
+            context: Optional execution context that receives the action and result
             
         Returns:
             ActionResult: The result of executing the action
         """
-        # Set the acting character for this command
-        original_player = self.game.player
-        if character:
-            self.game.player = character
+        if context is None:
+            context = ExecutionContext(actor=character or self.game.player)
+        elif context.actor is None:
+            context.actor = character or self.game.player
+        
+        action = self.parse_action(command, context)
+        if not action:
+            context.last_error_message = "I'm not sure what you want to do."
+            result = ActionResult(description=context.last_error_message)
+            context.result = result
+        else:
+            result = action()
+            # All actions now return ActionResult directly
+            if not hasattr(result, 'description'):
+                # Fallback - create ActionResult from string
+                result = ActionResult(description=str(result))
+                context.result = result
         
+        # Mirror the outcome into the legacy game-level slots
+        self.last_error_message = context.last_error_message
+        self.game._last_executed_action = context.action
+        self.game._last_action_result = result
+        self.game._last_action_agent_id = context.actor.name
+        return result
+
+    def check_command(self, command: str, character: Optional[Character] = None) -> bool:
+        """
+        Check whether a command would currently succeed without executing it.
+        
+        Args:
+            command: The command string to check
+            character: Optional character that would execute the command (defaults to player)
+            
+        Returns:
+            bool: True if the command parses and its preconditions are satisfied
+        """
+        context = ExecutionContext(actor=character or self.game.player)
         try:
-            action = self.parse_action(command)
-            if not action:
-                self.last_error_message = "I'm not sure what you want to do."
-                from backend.text_adventure_games.actions.base import ActionResult
-                result = ActionResult(description=self.last_error_message or "I'm not sure what you want to do.")
-                return result
-            else:
-                # Store the action instance for turn management
-                self.game._last_executed_action = action
-                result = action()
-                # All actions now return ActionResult directly
-                if not hasattr(result, 'description'):
-                    # Fallback - create ActionResult from string
-                    from backend.text_adventure_games.actions.base import ActionResult
-                    result = ActionResult(description=str(result))
-                
-                # Record the last acting agent's id for schema export
-                if hasattr(self.game, '_last_action_agent_id'):
-                    self.game._last_action_agent_id = self.game.player.name
-                    
-                return result
-        finally:
-            self.game.player = original_player
+            action = self.parse_action(command, context)
+            return bool(action) and bool(action.check_preconditions())
+        except Exception:
+            return False
 
     def discover_action_classes(self):
         """
@@ -0,0 +1,110 @@
+"""
+Compiled command patterns for action dispatch.
+
+The COMMAND_PATTERNS of all discoverable action classes are compiled once into
+a token trie. Literal pattern words become labelled edges and placeholders
+(words like "{target}") become wildcard edges, so dispatching a command costs
+time proportional to the command length instead of re-splitting every pattern
+of every action class per command.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+
+# Edge label used for placeholder words
+WILDCARD = None
+
+
+def _is_placeholder(word: str) -> bool:
+    """A pattern word is a placeholder if it starts with '{' or ends with '}'."""
+    return word.startswith('{') or word.endswith('}')
+
+
+class _TrieNode:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        # Pattern word (or WILDCARD) -> child node
+        self.children: Dict[Optional[str], "_TrieNode"] = {}
+        # (priority, action class) of the highest priority pattern ending here
+        self.terminal: Optional[Tuple[int, Type]] = None
+
+
+class CommandPatternTable:
+    """
+    Token trie over the command patterns of a list of action classes.
+
+    Matching follows the same rules as the original pattern loop: every literal
+    pattern word must equal the command word at the same position, placeholders
+    match any single word, and the command may have extra trailing words. When
+    several patterns match, the one listed first (by class, then by pattern)
+    wins.
+    """
+
+    def __init__(self, action_classes: List[Type]):
+        self.action_classes = list(action_classes)
+        self._root = _TrieNode()
+
+        # Patterns per action class, in their original form for command generation
+        self.patterns: Dict[Type, List[str]] = {}
+
+        priority = 0
+        for action_class in self.action_classes:
+            patterns = list(action_class.get_command_patterns())
+            self.patterns[action_class] = patterns
+            for pattern in patterns:
+                self._insert(pattern, priority, action_class)
+                priority += 1
+
+    def _insert(self, pattern: str, priority: int, action_class: Type):
+        node = self._root
+        for word in pattern.lower().split():
+            label = WILDCARD if _is_placeholder(word) else word
+            node = node.children.setdefault(label, _TrieNode())
+        if node.terminal is None or priority < node.terminal[0]:
+            node.terminal = (priority, action_class)
+
+    def match(self, command: str) -> Optional[Type]:
+        """
+        Return the action class whose pattern matches the command, or None.
+
+        Args:
+            command: A lower-cased, stripped command string
+        """
+        words = command.split()
+        best: Optional[Tuple[int, Type]] = None
+
+        # Walk literal and wildcard edges side by side; a pattern matches as
+        # soon as its last word is consumed (extra command words are allowed)
+        frontier = [self._root]
+        for depth in range(len(words) + 1):
+            next_frontier = []
+            for node in frontier:
+                if node.terminal is not None and (best is None or node.terminal[0] < best[0]):
+                    best = node.terminal
+                if depth == len(words):
+                    continue
+                literal_child = node.children.get(words[depth])
+                if literal_child is not None:
+                    next_frontier.append(literal_child)
+                wildcard_child = node.children.get(WILDCARD)
+                if wildcard_child is not None:
+                    next_frontier.append(wildcard_child)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return best[1] if best else None
+
+    def iter_patterns(self):
+        """Yield (action class, patterns) pairs in priority order."""
+        for action_class in self.action_classes:
+            yield action_class, self.patterns[action_class]
+
+
+@lru_cache(maxsize=1)
+def get_command_table() -> CommandPatternTable:
+    """Return the compiled pattern table for all discoverable action classes."""
+    from backend.text_adventure_games.actions.discovery import discover_action_classes
+    return CommandPatternTable(discover_action_classes())
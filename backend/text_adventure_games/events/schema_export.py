@@ -3,6 +3,7 @@ Schema conversion utilities for action results.
 """
 
 from datetime import datetime
+from typing import Optional
 from backend.config.schema import AgentActionOutput
 
 
@@ -14,32 +15,42 @@ class SchemaExporter:
     def __init__(self, game):
         self.game = game
     
-    def get_schema(self) -> AgentActionOutput:
+    def get_schema(self, context=None) -> AgentActionOutput:
         """
-        Export the last action as an AgentActionOutput schema object.
+        Export an action as an AgentActionOutput schema object.
         The description is narrative and user-friendly for the GUI chat, while the reason in NoOpAction remains technical.
         
+        Args:
+            context: ExecutionContext of the action to export (defaults to the game's last action)
+        
         Returns:
-            AgentActionOutput: Schema object representing the last action
+            AgentActionOutput: Schema object representing the action
             
         Raises:
             RuntimeError: If no action has been taken yet
         """
-        if not self.game._last_action_result or not self.game._last_action_agent_id:
+        if context is not None:
+            action_result = context.result
+            agent_id: Optional[str] = context.actor.name if context.actor else None
+        else:
+            action_result = self.game._last_action_result
+            agent_id = self.game._last_action_agent_id
+        
+        if not action_result or not agent_id:
             raise RuntimeError("No action has been taken yet.")
             
-        agent = self.game.characters.get(self.game._last_action_agent_id)
+        agent = self.game.characters.get(agent_id)
         current_room = agent.location.name if agent and agent.location else None
         
         # Compose a technical, GUI-friendly description
         # 1. Always include the action type and affected object (if any)
-        action_type = getattr(self.game._last_action_result.house_action, 'action_type', 'noop')
-        affected_object = self.game._last_action_result.object_id
+        action_type = getattr(action_result.house_action, 'action_type', 'noop')
+        affected_object = action_result.object_id
         
         # 2. For NoOp, treat as non-fatal error with informative feedback
         if action_type == 'noop':
             # Get the actual reason from the action result
-            action_reason = getattr(self.game._last_action_result.house_action, 'reason', 'Unknown command or invalid action')
+            action_reason = getattr(action_result.house_action, 'reason', 'Unknown command or invalid action')
             
             # Create error-focused description for agents
             description = f"ACTION FAILED: {action_reason}"
@@ -63,7 +74,7 @@ class SchemaExporter:
             reason = action_reason
         else:
             # For real actions, use the action result's description (assumed user-facing)
-            description = self.game._last_action_result.description
+            description = action_result.description
             reason = None
             
         # Context for frontend (not in main description)
@@ -76,12 +87,12 @@ class SchemaExporter:
             available_exits = [f"{direction} to {destination.name}" for direction, destination in agent.location.connections.items()]
             
         # Patch the NoOpAction reason if needed
-        action_obj = self.game._last_action_result.house_action
+        action_obj = action_result.house_action
         if action_type == 'noop' and hasattr(action_obj, 'reason'):
             action_obj.reason = reason
             
         return AgentActionOutput(
-            agent_id=self.game._last_action_agent_id,
+            agent_id=agent_id,
             action=action_obj,
             timestamp=datetime.now().isoformat(),
             current_room=current_room,
@@ -3,6 +3,10 @@ from . import parsing
 from .state.world_state import WorldStateManager
 from .state.character_manager import CharacterManager
 from .state.descriptions import DescriptionManager
+from .state.revisions import RevisionTracker
+from .state.fork import GameFork
+from .actions.discovery import AvailableActionsCache
+from .command.matcher import NameIndex
 from .events.event_manager import EventManager
 from .events.schema_export import SchemaExporter
 
@@ -63,8 +67,14 @@ class Game:
         self.current_agent_index = 0
         self.turn_order = []
 
+        # Journal of changed things for incremental world state updates
+        self.revision_tracker = RevisionTracker()
+
         # Add player to game and put them on starting point
         self.characters = {}
+        self.character_index = NameIndex()
+        # Character name -> (revision key, items in scope), see command.matcher
+        self._item_scope_cache = {}
         self.add_character(player)
         self.start_at.add_character(player)
         self.start_at.has_been_visited = True
@@ -78,15 +88,22 @@ class Game:
                     err_msg = f"ERROR: invalid character ({c})"
                     raise Exception(err_msg)
 
-        # Look up table for locations
-        def location_map(location, acc):
-            acc[location.name] = location
-            for _, connection in location.connections.items():
-                if connection.name not in acc:
-                    acc = location_map(connection, acc)
+        # Look up table for locations (depth-first from the start; iterative so
+        # generated worlds with thousands of rooms don't hit the recursion limit)
+        def location_map(start):
+            acc = {start.name: start}
+            stack = [iter(start.connections.values())]
+            while stack:
+                connection = next(stack[-1], None)
+                if connection is None:
+                    stack.pop()
+                elif connection.name not in acc:
+                    acc[connection.name] = connection
+                    stack.append(iter(connection.connections.values()))
             return acc
 
-        self.locations = location_map(self.start_at, {})
+        self.locations = location_map(self.start_at)
+        self.revision_tracker.track_all(self.iter_things())
 
         # Parser
         self.parser = parsing.Parser(self)
@@ -95,6 +112,9 @@ class Game:
         self._last_action_agent_id = None
         self._last_executed_action = None  # Track the last executed action instance
 
+        # Cache of available actions, invalidated through thing revisions
+        self.available_actions_cache = AvailableActionsCache()
+
         # NEW: Initialize modular managers
         self.world_state_manager = WorldStateManager(self)
         self.agent_manager = CharacterManager(self)
@@ -130,6 +150,32 @@ class Game:
         Puts characters in the game
         """
         self.characters[character.name] = character
+        self.character_index.add(character.name)
+        self.revision_tracker.track(character)
+
+    def fork(self) -> GameFork:
+        """
+        Open a copy-on-write fork for speculative actions (see state.fork).
+        Changes are discarded when the fork's `with` block ends unless committed.
+        """
+        return GameFork(self)
+
+    def iter_things(self):
+        """
+        Yield every location, character and item in the game, including items
+        inside containers and inventories.
+        """
+        def with_contents(thing):
+            yield thing
+            for item in getattr(thing, 'inventory', {}).values():
+                yield from with_contents(item)
+
+        for location in self.locations.values():
+            yield location
+            for item in location.items.values():
+                yield from with_contents(item)
+        for character in self.characters.values():
+            yield from with_contents(character)
 
     def register_agent(self, character: Character):
         """
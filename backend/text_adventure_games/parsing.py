@@ -47,17 +47,24 @@ class Parser:
         """Adds a block class to the list of blocks a parser can use."""
         return self._command_parser.add_block(block)
 
-    def determine_intent(self, command: str):
+    def determine_intent(self, command: str, actor: Optional[Character] = None):
         """Determine what command the player wants to do."""
-        return self._command_parser.determine_intent(command)
+        return self._command_parser.determine_intent(command, actor)
 
-    def parse_action(self, command: str) -> actions.Action:
+    def parse_action(self, command: str, context: Optional[actions.ExecutionContext] = None) -> actions.Action:
         """Routes an action described in a command to the right action class."""
-        return self._command_parser.parse_action(command)
+        return self._command_parser.parse_action(command, context)
 
-    def parse_command(self, command: str, character: Optional[Character] = None):
+    def parse_command(self, command: str, character: Optional[Character] = None,
+                      context: Optional[actions.ExecutionContext] = None):
         """Parse and execute a command, optionally for a specific character."""
-        return self._command_parser.parse_command(command, character)
+        result = self._command_parser.parse_command(command, character, context)
+        self.last_error_message = self._command_parser.last_error_message
+        return result
+
+    def check_command(self, command: str, character: Optional[Character] = None) -> bool:
+        """Check whether a command would currently succeed without executing it."""
+        return self._command_parser.check_command(command, character)
 
     @staticmethod
     def split_command(command: str, keyword: str) -> tuple[str, str]:
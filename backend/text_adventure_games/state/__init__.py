@@ -6,4 +6,6 @@ This package contains modules for managing game state:
 - world_state: World state queries and utilities
 - character_manager: Character/agent management for game state
 - descriptions: State description utilities
+- snapshot: Whole-game snapshots (dump_game / load_game)
+- fork: Copy-on-write forks for speculative actions (Game.fork)
 """
\ No newline at end of file
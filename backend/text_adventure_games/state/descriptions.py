@@ -11,23 +11,25 @@ class DescriptionManager:
     def __init__(self, game):
         self.game = game
     
-    def describe_current_location(self) -> str:
+    def describe_current_location(self, character=None) -> str:
         """
         Describe the current location by printing its description field.
         """
-        if self.game.player.location is not None:
-            return self.game.player.location.description
+        character = character or self.game.player
+        if character.location is not None:
+            return character.location.description
         else:
-            raise ValueError(f"Player {self.game.player.name} location is None.")
+            raise ValueError(f"Player {character.name} location is None.")
 
-    def describe_exits(self) -> str:
+    def describe_exits(self, character=None) -> str:
         """
         List the directions that the player can take to exit from the current location.
         """
-        if self.game.player.location is not None:
+        character = character or self.game.player
+        if character.location is not None:
             exits = []
-            for direction in self.game.player.location.connections.keys():
-                location = self.game.player.location.connections[direction]
+            for direction in character.location.connections.keys():
+                location = character.location.connections[direction]
                 exits.append(direction.capitalize() + " to " + location.name)
             description = ""
             if len(exits) > 0:
@@ -36,18 +38,19 @@ class DescriptionManager:
                     description += exit + "\n"
             return description
         else:
-            raise ValueError(f"Player {self.game.player.name} location is None.")
+            raise ValueError(f"Player {character.name} location is None.")
 
-    def describe_items(self) -> str:
+    def describe_items(self, character=None) -> str:
         """
         Describe what items are in the current location.
         """
-        if self.game.player.location is not None:
+        character = character or self.game.player
+        if character.location is not None:
             description = ""
-            if len(self.game.player.location.items) > 0:
+            if len(character.location.items) > 0:
                 description = "You see:"
-                for item_name in self.game.player.location.items:
-                    item = self.game.player.location.items[item_name]
+                for item_name in character.location.items:
+                    item = character.location.items[item_name]
                     description += "\n * " + item.description
                     if self.game.give_hints:
                         description += "\n   You can:"
@@ -56,31 +59,32 @@ class DescriptionManager:
                             description += "\n\t" + cmd
             return description
         else:
-            raise ValueError(f"Player {self.game.player.name} location is None.")
+            raise ValueError(f"Player {character.name} location is None.")
 
-    def describe_characters(self) -> str:
+    def describe_characters(self, character=None) -> str:
         """
         Describe what characters are in the current location.
         """
-        if self.game.player.location is not None:
+        character = character or self.game.player
+        if character.location is not None:
             description = ""
-            if len(self.game.player.location.characters) > 1:
+            if len(character.location.characters) > 1:
                 description = "Characters:"
-                for character_name in self.game.player.location.characters:
-                    if character_name == self.game.player.name:
+                for character_name in character.location.characters:
+                    if character_name == character.name:
                         continue
-                    character = self.game.player.location.characters[character_name]
-                    description += "\n * " + character.description
+                    other = character.location.characters[character_name]
+                    description += "\n * " + other.description
             return description
         else:
-            raise ValueError(f"Player {self.game.player.name} location is None.")
+            raise ValueError(f"Player {character.name} location is None.")
     
-    def describe_full_location(self) -> str:
+    def describe_full_location(self, character=None) -> str:
         """
         Describe the complete current game state including location, exits, items, and characters.
         """
-        description = self.describe_current_location() + "\n"
-        description += self.describe_exits() + "\n"
-        description += self.describe_items() + "\n"
-        description += self.describe_characters() + "\n"
+        description = self.describe_current_location(character) + "\n"
+        description += self.describe_exits(character) + "\n"
+        description += self.describe_items(character) + "\n"
+        description += self.describe_characters(character) + "\n"
         return description
\ No newline at end of file
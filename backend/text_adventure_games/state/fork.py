@@ -0,0 +1,136 @@
+"""
+Copy-on-write forks of a game world.
+
+A fork lets callers apply speculative actions to a game, inspect the result
+and then discard it (or keep it) without copying the world up front. Every
+mutation of a Thing goes through Thing._touch(), so while a fork is open the
+first touch of each thing saves a copy of its state; discard() puts those
+copies back, commit() keeps the changes and records them in the revision
+journal. Only the things an action actually changes are ever copied.
+
+Forks are synchronous: do not await while one is open, or other coroutines
+would see the speculative state.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.text_adventure_games.things.base import Thing
+from backend.text_adventure_games.actions.base import ActionResult, ExecutionContext
+
+# Game-level attributes that commands change directly
+_GAME_ATTRIBUTES = ("game_over", "game_over_description", "_last_executed_action",
+                    "_last_action_result", "_last_action_agent_id")
+
+
+class GameFork:
+    """
+    Speculative changes to a game; use Game.fork() to open one.
+
+    Usage:
+        with game.fork() as fork:
+            fork.execute("take apple", character)
+            ...inspect game...
+        # leaving the block discards the changes unless fork.commit() was called
+
+    Forks nest: the innermost open fork records the changes.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.tracker = game.revision_tracker
+        self.parent: Optional["GameFork"] = self.tracker.fork
+        self.active = True
+
+        # id(thing) -> (thing, saved attributes, [(container, saved contents)])
+        self._saved: Dict[int, Tuple[Thing, Dict[str, Any], List[Tuple[Any, Any]]]] = {}
+        # Things in the order they were changed, for the revision journal
+        self._changes: List[Thing] = []
+        self._game_state = {name: getattr(game, name) for name in _GAME_ATTRIBUTES}
+        self._history_length = len(game.game_history)
+        self._parser_error = getattr(game.parser, "last_error_message", None)
+
+        self.tracker.fork = self
+
+    def __enter__(self) -> "GameFork":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self.active:
+            self.discard()
+
+    @property
+    def changed(self) -> List[Thing]:
+        """Things changed in this fork, each once, in the order of their first change."""
+        return [thing for thing, _, _ in self._saved.values()]
+
+    def execute(self, command: str, character=None) -> ActionResult:
+        """Execute a command in the fork (defaults to the player)."""
+        self._check_active()
+        return self.game.parser.parse_command(command, context=ExecutionContext(actor=character or self.game.player))
+
+    def preserve(self, thing: Thing):
+        """
+        Save a thing and the things holding it before the first change in this fork.
+        Called from Thing._touch(), which also updates the holders' contents revision.
+        """
+        holder = thing
+        while isinstance(holder, Thing):
+            if id(holder) not in self._saved:
+                self._saved[id(holder)] = _copy_state(holder)
+            holder = getattr(holder, 'location', None) or getattr(holder, 'owner', None)
+
+    def record(self, thing: Thing):
+        """Remember a change for the revision journal (called by RevisionTracker.record)."""
+        self._changes.append(thing)
+
+    def commit(self):
+        """Keep the changes; they are recorded in the enclosing fork or the revision journal."""
+        self._check_active()
+        self._close()
+        if self.parent is not None:
+            for key, saved in self._saved.items():
+                self.parent._saved.setdefault(key, saved)
+            self.parent._changes.extend(self._changes)
+        else:
+            for thing in self._changes:
+                self.tracker.record(thing)
+
+    def discard(self):
+        """Undo every change made in the fork."""
+        self._check_active()
+        self._close()
+        for thing, attributes, contents in self._saved.values():
+            _restore_state(thing, attributes, contents)
+        for name, value in self._game_state.items():
+            setattr(self.game, name, value)
+        del self.game.game_history[self._history_length:]
+        self.game.parser.last_error_message = self._parser_error
+
+    def _close(self):
+        if self.tracker.fork is not self:
+            raise RuntimeError("Close the inner fork first")
+        self.tracker.fork = self.parent
+        self.active = False
+
+    def _check_active(self):
+        if not self.active:
+            raise RuntimeError("This fork has already been committed or discarded")
+
+
+def _copy_state(thing: Thing):
+    """Copy a thing's attributes and the contents of its dicts, lists and sets."""
+    attributes = dict(thing.__dict__)
+    contents = [(value, value.copy()) for value in attributes.values() if isinstance(value, (dict, list, set))]
+    return thing, attributes, contents
+
+
+def _restore_state(thing: Thing, attributes: Dict[str, Any], contents: List[Tuple[Any, Any]]):
+    """Put saved state back, keeping the identity of the thing's containers."""
+    thing.__dict__.clear()
+    thing.__dict__.update(attributes)
+    for container, saved in contents:
+        if isinstance(container, list):
+            container[:] = saved
+        else:
+            container.clear()
+            container.update(saved)
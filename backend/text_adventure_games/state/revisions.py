@@ -0,0 +1,60 @@
+"""
+Revision tracking for incremental world state updates.
+"""
+
+from collections import OrderedDict
+from typing import List
+
+from backend.text_adventure_games.things.base import Thing, next_revision
+
+
+class RevisionTracker:
+    """
+    Journal of the things that changed in a game, ordered by revision.
+
+    Things report to the tracker from Thing._touch(). The journal keeps each
+    thing once (at its latest revision), so it never grows beyond the size of
+    the world, and "what changed since version V" costs time proportional to
+    the number of changes rather than to the size of the world.
+    """
+
+    def __init__(self):
+        # thing -> latest revision, oldest change first
+        self._changes: "OrderedDict[Thing, int]" = OrderedDict()
+        self._version = self.base_version = next_revision()
+        # Innermost open copy-on-write fork (see state.fork); it holds changes until committed
+        self.fork = None
+
+    @property
+    def version(self) -> int:
+        """The current world version (revision of the latest recorded change)."""
+        return self._version
+
+    def track(self, thing: Thing):
+        """Attach a thing to this tracker so its future changes are recorded."""
+        thing._tracker = self
+
+    def track_all(self, things):
+        """Attach several things to this tracker."""
+        for thing in things:
+            self.track(thing)
+
+    def record(self, thing: Thing):
+        """Record that a thing changed (called from Thing._touch)."""
+        if self.fork is not None:
+            self.fork.record(thing)
+            return
+        self._changes[thing] = thing.revision
+        self._changes.move_to_end(thing)
+        if thing.revision > self._version:
+            self._version = thing.revision
+
+    def changed_since(self, version: int) -> List[Thing]:
+        """Return the things changed after the given version, oldest change first."""
+        changed = []
+        for thing, revision in reversed(self._changes.items()):
+            if revision <= version:
+                break
+            changed.append(thing)
+        changed.reverse()
+        return changed
@@ -0,0 +1,252 @@
+"""
+Whole-game snapshots.
+
+dump_game() serializes a Game (locations, connections, items, containers,
+characters, inventories, object state, turn order and events) in one pass
+over the object graph; load_game() rebuilds an equivalent Game in one pass.
+
+Every Thing is stored once in a table and referenced by its index, so shared
+references (a character's location, an item's owner, room connections) come
+back as the same objects. Instance attributes are stored as they are, so the
+smart object classes need no per-class serialization code.
+
+The payload is msgpack when the optional msgpack package is installed and
+zlib-compressed JSON otherwise; load_game() reads either.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+import importlib
+import json
+import zlib
+
+from pydantic import BaseModel
+
+from backend.text_adventure_games.things.base import Thing, next_revision
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+MAGIC = b"TAGS"
+FORMAT_VERSION = 1
+ENCODING_MSGPACK = b"m"
+ENCODING_JSON = b"z"
+
+# Instance attributes that belong to the running game rather than the world
+_SKIPPED_ATTRIBUTES = {"_tracker"}
+
+# Values stored as they are (checked by exact type, the common case)
+_PLAIN_TYPES = {str, int, float, bool, type(None)}
+
+_DEFAULT_FACTORIES = {"bool": bool, "int": int, "list": list, "dict": dict, "set": set}
+
+
+class SnapshotError(Exception):
+    """Raised when a game cannot be snapshotted or a snapshot cannot be read."""
+
+
+def dump_game(game, extra: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Serialize a game.
+
+    Args:
+        game: The Game to serialize
+        extra: Additional state stored with the snapshot (e.g. turn counters, chat state);
+            may contain Things, which are stored as references
+
+    Returns:
+        bytes: The snapshot
+    """
+    encoder = _Encoder()
+    character_manager = game.agent_manager
+    payload = {
+        "game": {
+            "start_at": encoder.value(game.start_at),
+            "player": encoder.value(game.player),
+            "locations": encoder.value(list(game.locations.values())),
+            "characters": encoder.value(list(game.characters.values())),
+            "give_hints": game.give_hints,
+            "game_over": game.game_over,
+            "game_over_description": encoder.value(game.game_over_description),
+            "game_history": encoder.value(game.game_history),
+            "active_agents": encoder.value(character_manager.active_agents),
+            "turn_order": encoder.value(character_manager.turn_order),
+            "current_agent_index": character_manager.current_agent_index,
+            "event_queue": encoder.value(game.event_manager.event_queue),
+            "event_id_counter": game.event_manager.event_id_counter,
+        },
+        "extra": encoder.value(extra or {}),
+    }
+    # Things are encoded last: encoding them may discover further Things
+    payload["things"] = encoder.encode_things()
+    payload["classes"] = encoder.class_names
+
+    if msgpack is not None:
+        return MAGIC + bytes([FORMAT_VERSION]) + ENCODING_MSGPACK + msgpack.packb(payload, use_bin_type=True)
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return MAGIC + bytes([FORMAT_VERSION]) + ENCODING_JSON + zlib.compress(body, 1)
+
+
+def load_game(data: bytes) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Rebuild a game from a snapshot.
+
+    Returns:
+        Tuple of (Game, extra state passed to dump_game)
+    """
+    payload = _unpack(data)
+    decoder = _Decoder(payload["classes"], payload["things"])
+    state = payload["game"]
+
+    from backend.text_adventure_games.games import Game
+
+    player = decoder.value(state["player"])
+    player_location = player.location
+    characters = [character for character in decoder.value(state["characters"]) if character is not player]
+    game = Game(decoder.value(state["start_at"]), player, characters=characters)
+
+    # Game() places the player at the start; put it back where it was
+    if player_location is not game.start_at:
+        game.start_at.characters.pop(player.name, None)
+        player.location = player_location
+
+    game.locations = {location.name: location for location in decoder.value(state["locations"])}
+    game.revision_tracker.track_all(game.iter_things())
+    game.give_hints = state["give_hints"]
+    game.game_over = state["game_over"]
+    game.game_over_description = decoder.value(state["game_over_description"])
+    game.game_history = decoder.value(state["game_history"])
+
+    game.agent_manager.active_agents = decoder.value(state["active_agents"])
+    game.agent_manager.turn_order = decoder.value(state["turn_order"])
+    game.agent_manager.current_agent_index = state["current_agent_index"]
+    game.active_agents = game.agent_manager.active_agents
+    game.turn_order = game.agent_manager.turn_order
+
+    game.event_manager.event_queue = decoder.value(state["event_queue"])
+    game.event_manager.event_id_counter = state["event_id_counter"]
+    game.event_queue = game.event_manager.event_queue
+    game.event_id_counter = game.event_manager.event_id_counter
+
+    return game, decoder.value(payload["extra"])
+
+
+def _unpack(data: bytes) -> Dict[str, Any]:
+    header = len(MAGIC) + 2
+    if len(data) < header or data[:len(MAGIC)] != MAGIC:
+        raise SnapshotError("Not a game snapshot")
+    if data[len(MAGIC)] != FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {data[len(MAGIC)]}")
+
+    encoding, body = data[len(MAGIC) + 1:header], data[header:]
+    if encoding == ENCODING_MSGPACK:
+        if msgpack is None:
+            raise SnapshotError("This snapshot needs the msgpack package")
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    if encoding == ENCODING_JSON:
+        return json.loads(zlib.decompress(body))
+    raise SnapshotError(f"Unknown snapshot encoding {encoding!r}")
+
+
+class _Encoder:
+    """Turns values into msgpack/JSON-compatible data, replacing Things with table references."""
+
+    def __init__(self):
+        self.things: List[Thing] = []
+        self.thing_ids: Dict[int, int] = {}
+        self.class_names: List[str] = []
+        self.class_ids: Dict[type, int] = {}
+
+    def encode_things(self) -> List[List[Any]]:
+        records = []
+        index = 0
+        while index < len(self.things):
+            thing = self.things[index]
+            state = {key: value if type(value) in _PLAIN_TYPES else self.value(value)
+                     for key, value in thing.__dict__.items() if key not in _SKIPPED_ATTRIBUTES}
+            records.append([self._class_id(type(thing)), state])
+            index += 1
+        return records
+
+    def value(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type in _PLAIN_TYPES:
+            return value
+        if value_type is list:
+            return [self.value(item) for item in value]
+        if isinstance(value, Thing):
+            thing_id = self.thing_ids.get(id(value))
+            if thing_id is None:
+                thing_id = self.thing_ids[id(value)] = len(self.things)
+                self.things.append(value)
+            return {"$r": thing_id}
+        if isinstance(value, dict):
+            if isinstance(value, defaultdict):
+                factory = getattr(value.default_factory, "__name__", None)
+                if factory not in _DEFAULT_FACTORIES:
+                    raise SnapshotError(f"Cannot snapshot defaultdict({value.default_factory!r})")
+                return {"$dd": factory, "v": self.value(dict(value))}
+            if all(isinstance(key, str) and not key.startswith("$") for key in value):
+                return {key: self.value(item) for key, item in value.items()}
+            return {"$m": [[self.value(key), self.value(item)] for key, item in value.items()]}
+        if isinstance(value, list):
+            return [self.value(item) for item in value]
+        if isinstance(value, tuple):
+            return {"$t": [self.value(item) for item in value]}
+        if isinstance(value, (set, frozenset)):
+            return {"$s": [self.value(item) for item in value]}
+        if isinstance(value, BaseModel):
+            return {"$p": self._class_id(type(value)), "v": value.model_dump(mode="json")}
+        raise SnapshotError(f"Cannot snapshot value of type {type(value).__name__}")
+
+    def _class_id(self, cls: type) -> int:
+        class_id = self.class_ids.get(cls)
+        if class_id is None:
+            class_id = self.class_ids[cls] = len(self.class_names)
+            self.class_names.append(f"{cls.__module__}:{cls.__qualname__}")
+        return class_id
+
+
+class _Decoder:
+    """Creates every Thing of a snapshot, then fills in their state (resolving references)."""
+
+    def __init__(self, class_names: List[str], records: List[List[Any]]):
+        self.classes = [_import_class(name) for name in class_names]
+        self.things = [self.classes[class_id].__new__(self.classes[class_id]) for class_id, _ in records]
+        for thing, (_, state) in zip(self.things, records):
+            thing.__dict__.update({key: value if type(value) in _PLAIN_TYPES else self.value(value)
+                                   for key, value in state.items()})
+            # Restored things start a fresh revision history
+            thing.revision = thing.contents_revision = next_revision()
+
+    def value(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type is list:
+            return [self.value(item) for item in value]
+        if value_type is not dict:
+            return value
+        if len(value) == 1:
+            if "$r" in value:
+                return self.things[value["$r"]]
+            if "$s" in value:
+                return {self.value(item) for item in value["$s"]}
+            if "$t" in value:
+                return tuple(self.value(item) for item in value["$t"])
+            if "$m" in value:
+                return {self.value(key): self.value(item) for key, item in value["$m"]}
+        elif len(value) == 2:
+            if "$dd" in value:
+                return defaultdict(_DEFAULT_FACTORIES[value["$dd"]], self.value(value["v"]))
+            if "$p" in value:
+                return self.classes[value["$p"]].model_validate(value["v"])
+        return {key: self.value(item) for key, item in value.items()}
+
+
+def _import_class(qualified_name: str) -> type:
+    module_name, _, class_name = qualified_name.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for part in class_name.split("."):
+        target = getattr(target, part)
+    return target
@@ -1,8 +1,20 @@
 from collections import defaultdict
-from typing import Dict, Any, Set, Type, List
-import inspect
+from typing import Dict, Any, FrozenSet, Type, List
+import itertools
 from abc import ABC
 
+from backend.text_adventure_games.utils.discovery import ACTION_MASKS, get_class_capabilities
+
+
+# Process-wide revision clock. Every change to any Thing takes the next value,
+# so revisions are comparable across all things (and usable as world versions).
+_revision_clock = itertools.count(1)
+
+
+def next_revision() -> int:
+    """Return a new, strictly increasing revision number."""
+    return next(_revision_clock)
+
 
 class Thing(ABC):
     """
@@ -10,7 +22,15 @@ class Thing(ABC):
     Characters.
     """
 
+    # Journal of changed things, attached by the Game (see state.revisions)
+    _tracker = None
+
     def __init__(self, name: str, description: str):
+        # Revision of the last change to this thing, and of the last change to
+        # this thing or anything inside it (items, inventory, characters)
+        self.revision = next_revision()
+        self.contents_revision = self.revision
+
         # A short name for the thing
         self.name = name
 
@@ -27,9 +47,6 @@ class Thing(ABC):
         # implemented in the Parser.
         self.commands = set()
         
-        # Auto-discover capabilities this object implements
-        self.capabilities: Set[Type] = self._discover_capabilities()
-        
         # Track state changes for event system
         self.state_history: List[Dict] = []
 
@@ -38,8 +55,33 @@ class Thing(ABC):
         """
         Sets the property of this item
         """
+        self._touch()
         self.properties[property_name] = property
 
+    def _touch(self):
+        """
+        Mark this thing as changed by giving it a new revision.
+        Must be called by every method that mutates the thing's state, before
+        the change (an open fork saves the thing's state here).
+        """
+        if self._tracker is not None and self._tracker.fork is not None:
+            self._tracker.fork.preserve(self)
+        revision = next_revision()
+        self.revision = revision
+        if self._tracker is not None:
+            self._tracker.record(self)
+
+        # Propagate to everything holding this thing (container, owner, location)
+        holder = self
+        while isinstance(holder, Thing):
+            holder.contents_revision = revision
+            holder = getattr(holder, 'location', None) or getattr(holder, 'owner', None)
+
+    def _adopt(self, thing: "Thing"):
+        """Let a thing that enters this one (item, character) join this thing's revision journal."""
+        if thing._tracker is None and self._tracker is not None:
+            self._tracker.track(thing)
+
     def get_property(self, property_name: str, default=None):
         """
         Gets the value of this property for this item.
@@ -61,114 +103,32 @@ class Thing(ABC):
         """
         return self.commands
     
-    def _discover_capabilities(self) -> Set[Type]:
-        """
-        Automatically discover what capabilities this object implements.
-        This is done by checking if the object has the methods required by each protocol.
-        """
-        # Import capabilities here to avoid circular imports
-        try:
-            from backend.text_adventure_games.capabilities import (
-                Activatable, Openable, Lockable, Usable, Container, 
-                Consumable, Examinable, Recipient, Giver, Conversational
-            )
-        except ImportError:
-            # During testing or if capabilities module isn't available
-            return set()
-        
-        capabilities = set()
-        protocols = [Activatable, Openable, Lockable, Usable, Container, 
-                    Consumable, Examinable, Recipient, Giver, Conversational]
-        
-        for protocol in protocols:
-            if self._implements_protocol(protocol):
-                capabilities.add(protocol)
-        
-        return capabilities
+    @property
+    def capabilities(self) -> FrozenSet[Type]:
+        """
+        Capability protocols this object implements. Discovered once per class
+        and shared by all its instances.
+        """
+        return get_class_capabilities(type(self)).capabilities
     
-    def _implements_protocol(self, protocol: Type) -> bool:
-        """
-        Check if this object implements all methods required by a protocol.
-        """
-        try:
-            # Get all method names from the protocol
-            required_methods = []
-            for name in dir(protocol):
-                if not name.startswith('_') and callable(getattr(protocol, name, None)):
-                    required_methods.append(name)
-            
-            # Check if this object has all required methods
-            return all(hasattr(self, method) and callable(getattr(self, method)) 
-                      for method in required_methods)
-        except:
-            return False
+    @property
+    def capability_mask(self) -> int:
+        """Bitmask of this object's capabilities (see utils.discovery.CAPABILITY_BITS)."""
+        return get_class_capabilities(type(self)).mask
     
     def can_do(self, action_type: str) -> bool:
         """
         Check if this object supports a specific action type.
         Used by generic actions to determine if they can act on this object.
         """
-        # Import capabilities here to avoid circular imports
-        try:
-            from backend.text_adventure_games.capabilities import (
-                Activatable, Openable, Lockable, Usable, Container, 
-                Consumable, Examinable
-            )
-        except ImportError:
-            return False
-        
-        capability_map = {
-            "on": Activatable,
-            "off": Activatable, 
-            "activate": Activatable,
-            "deactivate": Activatable,
-            "open": Openable,
-            "close": Openable,
-            "lock": Lockable,
-            "unlock": Lockable,
-            "start_using": Usable,
-            "stop_using": Usable,
-            "place": Container,
-            "remove_item": Container,
-            "consume": Consumable,
-            "examine": Examinable
-        }
-        
-        required_capability = capability_map.get(action_type)
-        return required_capability in self.capabilities if required_capability else False
+        return bool(get_class_capabilities(type(self)).mask & ACTION_MASKS.get(action_type, 0))
     
     def get_object_capabilities(self) -> List[str]:
         """
         Return list of action types this object supports.
         Used for capability discovery and command suggestion.
         """
-        # Import capabilities here to avoid circular imports
-        try:
-            from backend.text_adventure_games.capabilities import (
-                Activatable, Openable, Lockable, Usable, Container, 
-                Consumable, Examinable
-            )
-        except ImportError:
-            return []
-        
-        actions = []
-        
-        if Activatable in self.capabilities:
-            actions.extend(["activate", "deactivate"])
-        if Openable in self.capabilities:
-            actions.extend(["open", "close"])
-        if Lockable in self.capabilities:
-            actions.extend(["lock", "unlock"])
-        if Usable in self.capabilities:
-            actions.extend(["start_using", "stop_using"])
-        if Container in self.capabilities:
-            actions.extend(["place", "remove_item"])
-        if Consumable in self.capabilities:
-            actions.append("consume")
-        if Examinable in self.capabilities:
-            actions.append("examine")
-        
-        return actions
+        return list(get_class_capabilities(type(self)).actions)
     
     def to_primitive(self) -> Dict[str, Any]:
         """
@@ -93,6 +93,9 @@ class Character(Thing, Recipient, Giver, Conversational, Examinable):
         if item.location is not None:
             remove_item_safely(item.location, item, self)
             item.location = None
+        self._touch()
+        item._touch()
+        self._adopt(item)
         self.inventory[item.name] = item
         item.owner = self
 
@@ -106,6 +109,8 @@ class Character(Thing, Recipient, Giver, Conversational, Examinable):
         """
         Removes an item to a character's inventory.
         """
+        self._touch()
+        item._touch()
         item.owner = None
         self.inventory.pop(item.name)
     
@@ -63,10 +63,14 @@ class Container(Object, Openable, ContainerCapability, Examinable):
         
         # Remove from character's inventory
         if character and hasattr(character, 'inventory') and item.name in character.inventory:
+            character._touch()
             del character.inventory[item.name]
             item.owner = None
         
         # Add to container
+        self._touch()
+        item._touch()
+        self._adopt(item)
         self.inventory[item.name] = item
         item.location = self
         return ActionResult(f"You place the {item.name} in the {self.name}")
@@ -80,10 +84,13 @@ class Container(Object, Openable, ContainerCapability, Examinable):
             return ActionResult(f"There's no {item_name} in the {self.name}", success=False)
         
         item = self.inventory[item_name]
+        self._touch()
+        item._touch()
         del self.inventory[item_name]
         
         # Add to character's inventory
         if character and hasattr(character, 'inventory'):
+            character._touch()
             character.inventory[item_name] = item
             item.owner = character
         
@@ -113,6 +120,9 @@ class Container(Object, Openable, ContainerCapability, Examinable):
     
     def add_item(self, item):
         """Legacy method - use place_item instead"""
+        self._touch()
+        item._touch()
+        self._adopt(item)
         self.inventory[item.name] = item
         item.location = self
 
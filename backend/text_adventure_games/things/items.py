@@ -158,12 +158,15 @@ class UtilityItem(Item, Usable):
         if not character.is_in_inventory(self):
             return ActionResult(f"{character.name} needs to be holding the {self.name} to use it", success=False)
         
+        self._touch()
+        
         self.current_user = character
         return ActionResult(f"{character.name} starts using the {self.name}")
     
     def stop_using(self, character) -> ActionResult:
         if self.current_user != character:
             return ActionResult("You're not using this item", success=False)
+        self._touch()
         self.current_user = None
         return ActionResult(f"{character.name} stops using the {self.name}")
     
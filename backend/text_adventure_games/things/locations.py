@@ -116,6 +116,8 @@ class Location(Thing):
         automatically make a connection in the reverse direction.
         """
         direction = direction.lower()
+        self._touch()
+        connected_location._touch()
         self.connections[direction] = connected_location
         self.travel_descriptions[direction] = travel_description
         if direction == "north":
@@ -181,6 +183,9 @@ class Location(Thing):
         """
         Put an item in this location.
         """
+        self._touch()
+        item._touch()
+        self._adopt(item)
         self.items[item.name] = item
         item.location = self
         item.owner = None
@@ -190,6 +195,8 @@ class Location(Thing):
         Remove an item from this location (for instance, if the player picks
         it up and puts it in their inventory).
         """
+        self._touch()
+        item._touch()
         self.items.pop(item.name)
         item.location = None
 
@@ -197,6 +204,9 @@ class Location(Thing):
         """
         Put a character in this location.
         """
+        self._touch()
+        character._touch()
+        self._adopt(character)
         self.characters[character.name] = character
         character.location = self
 
@@ -204,6 +214,8 @@ class Location(Thing):
         """
         Remove a character from this location.
         """
+        self._touch()
+        character._touch()
         self.characters.pop(character.name)
         character.location = None
 
@@ -231,10 +243,12 @@ class Location(Thing):
         Create an obstacle that prevents a player from moving in the blocked
         location until the preconditions are all met.
         """
+        self._touch()
         self.blocks[blocked_direction] = block
 
     def remove_block(self, block):
         for k, b in self.blocks.items():
             if b == block:
+                self._touch()
                 del self.blocks[k]
                 break
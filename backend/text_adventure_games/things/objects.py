@@ -34,15 +34,15 @@ class Sink(Object, Activatable, Examinable):
     def activate(self) -> ActionResult:
         if self.is_on:
             return ActionResult("The sink is already running", success=False)
-        self.is_on = True
         self.set_property("is_on", True)
+        self.is_on = True
         return ActionResult("Water flows from the sink", state_changed={"is_on": True})
     
     def deactivate(self) -> ActionResult:
         if not self.is_on:
             return ActionResult("The sink is already off", success=False)
-        self.is_on = False
         self.set_property("is_on", False)
+        self.is_on = False
         return ActionResult("The water stops flowing", state_changed={"is_on": False})
     
     def is_active(self) -> bool:
@@ -65,16 +65,17 @@ class Television(Object, Activatable, Usable, Examinable):
     def activate(self) -> ActionResult:
         if self.is_on:
             return ActionResult("The TV is already on", success=False)
-        self.is_on = True
         self.set_property("is_on", True)
+        self.is_on = True
         return ActionResult(f"The TV turns on, showing channel {self.channel}")
     
     def deactivate(self) -> ActionResult:
         if not self.is_on:
             return ActionResult("The TV is already off", success=False)
-        self.is_on = False
         self.set_property("is_on", False)
+        self.is_on = False
         if self.current_user:
+            self._touch()
             self.current_user = None
         return ActionResult("The TV turns off")
     
@@ -86,12 +87,14 @@ class Television(Object, Activatable, Usable, Examinable):
             return ActionResult("You need to turn the TV on first", success=False)
         if self.current_user:
             return ActionResult(f"{self.current_user.name} is already watching TV", success=False)
+        self._touch()
         self.current_user = character
         return ActionResult(f"{character.name} starts watching TV")
     
     def stop_using(self, character) -> ActionResult:
         if self.current_user != character:
             return ActionResult("You're not watching TV", success=False)
+        self._touch()
         self.current_user = None
         return ActionResult(f"{character.name} stops watching TV")
     
@@ -120,12 +123,14 @@ class Bed(Object, Usable, Examinable):
     def start_using(self, character) -> ActionResult:
         if self.current_user:
             return ActionResult(f"{self.current_user.name} is already sleeping in the bed", success=False)
+        self._touch()
         self.current_user = character
         return ActionResult(f"{character.name} lies down on the bed to sleep")
     
     def stop_using(self, character) -> ActionResult:
         if self.current_user != character:
             return ActionResult("You're not sleeping in this bed", success=False)
+        self._touch()
         self.current_user = None
         return ActionResult(f"{character.name} gets out of bed")
     
@@ -155,12 +160,14 @@ class Chair(Object, Usable, Examinable):
     def start_using(self, character) -> ActionResult:
         if self.current_user:
             return ActionResult(f"{self.current_user.name} is already sitting on the {self.name}", success=False)
+        self._touch()
         self.current_user = character
         return ActionResult(f"{character.name} sits down on the {self.name}")
     
     def stop_using(self, character) -> ActionResult:
         if self.current_user != character:
             return ActionResult("You're not sitting on this chair", success=False)
+        self._touch()
         self.current_user = None
         return ActionResult(f"{character.name} stands up from the {self.name}")
     
@@ -204,8 +211,8 @@ class Cabinet(Object, Openable, ContainerCapability, Examinable):
     def open(self) -> ActionResult:
         if self.is_open_state:
             return ActionResult(f"The {self.name} is already open", success=False)
-        self.is_open_state = True
         self.set_property("is_open", True)
+        self.is_open_state = True
         contents = self.list_contents()
         if contents:
             content_desc = ", ".join([item.name for item in contents])
@@ -215,8 +222,8 @@ class Cabinet(Object, Openable, ContainerCapability, Examinable):
     def close(self) -> ActionResult:
         if not self.is_open_state:
             return ActionResult(f"The {self.name} is already closed", success=False)
-        self.is_open_state = False
         self.set_property("is_open", False)
+        self.is_open_state = False
         return ActionResult(f"You close the {self.name}")
     
     def is_open(self) -> bool:
@@ -232,10 +239,14 @@ class Cabinet(Object, Openable, ContainerCapability, Examinable):
         
         # Remove from character's inventory
         if character and hasattr(character, 'inventory') and item.name in character.inventory:
+            character._touch()
             del character.inventory[item.name]
             item.owner = None
         
         # Add to cabinet
+        self._touch()
+        item._touch()
+        self._adopt(item)
         self.inventory[item.name] = item
         item.location = self
         return ActionResult(f"You place the {item.name} in the {self.name}")
@@ -247,10 +258,13 @@ class Cabinet(Object, Openable, ContainerCapability, Examinable):
             return ActionResult(f"There's no {item_name} in the {self.name}", success=False)
         
         item = self.inventory[item_name]
+        self._touch()
+        item._touch()
         del self.inventory[item_name]
         
         # Add to character's inventory
         if character and hasattr(character, 'inventory'):
+            character._touch()
             character.inventory[item_name] = item
             item.owner = character
         
@@ -289,10 +303,14 @@ class Bookshelf(Object, ContainerCapability, Examinable):
         
         # Remove from character's inventory
         if character and hasattr(character, 'inventory') and item.name in character.inventory:
+            character._touch()
             del character.inventory[item.name]
             item.owner = None
         
         # Add to bookshelf
+        self._touch()
+        item._touch()
+        self._adopt(item)
         self.inventory[item.name] = item
         item.location = self
         return ActionResult(f"You place the {item.name} on the {self.name}")
@@ -302,10 +320,13 @@ class Bookshelf(Object, ContainerCapability, Examinable):
             return ActionResult(f"There's no {item_name} on the {self.name}", success=False)
         
         item = self.inventory[item_name]
+        self._touch()
+        item._touch()
         del self.inventory[item_name]
         
         # Add to character's inventory
         if character and hasattr(character, 'inventory'):
+            character._touch()
             character.inventory[item_name] = item
             item.owner = character
         
@@ -336,12 +357,14 @@ class Toilet(Object, Usable, Examinable):
     def start_using(self, character) -> ActionResult:
         if self.current_user:
             return ActionResult(f"{self.current_user.name} is already using the {self.name}", success=False)
+        self._touch()
         self.current_user = character
         return ActionResult(f"{character.name} uses the {self.name}")
     
     def stop_using(self, character) -> ActionResult:
         if self.current_user != character:
             return ActionResult("You're not using this toilet", success=False)
+        self._touch()
         self.current_user = None
         return ActionResult(f"{character.name} finishes using the {self.name}")
     
@@ -1,15 +1,108 @@
 """
 Capability discovery logic for objects.
+
+Capabilities depend only on the methods an object's class defines, so they are
+computed once per concrete class and memoized. Each capability protocol has a
+bit, which makes "can this object do X" a single mask test.
 """
 
-from typing import Set, Type, List
-import inspect
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set, Tuple, Type
+
+from backend.text_adventure_games.capabilities import (
+    Activatable, Openable, Lockable, Usable, Container,
+    Consumable, Examinable, Recipient, Giver, Conversational
+)
+
+
+# All capability protocols, in discovery order (a protocol's bit is 1 << index)
+PROTOCOLS: Tuple[Type, ...] = (
+    Activatable, Openable, Lockable, Usable, Container,
+    Consumable, Examinable, Recipient, Giver, Conversational
+)
+
+CAPABILITY_BITS: Dict[Type, int] = {protocol: 1 << index for index, protocol in enumerate(PROTOCOLS)}
+
+# Action type -> capability protocol required to perform it
+ACTION_CAPABILITIES: Dict[str, Type] = {
+    "on": Activatable,
+    "off": Activatable,
+    "activate": Activatable,
+    "deactivate": Activatable,
+    "open": Openable,
+    "close": Openable,
+    "lock": Lockable,
+    "unlock": Lockable,
+    "start_using": Usable,
+    "stop_using": Usable,
+    "place": Container,
+    "remove_item": Container,
+    "consume": Consumable,
+    "examine": Examinable
+}
+
+ACTION_MASKS: Dict[str, int] = {action: CAPABILITY_BITS[protocol] for action, protocol in ACTION_CAPABILITIES.items()}
+
+# Action types an object supports per capability, in suggestion order
+CAPABILITY_ACTIONS: Tuple[Tuple[Type, Tuple[str, ...]], ...] = (
+    (Activatable, ("activate", "deactivate")),
+    (Openable, ("open", "close")),
+    (Lockable, ("lock", "unlock")),
+    (Usable, ("start_using", "stop_using")),
+    (Container, ("place", "remove_item")),
+    (Consumable, ("consume",)),
+    (Examinable, ("examine",)),
+)
+
+
+@dataclass(frozen=True)
+class ClassCapabilities:
+    """Capabilities shared by every instance of one class."""
+    capabilities: FrozenSet[Type]
+    mask: int
+    actions: Tuple[str, ...]
+
+
+@lru_cache(maxsize=None)
+def _required_methods(protocol: Type) -> Tuple[str, ...]:
+    """Public method names a protocol requires."""
+    return tuple(
+        name for name in dir(protocol)
+        if not name.startswith('_') and callable(getattr(protocol, name, None))
+    )
+
+
+@lru_cache(maxsize=None)
+def get_class_capabilities(cls: Type) -> ClassCapabilities:
+    """
+    Discover (once per class) which capability protocols a class implements.
+    
+    Args:
+        cls: The class to check
+        
+    Returns:
+        ClassCapabilities: Protocols as a frozenset and bitmask, plus supported action types
+    """
+    capabilities = frozenset(
+        protocol for protocol in PROTOCOLS
+        if all(callable(getattr(cls, method, None)) for method in _required_methods(protocol))
+    )
+    mask = 0
+    for protocol in capabilities:
+        mask |= CAPABILITY_BITS[protocol]
+    actions = tuple(
+        action
+        for protocol, protocol_actions in CAPABILITY_ACTIONS if protocol in capabilities
+        for action in protocol_actions
+    )
+    return ClassCapabilities(capabilities, mask, actions)
 
 
 def discover_capabilities(obj) -> Set[Type]:
     """
     Automatically discover what capabilities an object implements.
-    This is done by checking if the object has the methods required by each protocol.
+    This is done by checking if the object's class has the methods required by each protocol.
     
     Args:
         obj: The object to check for capabilities
@@ -17,25 +110,7 @@ def discover_capabilities(obj) -> Set[Type]:
     Returns:
         Set[Type]: Set of capability protocol types that the object implements
     """
-    # Import capabilities here to avoid circular imports
-    try:
-        from backend.text_adventure_games.capabilities import (
-            Activatable, Openable, Lockable, Usable, Container, 
-            Consumable, Examinable, Recipient, Giver, Conversational
-        )
-    except ImportError:
-        # During testing or if capabilities module isn't available
-        return set()
-    
-    capabilities = set()
-    protocols = [Activatable, Openable, Lockable, Usable, Container, 
-                Consumable, Examinable, Recipient, Giver, Conversational]
-    
-    for protocol in protocols:
-        if implements_protocol(obj, protocol):
-            capabilities.add(protocol)
-    
-    return capabilities
+    return get_class_capabilities(type(obj)).capabilities
 
 
 def implements_protocol(obj, protocol: Type) -> bool:
@@ -49,17 +124,11 @@ def implements_protocol(obj, protocol: Type) -> bool:
     Returns:
         bool: True if the object implements all required methods
     """
+    if protocol in CAPABILITY_BITS:
+        return protocol in get_class_capabilities(type(obj)).capabilities
     try:
-        # Get all method names from the protocol
-        required_methods = []
-        for name in dir(protocol):
-            if not name.startswith('_') and callable(getattr(protocol, name, None)):
-                required_methods.append(name)
-        
-        # Check if this object has all required methods
-        return all(hasattr(obj, method) and callable(getattr(obj, method)) 
-                  for method in required_methods)
-    except:
+        return all(callable(getattr(obj, method, None)) for method in _required_methods(protocol))
+    except Exception:
         return False
 
 
@@ -75,39 +144,7 @@ def can_do_action(obj, action_type: str) -> bool:
     Returns:
         bool: True if the object can perform the action
     """
-    # Import capabilities here to avoid circular imports
-    try:
-        from backend.text_adventure_games.capabilities import (
-            Activatable, Openable, Lockable, Usable, Container, 
-            Consumable, Examinable
-        )
-    except ImportError:
-        return False
-    
-    # Get object capabilities
-    capabilities = getattr(obj, 'capabilities', None)
-    if capabilities is None:
-        capabilities = discover_capabilities(obj)
-    
-    capability_map = {
-        "on": Activatable,
-        "off": Activatable, 
-        "activate": Activatable,
-        "deactivate": Activatable,
-        "open": Openable,
-        "close": Openable,
-        "lock": Lockable,
-        "unlock": Lockable,
-        "start_using": Usable,
-        "stop_using": Usable,
-        "place": Container,
-        "remove_item": Container,
-        "consume": Consumable,
-        "examine": Examinable
-    }
-    
-    required_capability = capability_map.get(action_type)
-    return required_capability in capabilities if required_capability else False
+    return bool(get_class_capabilities(type(obj)).mask & ACTION_MASKS.get(action_type, 0))
 
 
 def get_object_capabilities(obj) -> List[str]:
@@ -121,35 +158,4 @@ def get_object_capabilities(obj) -> List[str]:
     Returns:
         List[str]: List of action type strings
     """
-    # Import capabilities here to avoid circular imports
-    try:
-        from backend.text_adventure_games.capabilities import (
-            Activatable, Openable, Lockable, Usable, Container, 
-            Consumable, Examinable
-        )
-    except ImportError:
-        return []
-    
-    # Get object capabilities
-    capabilities = getattr(obj, 'capabilities', None)
-    if capabilities is None:
-        capabilities = discover_capabilities(obj)
-    
-    actions = []
-    
-    if Activatable in capabilities:
-        actions.extend(["activate", "deactivate"])
-    if Openable in capabilities:
-        actions.extend(["open", "close"])
-    if Lockable in capabilities:
-        actions.extend(["lock", "unlock"])
-    if Usable in capabilities:
-        actions.extend(["start_using", "stop_using"])
-    if Container in capabilities:
-        actions.extend(["place", "remove_item"])
-    if Consumable in capabilities:
-        actions.append("consume")
-    if Examinable in capabilities:
-        actions.append("examine")
-    
-    return actions
\ No newline at end of file
+    return list(get_class_capabilities(type(obj)).actions)
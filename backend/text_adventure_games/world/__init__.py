@@ -6,8 +6,10 @@ This package contains modules for creating and managing the game world:
 - items: Item creation and placement
 - characters: Character definitions and setup
 - builder: World building orchestration
+- generator: Seeded procedural worlds of any size for scaling tests
 """
 
 from .builder import build_house_game
+from .generator import build_generated_game
 
-__all__ = ["build_house_game"]
\ No newline at end of file
+__all__ = ["build_house_game", "build_generated_game"]
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+Procedural world generation for scaling tests.
+
+Generates arbitrarily large, connected worlds from a seed, populated with the
+same smart object classes as the house, and returns a regular Game so every
+subsystem can be exercised at scale. The same arguments always produce the
+same world.
+"""
+
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.text_adventure_games import games, things
+from backend.text_adventure_games.things import (
+    EdibleItem, DrinkableItem, Container, Bed, Television, Sink,
+    ClothingItem, UtilityItem, BookItem, BeddingItem, Chair, Table, Bookshelf, Toilet
+)
+from .characters import create_player_character
+
+# Grid offsets per direction; connections are cardinal, so reverse exits are added automatically
+DIRECTIONS = {"north": (0, 1), "east": (1, 0), "south": (0, -1), "west": (-1, 0)}
+
+COLORS = ["red", "blue", "green", "yellow", "white", "black", "brown", "grey", "orange", "purple"]
+MATERIALS = ["wooden", "metal", "glass", "oak", "pine", "plastic", "leather", "wicker"]
+
+
+def _edible(rng, name):
+    return EdibleItem(name, f"A {name}", f"A fresh {name} that looks delicious.")
+
+
+def _drink(rng, name):
+    return DrinkableItem(name, f"A {name}", f"A bottle of {name}.")
+
+
+def _clothing(rng, name):
+    return ClothingItem(name, f"a {name}", f"A {name}.", clothing_type=name.split()[-1], material=rng.choice(["wool", "cotton", "leather"]))
+
+
+def _bedding(rng, name):
+    color = name.split()[0]
+    return BeddingItem(name, name, f"A soft, {name} for the bed.", bedding_type=name.split()[-1], material="cotton", color=color)
+
+
+def _utensil(rng, name):
+    return UtilityItem(name, f"A {name}", utility_type="utensil")
+
+
+def _book(rng, name):
+    return BookItem(name, f"A {name}", title=f"The {name.title()}", author="Anonymous")
+
+
+# Small items: (noun, factory); names get a color prefix ("red apple")
+SMALL_ITEMS: Dict[str, List[Tuple[str, Callable]]] = {
+    "kitchen": [("apple", _edible), ("bread", _edible), ("juice", _drink), ("fork", _utensil), ("plate", _utensil)],
+    "bedroom": [("quilt", _bedding), ("pillow", _bedding), ("jacket", _clothing), ("hat", _clothing), ("book", _book)],
+    "living": [("book", _book), ("magazine", _book), ("cookie", _edible), ("remote", _utensil)],
+    "dining": [("plate", _utensil), ("cup", _utensil), ("pear", _edible), ("water", _drink)],
+    "bathroom": [("towel", _bedding), ("soap", _utensil), ("brush", _utensil)],
+    "laundry": [("shirt", _clothing), ("sock", _clothing), ("scarf", _clothing), ("towel", _bedding)],
+    "game": [("ball", _utensil), ("card deck", _utensil), ("soda", _drink)],
+    "entry": [("umbrella", _utensil), ("boots", _clothing), ("key", _utensil)],
+}
+
+# Furniture: (noun, factory taking (name, description)); names get a material prefix ("oak table")
+FURNITURE: Dict[str, List[Tuple[str, Callable]]] = {
+    "kitchen": [("sink", Sink), ("cupboard", Container), ("table", Table)],
+    "bedroom": [("bed", Bed), ("closet", Container), ("chair", Chair)],
+    "living": [("tv", Television), ("couch", Chair), ("bookshelf", Bookshelf), ("table", Table)],
+    "dining": [("table", Table), ("chair", Chair), ("cabinet", Container)],
+    "bathroom": [("toilet", Toilet), ("sink", Sink), ("basket", Container)],
+    "laundry": [("basket", Container), ("sink", Sink)],
+    "game": [("tv", Television), ("table", Table), ("chest", Container)],
+    "entry": [("chair", Chair), ("chest", Container)],
+}
+
+ROOM_TYPES = {
+    "bedroom": ("Bedroom", "A cozy bedroom."),
+    "kitchen": ("Kitchen", "A kitchen with appliances and cabinets."),
+    "living": ("Living Room", "A spacious living room."),
+    "dining": ("Dining Room", "A dining room with a long table."),
+    "bathroom": ("Bathroom", "A clean bathroom."),
+    "laundry": ("Laundry Room", "A small laundry room."),
+    "game": ("Game Room", "A fun game room."),
+    "entry": ("Entry Room", "An entryway with a door leading outside."),
+}
+
+
+def build_generated_game(rooms: int = 100, items: Optional[int] = None, agents: int = 10,
+                         seed: int = 0, loop_chance: float = 0.15) -> games.Game:
+    """
+    Build a procedurally generated game.
+
+    Args:
+        rooms: Number of locations
+        items: Total number of items, including container contents (default 5 per room)
+        agents: Number of agent characters ("agent_0001", ...) placed in random rooms
+        seed: Seed; the same arguments always build the same world
+        loop_chance: Chance of extra connections between neighbouring rooms (0 gives a tree)
+
+    Returns:
+        games.Game: Game starting in the first room
+    """
+    rng = random.Random(seed)
+    locations = generate_layout(rooms, rng, loop_chance)
+    populate_items(locations, rooms * 5 if items is None else items, rng)
+
+    npcs = []
+    for index in range(agents):
+        agent = things.Character(
+            name=f"agent_{index + 1:04d}",
+            description=f"Agent {index + 1}, exploring the world.",
+            persona=f"I am agent {index + 1}. I like to explore and interact with things."
+        )
+        rng.choice(locations).add_character(agent)
+        npcs.append(agent)
+
+    return games.Game(locations[0], create_player_character(), characters=npcs)
+
+
+def generate_layout(rooms: int, rng: random.Random, loop_chance: float = 0.15) -> List[things.Location]:
+    """
+    Create `rooms` connected locations laid out on a grid.
+
+    Rooms grow outwards from the origin one random free neighbour at a time,
+    each connected to the room it grew from; neighbouring rooms are then
+    connected with probability `loop_chance`.
+    """
+    type_names = list(ROOM_TYPES)
+    cells: Dict[Tuple[int, int], things.Location] = {}
+    frontier: List[Tuple[Tuple[int, int], Tuple[int, int], str]] = []  # (from cell, to cell, direction)
+    locations = []
+
+    def add_room(cell):
+        room_type = type_names[len(locations) % len(type_names)] if len(locations) < len(type_names) else rng.choice(type_names)
+        title, description = ROOM_TYPES[room_type]
+        location = things.Location(f"{title} {len(locations) + 1}", description)
+        location.set_property("room_type", room_type)
+        cells[cell] = location
+        locations.append(location)
+        for direction, (dx, dy) in DIRECTIONS.items():
+            frontier.append((cell, (cell[0] + dx, cell[1] + dy), direction))
+
+    add_room((0, 0))
+    while len(locations) < rooms:
+        origin, cell, direction = frontier.pop(rng.randrange(len(frontier)))
+        if cell in cells:
+            continue
+        add_room(cell)
+        cells[origin].add_connection(direction, cells[cell])
+
+    if loop_chance > 0:
+        for (x, y), location in cells.items():
+            for direction in ("north", "east"):
+                dx, dy = DIRECTIONS[direction]
+                neighbour = cells.get((x + dx, y + dy))
+                if neighbour is not None and direction not in location.connections and rng.random() < loop_chance:
+                    location.add_connection(direction, neighbour)
+    return locations
+
+
+def populate_items(locations: List[things.Location], count: int, rng: random.Random):
+    """
+    Spread `count` items over the locations.
+
+    Each room first gets furniture for its type, then small items; about half
+    of the small items go into the room's containers. Names are unique within
+    a room.
+    """
+    per_room, remainder = divmod(count, len(locations))
+    for index, location in enumerate(locations):
+        quota = per_room + (1 if index < remainder else 0)
+        room_type = location.get_property("room_type")
+        names = set()
+        containers = []
+
+        for noun, factory in FURNITURE[room_type]:
+            if quota <= 0:
+                break
+            name = _unique_name(f"{rng.choice(MATERIALS)} {noun}", names)
+            furniture = factory(name, f"A {name}")
+            location.add_item(furniture)
+            if isinstance(furniture, Container):
+                containers.append(furniture)
+            quota -= 1
+
+        while quota > 0:
+            noun, factory = rng.choice(SMALL_ITEMS[room_type])
+            item = factory(rng, _unique_name(f"{rng.choice(COLORS)} {noun}", names))
+            open_containers = [container for container in containers if len(container.inventory) < container.max_capacity]
+            if open_containers and rng.random() < 0.5:
+                rng.choice(open_containers).add_item(item)
+            else:
+                location.add_item(item)
+            quota -= 1
+
+
+def _unique_name(name: str, taken: set) -> str:
+    unique, number = name, 2
+    while unique in taken:
+        unique = f"{name} {number}"
+        number += 1
+    taken.add(unique)
+    return unique
@@ -0,0 +1,249 @@
+"""
+Tracing - Per-phase latency spans for agent turns
+=================================================
+Contains the Tracer used to time the phases of agent turns (feedback,
+select_action, LLM requests, parse_command, available actions, get_schema,
+the game loop delay, ...).
+
+- `with get_tracer().span("phase", agent=...) as span:` times a block. Spans
+  opened inside it (also across awaits and in tasks started inside it) become
+  its children, so one turn forms one trace.
+- Finished spans can be exported as JSON Lines (one span per line) for
+  offline analysis.
+- The latest durations per phase, tokens per turn and turn throughput are
+  kept for the /metrics endpoint.
+- Spans with a "tokens" attribute add it to their parent, so every "turn"
+  span carries the tokens used during the turn.
+"""
+
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, List, Optional, TextIO
+import itertools
+import json
+import logging
+import time
+
+from .config.models import TracingConfig
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+# Name of the span that represents one agent turn (used for the per-turn metrics)
+TURN_SPAN = "turn"
+
+# Window for the turns-per-second rate
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    A timed phase. Use Tracer.span() to create one.
+    """
+
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent", "attributes", "start_time", "_start", "duration", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.parent: Optional[Span] = None
+        self.trace_id = 0
+        self.span_id = 0
+        self.start_time = 0.0
+        self._start = 0.0
+        self.duration = 0.0
+        self._token = None
+
+    def set(self, key: str, value: Any):
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.parent = _current_span.get()
+        self.span_id = next(self.tracer._ids)
+        self.trace_id = self.parent.trace_id if self.parent is not None else self.span_id
+        self._token = _current_span.set(self)
+        self.start_time = time.time()
+        self._start = self.tracer._clock()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.duration = self.tracer._clock() - self._start
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.tracer._finish(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent is not None else None,
+            "start": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+        }
+
+
+class _NullSpan:
+    """Span used while tracing is disabled."""
+
+    def set(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Creates spans and keeps per-phase latency statistics.
+    """
+
+    def __init__(self, config: Optional[TracingConfig] = None, clock: Callable[[], float] = time.perf_counter):
+        self.config = config or TracingConfig()
+        self.enabled = self.config.enabled
+        self._clock = clock
+        self._ids = itertools.count(1)
+
+        window = self.config.window
+        self._durations: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._turn_tokens: Deque[int] = deque(maxlen=window)
+        self._turn_times: Deque[float] = deque(maxlen=window)
+        self._turns = 0
+
+        self._export_file: Optional[TextIO] = None
+        if self.config.export_path:
+            try:
+                self._export_file = open(self.config.export_path, "a", encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"Failed to open trace export file {self.config.export_path}: {e}")
+
+    def span(self, name: str, **attributes):
+        """Return a context manager that times a phase (a no-op while tracing is disabled)."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attributes)
+
+    def _finish(self, span: Span):
+        self._durations[span.name].append(span.duration)
+        self._counts[span.name] += 1
+
+        tokens = span.attributes.get("tokens")
+        if tokens and span.parent is not None:
+            span.parent.attributes["tokens"] = span.parent.attributes.get("tokens", 0) + tokens
+        if span.name == TURN_SPAN:
+            self._turns += 1
+            self._turn_tokens.append(tokens or 0)
+            self._turn_times.append(self._clock())
+
+        if self._export_file is not None:
+            try:
+                self._export_file.write(json.dumps(span.to_dict(), default=str) + "\n")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to export span {span.name}: {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return latency percentiles per phase (ms), tokens per turn and turns per second."""
+        phases = {}
+        for name, durations in self._durations.items():
+            stats = _percentiles([duration * 1000 for duration in durations])
+            stats["count"] = self._counts[name]
+            phases[name] = stats
+
+        turns_per_second = 0.0
+        now = self._clock()
+        recent = [moment for moment in self._turn_times if now - moment <= THROUGHPUT_WINDOW_SECONDS]
+        if len(recent) > 1 and recent[-1] > recent[0]:
+            turns_per_second = (len(recent) - 1) / (recent[-1] - recent[0])
+
+        return {
+            "enabled": self.enabled,
+            "turns": self._turns,
+            "turns_per_second": round(turns_per_second, 4),
+            "tokens_per_turn": _percentiles([float(tokens) for tokens in self._turn_tokens]),
+            "phases": phases,
+        }
+
+    def reset_metrics(self):
+        """Forget the collected statistics."""
+        self._durations.clear()
+        self._counts.clear()
+        self._turn_tokens.clear()
+        self._turn_times.clear()
+        self._turns = 0
+
+    def close(self):
+        """Close the export file, if one is open."""
+        if self._export_file is not None:
+            self._export_file.close()
+            self._export_file = None
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    """Mean, p50, p95, p99 and max of the values (0 when empty)."""
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    values = sorted(values)
+
+    def percentile(fraction):
+        return round(values[min(len(values) - 1, int(len(values) * fraction))], 3)
+
+    return {
+        "mean": round(sum(values) / len(values), 3),
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": round(values[-1], 3),
+    }
+
+
+# Global tracer instance
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the global tracer instance.
+
+    Returns:
+        Tracer configured from the tracing defaults.
+    """
+    global _tracer
+    if _tracer is None:
+        tracing_config = None
+        try:
+            from .config.yaml_config import get_config_manager
+            tracing_config = TracingConfig(**get_config_manager().defaults_config.tracing_defaults)
+        except Exception as e:
+            logger.warning(f"Failed to load tracing configuration: {e}. Using defaults.")
+        _tracer = Tracer(tracing_config)
+    return _tracer
+
+
+def close_tracer():
+    """Close the global tracer's exporter and forget the instance."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+        _tracer = None
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """Replace the global tracer, closing the previous one (None reloads it from the configuration on next use)."""
+    global _tracer
+    if _tracer is not None and _tracer is not tracer:
+        _tracer.close()
+    _tracer = tracer
+    return tracer
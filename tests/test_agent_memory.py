@@ -0,0 +1,139 @@
+"""
+Agent Memory Tests
+==================
+
+Tests for the token-budgeted conversation memory used by KaniAgent.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from kani import ChatMessage
+from kani.models import FunctionCall, ToolCall
+
+from backend.agent.llm_scheduler import LLMScheduler, set_llm_scheduler
+from backend.agent.memory import ConversationMemory, WORLD_STATE_HEADER, describe_round, split_rounds
+from backend.config.models import MemoryConfig, SchedulerConfig
+from backend.config.yaml_config import get_config_manager
+from backend.text_adventure_games.world import build_house_game
+
+
+class FakeAgent:
+    """Just the parts of a Kani agent the memory uses (1 token per 4 characters)."""
+
+    def __init__(self):
+        self.always_included_messages = [ChatMessage.system("You are alex_001.")]
+        self.chat_history = []
+
+    def message_token_len(self, message):
+        return len(message.text or "") // 4 + 4
+
+    def play_turn(self, turn):
+        call = ToolCall.from_function_call(FunctionCall.with_args("submit_command", command=f"go room {turn}"))
+        self.chat_history += [
+            ChatMessage.user(f"Turn {turn}: " + "You see many things here. " * 10),
+            ChatMessage.assistant(None, tool_calls=[call]),
+            ChatMessage.function("submit_command", f"You walk into room {turn}.", call.id),
+        ]
+
+
+async def test_prompt_size_plateaus():
+    """Old rounds are evicted into the summary, so the prompt stays within budget."""
+    agent = FakeAgent()
+    memory = ConversationMemory(MemoryConfig(context_token_budget=600, summary_max_tokens=100))
+
+    sizes = []
+    for turn in range(60):
+        agent.play_turn(turn)
+        prompt = await memory.build_prompt(agent)
+        sizes.append(sum(agent.message_token_len(message) for message in prompt))
+
+    assert max(sizes[20:]) <= 600 + 150
+    assert len(agent.chat_history) < 60
+    assert prompt[0] is agent.always_included_messages[0]
+    assert "go room 59" in prompt[-2].tool_calls[0].function.arguments
+    assert "room" in memory.summary and memory.evicted_rounds > 0
+
+
+async def test_latest_world_state_is_pinned_after_eviction():
+    """The latest world state is re-added once the message carrying it is evicted."""
+    agent = FakeAgent()
+    memory = ConversationMemory(MemoryConfig(context_token_budget=400))
+    memory.note_world_state("You are at: Kitchen")
+    agent.chat_history.append(ChatMessage.user("You are at: Kitchen"))
+
+    prompt = await memory.build_prompt(agent)
+    assert sum("You are at: Kitchen" in (message.text or "") for message in prompt) == 1
+
+    for turn in range(20):
+        agent.play_turn(turn)
+    prompt = await memory.build_prompt(agent)
+    assert sum("You are at: Kitchen" in (message.text or "") for message in prompt) == 1
+    assert prompt[0] is agent.always_included_messages[0]
+
+
+
+async def test_compressed_world_state_is_pinned_only_after_eviction():
+    """A world state sent compressed is found in the history; the full text is pinned once it is evicted."""
+    agent = FakeAgent()
+    memory = ConversationMemory(MemoryConfig(context_token_budget=400))
+    full_text = "You are at: Kitchen\n\nYou can see:\n  - apple\n  - knife"
+    sent_text = "You are at: Kitchen\n\nYou can see: (unchanged)"
+    memory.note_world_state(full_text, sent_text=sent_text)
+    agent.chat_history.append(ChatMessage.user(sent_text + "\n\nYour recent actions: look"))
+
+    prompt = await memory.build_prompt(agent)
+    assert not any(WORLD_STATE_HEADER in (message.text or "") for message in prompt)
+
+    for turn in range(20):
+        agent.play_turn(turn)
+    prompt = await memory.build_prompt(agent)
+    pinned = [message.text for message in prompt if WORLD_STATE_HEADER in (message.text or "")]
+    assert pinned == [f"{WORLD_STATE_HEADER}\n{full_text}"]
+
+
+def test_rounds_are_described_by_their_commands():
+    """Each round starts at a user message and is summarized by command and result."""
+    agent = FakeAgent()
+    agent.play_turn(1)
+    agent.play_turn(2)
+
+    rounds = split_rounds(agent.chat_history)
+    assert len(rounds) == 2
+    assert describe_round(rounds[0]) == "- You did 'go room 1': You walk into room 1."
+
+
+async def test_llm_summaries_do_not_wait_on_the_agents_own_request(monkeypatch):
+    """Summaries made while building a prompt run before the agent takes a scheduler slot."""
+    from backend.agent.agent_strategies import KaniAgent
+
+    config_manager = get_config_manager()
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(config_manager.llm_config, "engine_override", "mock")
+    monkeypatch.setattr(config_manager.defaults_config, "memory_defaults",
+                        {"context_token_budget": 256, "summarizer": "llm"})
+    scheduler = set_llm_scheduler(LLMScheduler(SchedulerConfig(
+        max_concurrent=1, requests_per_minute=None, tokens_per_minute=None)))
+    try:
+        game = build_house_game()
+        agents = [KaniAgent(name, game=game, character=game.characters[name]) for name in ("alex_001", "alan_002")]
+
+        async def play(agent):
+            result = "Welcome to the game! This is your first turn."
+            for _ in range(8):
+                agent.command_executed_this_turn = False
+                await agent.select_action(result)
+                result = "You see many things here. " * 20
+
+        await asyncio.wait_for(asyncio.gather(*(play(agent) for agent in agents)), timeout=30)
+    finally:
+        set_llm_scheduler(None)
+
+    for agent in agents:
+        assert agent.memory.evicted_rounds > 0
+        assert agent.memory.llm_summary
+    assert scheduler.get_metrics()["completed"] > 16
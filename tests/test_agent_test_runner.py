@@ -0,0 +1,87 @@
+"""
+Agent Test Runner Tests
+=======================
+
+Tests for running agent goal test suites concurrently with per-test timeouts
+(offline, with the mock engine).
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.config.yaml_config import get_config_manager
+from backend.testing.agent_goal_test import AgentGoalTest
+from backend.testing.agent_test_runner import AgentTestRunner
+from backend.testing.config import AgentConfig, WorldStateConfig
+from backend.testing.criteria import LocationCriterion
+
+
+@pytest.fixture
+def mock_engine(monkeypatch):
+    llm_config = get_config_manager().llm_config
+    monkeypatch.setattr(llm_config, "engine_override", "mock")
+    return llm_config.engines["mock"].mock
+
+
+def make_test(name, max_turns=3, timeout_seconds=300):
+    return AgentGoalTest(
+        name=name,
+        description=f"Reach a room that does not exist ({name})",
+        initial_world_state=WorldStateConfig(agent_location="Kitchen"),
+        agent_config=AgentConfig(),
+        success_criteria=[LocationCriterion("Nowhere")],
+        max_turns=max_turns,
+        timeout_seconds=timeout_seconds,
+    )
+
+
+async def test_suite_runs_tests_concurrently_and_keeps_their_order(mock_engine):
+    running = 0
+    most_running = 0
+    runner = AgentTestRunner(turn_delay=0)
+    run_test = runner.run_test
+
+    async def tracked_run_test(test, timeout_seconds=None):
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        # Later tests finish first
+        await asyncio.sleep(0.05 * (5 - int(test.name[-1])))
+        try:
+            return await run_test(test, timeout_seconds)
+        finally:
+            running -= 1
+
+    runner.run_test = tracked_run_test
+    tests = [make_test(f"test_{index}") for index in range(5)]
+    suite = await runner.run_test_suite(tests, "Concurrent Suite", concurrency=2)
+
+    assert most_running == 2
+    assert [result.test_name for result in suite.results] == [test.name for test in tests]
+    assert suite.total_tests == 5 and suite.failed_tests == 5
+    for result in suite.results:
+        assert result.turns_taken == 3
+        assert "Failure criterion met: Test times out after 3 turns" in result.failure_reasons
+
+    report = runner.generate_report(suite)
+    positions = [report.index(f"### {test.name} - FAILED") for test in tests]
+    assert positions == sorted(positions)
+
+
+async def test_slow_test_is_cancelled_at_its_timeout(mock_engine, monkeypatch):
+    monkeypatch.setattr(mock_engine, "latency_mean", 0.5)
+    runner = AgentTestRunner(turn_delay=0)
+
+    result = await runner.run_test(make_test("slow", max_turns=50), timeout_seconds=0.2)
+
+    assert not result.success
+    assert result.failure_reasons[0] == "Test timed out after 0.2s"
+    assert result.turns_taken == 0
+    assert result.duration_seconds < 0.5
+    assert result.final_state["agent_location"] == "Kitchen"
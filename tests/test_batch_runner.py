@@ -0,0 +1,53 @@
+"""
+Batch Runner Tests
+==================
+
+Tests for the headless batch runner that shards games across worker processes.
+"""
+
+import sys
+import os
+import json
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.batch import GameSpec, make_specs, run_batch
+from backend.batch.runner import split_scheduler_config
+from backend.config.models import SchedulerConfig
+
+
+def test_scheduler_budgets_are_split_between_workers():
+    config = SchedulerConfig(max_concurrent=8, requests_per_minute=500, tokens_per_minute=None)
+    share = split_scheduler_config(config, 3)
+    assert share.max_concurrent == 2
+    assert share.requests_per_minute == 166
+    assert share.tokens_per_minute is None
+
+
+def test_games_run_in_worker_processes_and_stream_to_disk(tmp_path):
+    specs = make_specs(3, seed=7, turns=2)
+    specs.append(GameSpec(index=4, seed=3, turns=1, agents=["alex_001"], personas={"alex_001": "I am a tester."}))
+    finished = []
+
+    summaries = run_batch(specs, str(tmp_path), workers=2, engine="mock", progress=finished.append)
+
+    assert [summary["index"] for summary in summaries] == [1, 2, 3, 4]
+    assert len(finished) == 4
+    for summary in summaries:
+        assert "error" not in summary, summary.get("traceback")
+    assert [summary["seed"] for summary in summaries] == [7, 8, 9, 3]
+    assert [summary["turns"] for summary in summaries] == [2, 2, 2, 1]
+    assert summaries[0]["agents"] == ["alex_001", "alan_002"]
+    assert summaries[3]["agents"] == ["alex_001"]
+    assert len({summary["pid"] for summary in summaries}) <= 2
+
+    results = [json.loads(line) for line in (tmp_path / "results.jsonl").read_text().splitlines()]
+    assert sorted(result["index"] for result in results) == [1, 2, 3, 4]
+
+    def commands(index):
+        lines = (tmp_path / "games" / f"game-{index:04d}.jsonl").read_text().splitlines()
+        return [json.loads(line)["action"] for line in lines]
+
+    assert len(commands(1)) == summaries[0]["actions"]
+    assert (tmp_path / "traces" / "game-0001.jsonl").read_text().strip()
@@ -0,0 +1,34 @@
+"""
+Benchmark Harness Tests
+=======================
+
+Tests for the synthetic worlds and the benchmark runner.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.benchmarks import BENCHMARKS, build_scaled_house_game, run_benchmarks
+
+
+def test_scaled_world_is_connected():
+    """Every copy of the house is reachable and keeps its own exits."""
+    game = build_scaled_house_game(10)
+    assert len(game.locations) == 80
+    assert len(game.characters) == 21  # 2 agents per copy plus the player
+    entry = game.locations["Entry Room 2"]
+    assert entry.connections["north"].name == "Kitchen 2"
+    assert entry.connections["south"].name == "Living Room 1"
+
+
+async def test_results_are_machine_readable():
+    """Each benchmark reports counts and timings per scale."""
+    results = await run_benchmarks([1, 2], repeat=3, turns=10)
+    assert [(result["benchmark"], result["scale"]) for result in results] == \
+        [(name, scale) for scale in (1, 2) for name in BENCHMARKS]
+    turns = results[-1]
+    assert turns["count"] == 10 and turns["failed_turns"] == 0
+    assert all(result["mean_ms"] is not None for result in results)
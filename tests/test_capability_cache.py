@@ -0,0 +1,42 @@
+"""
+Capability Discovery Tests
+==========================
+
+Tests for the per-class capability cache used by Things and generic actions.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.text_adventure_games.capabilities import Openable, Container, Examinable
+from backend.text_adventure_games.utils.discovery import (
+    CAPABILITY_BITS, can_do_action, get_class_capabilities, get_object_capabilities
+)
+from backend.text_adventure_games.world import build_house_game
+
+
+def test_capabilities_are_shared_per_class():
+    """Instances of the same class share one memoized capability set."""
+    game = build_house_game()
+    quilts = [item for item in game.iter_things() if item.name.endswith("quilt")]
+
+    assert len(quilts) > 1
+    assert quilts[0].capabilities is quilts[1].capabilities
+    assert get_class_capabilities(type(quilts[0])) is get_class_capabilities(type(quilts[1]))
+
+
+def test_mask_lookups_match_capabilities():
+    """can_do and the action list follow from the class capability mask."""
+    game = build_house_game()
+    cabinet = next(item for item in game.iter_things() if item.name == "kitchen cabinet")
+
+    assert cabinet.capabilities >= {Openable, Container, Examinable}
+    assert cabinet.capability_mask & CAPABILITY_BITS[Openable]
+    assert cabinet.can_do("open") and can_do_action(cabinet, "place")
+    assert not cabinet.can_do("consume")
+    assert get_object_capabilities(cabinet) == cabinet.get_object_capabilities() == [
+        "open", "close", "place", "remove_item", "examine"
+    ]
@@ -0,0 +1,92 @@
+"""
+Checkpoint Tests
+================
+
+Tests for the checkpoint store and resuming a GameLoop from a checkpoint.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.checkpoint import CheckpointStore
+from backend.config.yaml_config import get_config_manager
+
+
+async def test_store_skips_corrupt_checkpoints_and_torn_journal_lines(tmp_path):
+    store = CheckpointStore(str(tmp_path), keep=2)
+    for index in range(3):
+        store.journal(index + 1, index, {"n": index})
+        store.checkpoint(f"state {index}".encode())
+        await store.flush()
+    assert sorted(os.listdir(tmp_path)) == ["checkpoint-00000002.ckpt", "checkpoint-00000003.ckpt", "journal.jsonl"]
+
+    (tmp_path / "checkpoint-00000003.ckpt").write_bytes(b"CKPT\x00\x00\x00\x00garbage")
+    with open(tmp_path / "journal.jsonl", "a") as journal:
+        journal.write('{"id": 4, "turn"')
+    assert list(CheckpointStore(str(tmp_path)).checkpoints()) == [b"state 1"]
+    assert store.read_journal(2, 10) == [(2, {"n": 1}), (3, {"n": 2})]
+
+
+async def test_game_loop_resumes_from_checkpoint(tmp_path, monkeypatch):
+    """A new GameLoop started with resume continues with the world, turns, chats, events and conversations."""
+    from backend.game_loop import GameLoop
+
+    config_manager = get_config_manager()
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(config_manager.llm_config, "engine_override", "mock")
+    monkeypatch.setattr(config_manager.defaults_config, "checkpoint_defaults",
+                        {"enabled": True, "directory": str(tmp_path), "every_turns": 2})
+
+    def state(loop):
+        return ({name: (character.location.name, sorted(character.inventory)) for name, character in loop.game.characters.items()},
+                {name: len(strategy.chat_history) for name, strategy in loop.agent_manager.agent_strategies.items()},
+                loop.turn_counter, [event.agent_id for event in loop.event_log], loop.event_log.latest_id)
+
+    loop = GameLoop()
+    await loop.initialize()
+    for _ in range(6):
+        await loop._run_sequential_turn()
+    loop.agent_manager.chat_manager.send_chat_request("alex_001", "alan_002", "hi")
+    loop._write_checkpoint()
+    await loop.checkpoints.close()
+
+    resumed = GameLoop(resume=True)
+    assert await resumed._resume_from_checkpoint()
+    assert state(resumed) == state(loop)
+    assert state(loop)[2] > 0
+    assert list(resumed.agent_manager.chat_manager.pending_requests) == ["alan_002"]
+
+
+async def test_journal_is_cut_to_the_events_kept_checkpoints_need(tmp_path):
+    """Events older than every kept checkpoint's first event are dropped from the journal."""
+    earlier = CheckpointStore(str(tmp_path), keep=2)
+    for event_id in range(1, 4):
+        earlier.journal(event_id, event_id, {"n": event_id})
+    earlier.checkpoint(b"earlier run")
+    await earlier.flush()
+
+    def journal_ids():
+        return [event_id for event_id, _ in store.read_journal(0, 100)]
+
+    store = CheckpointStore(str(tmp_path), keep=2)
+    for event_id in range(4, 7):
+        store.journal(event_id, event_id, {"n": event_id})
+    store.checkpoint(b"first", first_event_id=4)
+    await store.flush()
+    # The checkpoint of the earlier run may still need the whole journal
+    assert journal_ids() == [1, 2, 3, 4, 5, 6]
+
+    for event_id in range(7, 10):
+        store.journal(event_id, event_id, {"n": event_id})
+    store.checkpoint(b"second", first_event_id=6)
+    await store.flush()
+    assert journal_ids() == [4, 5, 6, 7, 8, 9]
+
+    store.journal(10, 10, {"n": 10})
+    store.checkpoint(b"third", first_event_id=8)
+    await store.flush()
+    assert journal_ids() == [6, 7, 8, 9, 10]
+    assert list(store.checkpoints()) == [b"third", b"second"]
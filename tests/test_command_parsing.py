@@ -0,0 +1,152 @@
+"""
+Command Parsing Tests
+=====================
+
+Tests for the compiled command pattern table and entity matching used by the parser.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.text_adventure_games.command.patterns import CommandPatternTable, get_command_table
+from backend.text_adventure_games.command.matcher import (
+    NameIndex, match_item, get_items_in_scope, get_character_from_command
+)
+from backend.text_adventure_games.actions.base import ExecutionContext
+from backend.text_adventure_games.actions.locations import Go
+from backend.text_adventure_games.world import build_house_game
+from backend.text_adventure_games.actions.generic import (
+    EnhancedLookAction, GenericTakeAction, GenericStopUsingAction, GenericStartUsingAction, GenericPlaceAction
+)
+
+
+class FirstAction:
+    COMMAND_PATTERNS = ["stop {target}", "look"]
+
+    @classmethod
+    def get_command_patterns(cls):
+        return cls.COMMAND_PATTERNS
+
+
+class SecondAction:
+    COMMAND_PATTERNS = ["stop using {target}", "{verb} now"]
+
+    @classmethod
+    def get_command_patterns(cls):
+        return cls.COMMAND_PATTERNS
+
+
+def test_table_dispatches_generic_actions():
+    """Commands are routed to the same classes as the pattern loop did."""
+    table = get_command_table()
+
+    assert table.match("look") is EnhancedLookAction
+    assert table.match("take red quilt") is GenericTakeAction
+    assert table.match("use bed") is GenericStartUsingAction
+    assert table.match("stop using bed") is GenericStopUsingAction
+    assert table.match("put apple in cabinet") is GenericPlaceAction
+    assert table.match("dance wildly") is None
+
+
+def test_first_listed_pattern_wins():
+    """When several patterns match, the earliest class and pattern wins."""
+    table = CommandPatternTable([FirstAction, SecondAction])
+
+    assert table.match("stop using bed") is FirstAction
+    assert table.match("look around") is FirstAction
+    assert table.match("run now") is SecondAction
+    assert table.match("run") is None
+
+
+def test_patterns_are_shared_for_enumeration():
+    """The table exposes the original patterns for command generation."""
+    table = CommandPatternTable([FirstAction, SecondAction])
+
+    assert list(table.iter_patterns()) == [
+        (FirstAction, ["stop {target}", "look"]),
+        (SecondAction, ["stop using {target}", "{verb} now"]),
+    ]
+
+
+def test_name_index_prefers_longest_match():
+    """The longest name mentioned in a command wins, matching whole words only."""
+    index = NameIndex(["table", "coffee table", "cup"])
+
+    assert index.find("take cup from coffee table") == "coffee table"
+    assert index.find("look at the table") == "table"
+    assert index.find("take cupcake") is None
+
+    index.remove("coffee table")
+    assert index.find("take cup from coffee table") == "table"
+
+
+def test_character_and_item_lookup():
+    """Characters are resolved through the game's index, items through the scope's."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+
+    assert get_character_from_command("alan_002 take apple", game) is alan
+    assert get_character_from_command("take apple", game) is game.player
+
+    scope = get_items_in_scope(alan, game)
+    assert match_item("take the apple", scope) is scope["apple"]
+
+
+def test_scope_is_cached_until_contents_change():
+    """The scope is reused between calls and rebuilt after an item moves."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+
+    scope = get_items_in_scope(alan, game)
+    assert get_items_in_scope(alan, game) is scope
+
+    alan.add_to_inventory(alan.location.items["apple"])
+    rebuilt = get_items_in_scope(alan, game)
+    assert rebuilt is not scope
+    assert "apple" in rebuilt
+
+
+def test_commands_execute_in_their_own_context():
+    """The actor and result travel in the context; the game's player is never swapped."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    player = game.player
+
+    probe = ExecutionContext(actor=alan)
+    action = game.parser.parse_action("take apple", probe)
+    assert action.character is alan and probe.action is action
+    assert game.player is player
+
+    execution = ExecutionContext(actor=alan)
+    result = game.parser.parse_command("take apple", context=execution)
+    assert execution.result is result
+    assert "apple" in alan.inventory
+    assert game.schema_exporter.get_schema(execution).agent_id == "alan_002"
+
+
+def test_failed_probe_does_not_leak_error_message():
+    """Precondition failures are reported on the probe's context only."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+
+    assert not game.parser.check_command("take bed", alan)
+    execution = ExecutionContext(actor=alan)
+    game.parser.parse_command("look", context=execution)
+    assert execution.last_error_message is None
+
+
+def test_go_describes_the_moved_characters_room():
+    """Go run for an agent describes the agent's new room, not the player's."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    assert game.player.location.name != alan.location.name
+
+    execution = ExecutionContext(actor=alan)
+    go = Go(game, "go north", execution)
+    result = go()
+    assert alan.location.name == "Bedroom"
+    assert "bedroom" in result.description.lower()
+    assert execution.action is go and execution.result is result
@@ -0,0 +1,78 @@
+"""
+Concurrent Turn Tests
+=====================
+
+Tests for concurrent agent deliberation with deterministic commit ordering.
+Uses scripted strategies so no LLM or API key is required.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.text_adventure_games.world import build_house_game
+from backend.agent.manager import AgentManager
+
+
+class ScriptedStrategy:
+    """Strategy that returns pre-defined commands after a fixed delay."""
+
+    def __init__(self, commands, delay=0.0):
+        self.commands = list(commands)
+        self.delay = delay
+        self.feedback = []
+
+    async def select_action(self, action_result: str) -> str:
+        self.feedback.append(action_result)
+        await asyncio.sleep(self.delay)
+        return self.commands.pop(0) if self.commands else "look"
+
+
+def _build_kitchen_game():
+    """Build the house and move both agents into the kitchen."""
+    game = build_house_game()
+    alex = game.characters["alex_001"]
+    kitchen = game.characters["alan_002"].location
+    alex.location.remove_character(alex)
+    kitchen.add_character(alex)
+    alex.location = kitchen
+    return game
+
+
+@pytest.mark.asyncio
+async def test_concurrent_round_deliberates_in_parallel():
+    """Both strategies should deliberate at the same time."""
+    game = _build_kitchen_game()
+    manager = AgentManager(game)
+    manager.register_agent_strategy("alex_001", ScriptedStrategy(["look"], delay=0.2))
+    manager.register_agent_strategy("alan_002", ScriptedStrategy(["look"], delay=0.2))
+
+    start = asyncio.get_running_loop().time()
+    results = await manager.execute_concurrent_round()
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert [agent.name for agent, _, _ in results] == ["alex_001", "alan_002"]
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_concurrent_round_replans_conflicts():
+    """The second agent to take the same item should be asked to re-plan."""
+    game = _build_kitchen_game()
+    manager = AgentManager(game)
+    alan = ScriptedStrategy(["take apple", "look"])
+    manager.register_agent_strategy("alex_001", ScriptedStrategy(["take apple"]))
+    manager.register_agent_strategy("alan_002", alan)
+
+    results = await manager.execute_concurrent_round()
+
+    assert "apple" in game.characters["alex_001"].inventory
+    assert "apple" not in game.characters["alan_002"].inventory
+
+    alan_actions = [schema.action.action_type for agent, schema, _ in results if agent.name == "alan_002"]
+    assert alan_actions == ["noop", "look"]
+    assert "could not be carried out" in alan.feedback[-1]
@@ -0,0 +1,77 @@
+"""
+Engine Registry Tests
+=====================
+
+Tests for the shared OpenAI clients and connection pool used by agents.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.agent.engine_registry import EngineRegistry
+from backend.config.models import HttpPoolConfig
+
+
+def test_clients_share_one_connection_pool():
+    """Clients are reused per settings and all use the registry's HTTP client."""
+    registry = EngineRegistry(HttpPoolConfig(max_connections=4))
+
+    first = registry.get_client("sk-test", timeout=30, max_retries=3)
+    assert registry.get_client("sk-test", timeout=30, max_retries=3) is first
+
+    other = registry.get_client("sk-test", timeout=10, max_retries=3)
+    assert other is not first
+    assert first._client is other._client is registry.http_client
+    assert first.timeout == 30 and first.max_retries == 3
+
+
+async def test_close_releases_clients_and_pool():
+    """Closing the registry closes the pool; the next request opens a new one."""
+    registry = EngineRegistry()
+    client = registry.get_client("sk-test")
+    pool = registry.http_client
+
+    await registry.close()
+
+    assert pool.is_closed
+    assert registry.get_client("sk-test") is not client
+    assert registry.http_client is not pool
+    await registry.close()
+
+
+def test_pool_is_reusable_across_event_loops():
+    """Requests from successive event loops each use a connection pool of their own loop."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    registry = EngineRegistry()
+
+    async def fetch():
+        responses = await asyncio.gather(*(registry.http_client.get(url) for _ in range(3)))
+        return [response.text for response in responses]
+
+    try:
+        assert asyncio.run(fetch()) == ["ok"] * 3
+        assert asyncio.run(fetch()) == ["ok"] * 3
+        asyncio.run(registry.close())
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,99 @@
+"""
+Event Log Tests
+===============
+
+Tests for the bounded event log used by the game loop for frontend events.
+"""
+
+import json
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.event_log import EventLog
+
+
+def test_ids_are_monotonic_and_lookup_by_id():
+    """Events get increasing ids and can be looked up directly."""
+    log = EventLog(capacity=10)
+    ids = [log.append(f"event {i}") for i in range(3)]
+
+    assert ids == [1, 2, 3]
+    assert log.get(2) == "event 1"
+    assert log.get(4) is None
+    assert log.latest_id == 3
+
+
+def test_ring_evicts_oldest_and_spills(tmp_path):
+    """Only the newest events stay in memory; evicted ones are written to disk."""
+    spill_path = tmp_path / "events.jsonl"
+    log = EventLog(capacity=3, spill_path=str(spill_path))
+    for i in range(5):
+        log.append({"n": i})
+    log.close()
+
+    assert len(log) == 3
+    assert log.get(1) is None
+    assert [event_id for event_id, _ in log.events_after(0)] == [3, 4, 5]
+
+    spilled = [json.loads(line) for line in spill_path.read_text().splitlines()]
+    assert spilled == [{"id": 1, "event": {"n": 0}}, {"id": 2, "event": {"n": 1}}]
+
+
+def test_clients_have_independent_cursors():
+    """Two polling clients each receive every event once."""
+    log = EventLog(capacity=10)
+    log.append("a")
+    log.append("b")
+
+    assert log.read_unserved("frontend") == ["a", "b"]
+    log.append("c")
+    assert log.read_unserved("dashboard") == ["a", "b", "c"]
+    assert log.read_unserved("frontend") == ["c"]
+    assert log.read_unserved("frontend") == []
+
+
+def test_clear_keeps_ids_increasing():
+    """Clearing the log does not reuse ids, so cursors stay valid."""
+    log = EventLog(capacity=10)
+    log.append("a")
+    log.read_unserved()
+    log.clear()
+    assert log.append("b") == 2
+    assert log.read_unserved() == ["b"]
+
+
+class TimestampedEvent:
+    """Minimal event with a timestamp attribute."""
+
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+
+
+def test_events_since_timestamp_uses_order():
+    """Timestamp queries return only newer events and respect the limit."""
+    log = EventLog(capacity=4)
+    for second in range(6):
+        log.append(TimestampedEvent(f"2025-01-01T00:00:0{second}"))
+
+    newer = log.events_since_timestamp("2025-01-01T00:00:03")
+    assert [event_id for event_id, _ in newer] == [5, 6]
+    assert [event_id for event_id, _ in log.events_since_timestamp("", limit=2)] == [3, 4]
+    assert log.events_since_timestamp("2025-01-01T00:00:09") == []
+
+
+def test_serialized_form_is_cached():
+    """The serializer runs once per event, even across repeated reads."""
+    log = EventLog(capacity=2)
+    event_id = log.append({"n": 1})
+    calls = []
+
+    def serializer(event_id, event):
+        calls.append(event_id)
+        return json.dumps(event)
+
+    assert log.serialized(event_id, serializer) == '{"n": 1}'
+    assert log.serialized(event_id, serializer) == '{"n": 1}'
+    assert calls == [1]
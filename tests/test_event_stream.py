@@ -0,0 +1,120 @@
+"""
+Event Stream Tests
+==================
+
+Tests for pushing agent actions to clients: the GameLoop's event cursor and
+listeners, and the /agent_act/stream Server-Sent Events endpoint.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import backend.main as main
+from backend.config.schema import AgentActionOutput
+from backend.game_loop import GameLoop
+
+
+class FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+def add_event(loop, agent_id):
+    loop._add_action_event(AgentActionOutput(agent_id=agent_id, action={"action_type": "look"}))
+
+
+def event_ids(chunk):
+    return [int(line[len("id: "):]) for line in chunk.splitlines() if line.startswith("id: ")]
+
+
+async def test_events_after_id_and_listeners():
+    """Only events newer than the cursor are returned; listeners are woken by new events."""
+    loop = GameLoop()
+    for agent_id in ("alex_001", "alan_002", "alex_001"):
+        add_event(loop, agent_id)
+
+    assert [event_id for event_id, _ in loop.get_events_after_id(1)] == [2, 3]
+    assert [event.agent_id for _, event in loop.get_events_after_id(0, limit=2)] == ["alex_001", "alan_002"]
+    assert loop.get_events_after_id(3) == []
+
+    listener = loop.subscribe_events()
+    assert not listener.is_set()
+    add_event(loop, "alan_002")
+    assert listener.is_set()
+
+    loop.unsubscribe_events(listener)
+    assert not loop._event_listeners
+    listener.clear()
+    add_event(loop, "alex_001")
+    assert not listener.is_set()
+
+
+async def test_stream_resumes_after_last_event_id(monkeypatch):
+    """A client reconnecting after an event id receives only newer events, also pushed as they arrive."""
+    loop = GameLoop()
+    monkeypatch.setattr(main, "game_controller", loop)
+    for agent_id in ("alex_001", "alan_002", "alex_001"):
+        add_event(loop, agent_id)
+
+    for query_id, header_id in ((2, None), (None, "2")):
+        request = FakeRequest()
+        response = await main.stream_agent_actions(request, last_event_id=query_id, last_event_id_header=header_id)
+        stream = response.body_iterator
+        assert await anext(stream) == "retry: 3000\n\n"
+        chunk = await anext(stream)
+        assert event_ids(chunk) == [3]
+        assert "event: agent_action" in chunk
+        await stream.aclose()
+
+    request = FakeRequest()
+    response = await main.stream_agent_actions(request, last_event_id=3, last_event_id_header=None)
+    stream = response.body_iterator
+    await anext(stream)
+    # Nothing newer yet: the stream waits until the game loop adds an event
+    pending = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    add_event(loop, "alan_002")
+    assert event_ids(await asyncio.wait_for(pending, 1.0)) == [4]
+    await stream.aclose()
+
+
+async def test_stream_unsubscribes_when_client_disconnects(monkeypatch):
+    """The listener is removed whether the client disconnects or the response is closed."""
+    loop = GameLoop()
+    monkeypatch.setattr(main, "game_controller", loop)
+
+    # Disconnect noticed by the stream itself
+    request = FakeRequest()
+    response = await main.stream_agent_actions(request, last_event_id=None, last_event_id_header=None)
+    stream = response.body_iterator
+    await anext(stream)
+    pending = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.01)
+    assert len(loop._event_listeners) == 1
+    request.disconnected = True
+    add_event(loop, "alex_001")
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(pending, 1.0)
+    assert not loop._event_listeners
+
+    # Response closed by the server while the stream is waiting
+    response = await main.stream_agent_actions(FakeRequest(), last_event_id=1, last_event_id_header=None)
+    stream = response.body_iterator
+    await anext(stream)
+    pending = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.01)
+    assert len(loop._event_listeners) == 1
+    pending.cancel()
+    await asyncio.gather(pending, return_exceptions=True)
+    await stream.aclose()
+    assert not loop._event_listeners
@@ -0,0 +1,88 @@
+"""
+Game Fork Tests
+===============
+
+Tests for copy-on-write forks used to evaluate speculative actions.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.text_adventure_games.actions.discovery import get_available_actions
+from backend.text_adventure_games.actions.generic import EnhancedLookAction
+from backend.text_adventure_games.world import build_house_game
+
+
+def look(game, name):
+    action = EnhancedLookAction(game, "look")
+    action.character = game.characters[name]
+    return action.apply_effects().description
+
+
+def test_discarded_fork_leaves_the_world_unchanged():
+    """Speculative actions are visible inside the fork and undone when it closes."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    views = {name: look(game, name) for name in game.characters}
+    actions = get_available_actions(alan, game.parser)
+    version = game.revision_tracker.version
+
+    with game.fork() as fork:
+        assert fork.execute("take apple", alan).description == "You take the apple."
+        fork.execute("go north", alan)
+        assert alan.location.name == "Bedroom"
+        assert "apple" in alan.inventory
+        # Only the changed things were copied
+        assert {thing.name for thing in fork.changed} == {"Kitchen", "Bedroom", "apple", "alan_002"}
+
+        with game.fork() as inner:
+            inner.execute("drop apple", alan)
+            assert "apple" not in alan.inventory
+        assert "apple" in alan.inventory
+
+    assert alan.location.name == "Kitchen"
+    assert "apple" not in alan.inventory
+    assert {name: look(game, name) for name in game.characters} == views
+    assert get_available_actions(alan, game.parser) == actions
+    assert game.revision_tracker.version == version
+
+
+def test_committed_fork_is_journaled():
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    version = game.revision_tracker.version
+
+    fork = game.fork()
+    fork.execute("take apple", alan)
+    fork.commit()
+
+    assert "apple" in alan.inventory
+    assert {thing.name for thing in game.revision_tracker.changed_since(version)} == {"Kitchen", "apple", "alan_002"}
+
+
+def test_discarded_fork_undoes_open_close_and_switches():
+    """Object state set by open/close and switch on/off is restored with its properties."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    cabinet = alan.location.items["kitchen cabinet"]
+    sink = alan.location.items["sink"]
+
+    with game.fork() as fork:
+        fork.execute("open kitchen cabinet", alan)
+        fork.execute("switch on sink", alan)
+        assert cabinet.is_open_state and cabinet.get_property("is_open")
+        assert sink.is_on and sink.get_property("is_on")
+    assert not cabinet.is_open_state and not cabinet.get_property("is_open", False)
+    assert not sink.is_on and not sink.get_property("is_on", False)
+    assert "already" not in game.parser.parse_command("open kitchen cabinet", character=alan).description
+
+    game.parser.parse_command("switch on sink", character=alan)
+    with game.fork() as fork:
+        fork.execute("close kitchen cabinet", alan)
+        fork.execute("switch off sink", alan)
+        assert not cabinet.is_open_state and not sink.is_on
+    assert cabinet.is_open_state and cabinet.get_property("is_open")
+    assert sink.is_on and sink.get_property("is_on")
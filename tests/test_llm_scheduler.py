@@ -0,0 +1,112 @@
+"""
+LLM Scheduler Tests
+===================
+
+Tests for the shared request scheduler (budgets, priority and retries) used by agents.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+import openai
+
+from backend.agent.llm_scheduler import (
+    LLMScheduler, TokenBucket, PRIORITY_BLOCKING, PRIORITY_BACKGROUND
+)
+from backend.config.models import SchedulerConfig
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _rate_limit_error():
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request, headers={"retry-after": "0"})
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def test_token_bucket_refills_over_time():
+    """A drained bucket reports how long until enough budget has refilled."""
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)
+
+    bucket.consume(60)
+    assert bucket.time_until(30) == 30.0
+
+    clock.now = 30.0
+    assert bucket.time_until(30) == 0.0
+    assert TokenBucket(None, clock).time_until(10 ** 9) == 0.0
+
+
+async def test_blocking_requests_are_served_first():
+    """With one slot, queued blocking requests run before background ones."""
+    scheduler = LLMScheduler(SchedulerConfig(max_concurrent=1, requests_per_minute=None, tokens_per_minute=None))
+    order = []
+    release = asyncio.Event()
+
+    async def request(name, wait=None):
+        if wait:
+            await wait.wait()
+        order.append(name)
+        return name
+
+    first = asyncio.create_task(scheduler.submit(lambda: request("first", release)))
+    await asyncio.sleep(0)
+    background = asyncio.create_task(scheduler.submit(lambda: request("background"), priority=PRIORITY_BACKGROUND))
+    blocking = asyncio.create_task(scheduler.submit(lambda: request("blocking"), priority=PRIORITY_BLOCKING))
+    await asyncio.sleep(0.01)
+    assert scheduler.get_metrics()["queued"] == 2
+
+    release.set()
+    await asyncio.gather(first, background, blocking)
+    assert order == ["first", "blocking", "background"]
+
+
+async def test_rate_limited_requests_are_retried():
+    """Rate limit errors are retried up to max_retries and counted in the metrics."""
+    scheduler = LLMScheduler(SchedulerConfig(backoff_base=0.001, backoff_max=0.01))
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _rate_limit_error()
+        return "ok"
+
+    assert await scheduler.submit(flaky, max_retries=2) == "ok"
+    metrics = scheduler.get_metrics()
+    assert metrics["retries"] == 2 and metrics["rate_limited"] == 2 and metrics["completed"] == 1
+
+    attempts.clear()
+    try:
+        await scheduler.submit(flaky, max_retries=1)
+        assert False, "expected the rate limit error to be raised"
+    except openai.RateLimitError:
+        pass
+    assert scheduler.get_metrics()["failed"] == 1
+
+
+def test_scheduler_is_reusable_across_event_loops():
+    """One scheduler serves queued requests in successive event loops (e.g. several asyncio.run calls)."""
+    scheduler = LLMScheduler(SchedulerConfig(max_concurrent=1, requests_per_minute=None, tokens_per_minute=None))
+
+    async def request():
+        await asyncio.sleep(0.001)
+        return "ok"
+
+    async def contend():
+        return await asyncio.gather(*(scheduler.submit(request) for _ in range(3)))
+
+    assert asyncio.run(contend()) == ["ok"] * 3
+    assert asyncio.run(contend()) == ["ok"] * 3
+    assert scheduler.get_metrics()["completed"] == 6 and scheduler.get_metrics()["active"] == 0
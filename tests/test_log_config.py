@@ -0,0 +1,75 @@
+"""
+Logging Configuration Tests
+===========================
+
+Tests for the queued logging pipeline: records are queued unformatted for the
+listener thread, lazy messages are only built when needed, and the debug log
+rotates by size.
+"""
+
+import sys
+import os
+import logging
+import queue
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.log_config import setup_logging, shutdown_logging, LazyMessage, DeferredQueueHandler
+
+
+def test_lazy_messages_are_queued_unformatted(tmp_path):
+    log_file = tmp_path / "debug.log"
+    built = []
+
+    def build(text):
+        built.append(text)
+        return text.upper()
+
+    handler = DeferredQueueHandler(queue.SimpleQueue())
+    record = logging.makeLogRecord({"msg": "%s", "args": (LazyMessage(build, "queued"),)})
+    assert handler.prepare(record) is record
+    assert built == []
+
+    setup_logging(log_file=str(log_file))
+    try:
+        logger = logging.getLogger("backend.game_loop")
+        logger.info("%s", LazyMessage(build, "action executed"))
+        # Disabled levels never build the message
+        logger.debug("%s", LazyMessage(build, "never built"))
+    finally:
+        shutdown_logging()
+
+    content = log_file.read_text()
+    assert "ACTION EXECUTED" in content
+    assert "never built" not in built
+
+
+def test_debug_log_rotates_by_size(tmp_path):
+    log_file = tmp_path / "debug.log"
+    setup_logging(log_file=str(log_file), max_bytes=2000, backup_count=2)
+    try:
+        logger = logging.getLogger("backend.test_rotation")
+        for i in range(200):
+            logger.debug("line %d %s", i, "x" * 50)
+    finally:
+        shutdown_logging()
+
+    assert log_file.stat().st_size <= 2000
+    assert (tmp_path / "debug.log.1").exists()
+    assert (tmp_path / "debug.log.2").exists()
+    assert not (tmp_path / "debug.log.3").exists()
+
+
+def test_kani_messages_are_pretty_printed(tmp_path):
+    log_file = tmp_path / "debug.log"
+    setup_logging(log_file=str(log_file), use_queue=False)
+    try:
+        logging.getLogger("kani.messages").debug('ChatMessage(role=assistant content="first\\nsecond")')
+        logging.getLogger("kani.messages").debug("short message")
+    finally:
+        shutdown_logging()
+
+    content = log_file.read_text()
+    assert "[KANI] role: assistant\ncontent:\n    first\n    second" in content
+    assert "short message" not in content
@@ -0,0 +1,86 @@
+"""
+Mock Engine Tests
+=================
+
+Tests for the local mock engine used for offline runs and load testing.
+"""
+
+import sys
+import os
+import json
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from kani import ChatMessage
+from kani.models import FunctionCall, ToolCall
+
+from backend.agent.mock_engine import MockEngine, available_actions
+from backend.config.models import MockEngineConfig
+from backend.config.yaml_config import get_config_manager
+from backend.text_adventure_games.world import build_house_game
+
+LOOK_RESULT = "\n".join([
+    "You are at: Kitchen",
+    "",
+    "Available actions:",
+    "  - look: Look around the current location",
+    "  - go {x} (x: north, east): Move {x}",
+])
+
+
+def test_actions_come_from_the_latest_observation():
+    """Grouped actions are expanded; a result without actions means the world must be looked at again."""
+    call = ToolCall.from_function_call(FunctionCall.with_args("submit_command", command="look"))
+    messages = [
+        ChatMessage.user("Welcome!"),
+        ChatMessage.assistant(None, tool_calls=[call]),
+        ChatMessage.function("submit_command", LOOK_RESULT, call.id),
+    ]
+    assert available_actions(messages) == ["look", "go north", "go east"]
+
+    unchanged = messages + [ChatMessage.user("You are at: Kitchen\n\nAvailable actions: unchanged since your last observation.")]
+    assert available_actions(unchanged) == ["look", "go north", "go east"]
+
+    moved = messages + [ChatMessage.user("You go north to the Bedroom.")]
+    assert available_actions(moved) == []
+
+
+async def test_scripted_and_replay_modes(tmp_path):
+    """Scripted commands repeat in order; replay reads the agent's lines from a trace."""
+    scripted = MockEngine(MockEngineConfig(mode="scripted", script=["look", "go north"]))
+    assert [scripted.choose_command([]) for _ in range(3)] == ["look", "go north", "look"]
+
+    trace = tmp_path / "trace.jsonl"
+    trace.write_text("\n".join(json.dumps(entry) for entry in [
+        {"agent": "alex_001", "command": "go east"},
+        {"agent": "alan_002", "command": "take apple"},
+        {"command": "look"},
+    ]))
+    replay = MockEngine(MockEngineConfig(mode="replay", trace_path=str(trace)), agent_id="alan_002")
+    assert [replay.choose_command([]) for _ in range(3)] == ["take apple", "look", "look"]
+
+
+async def test_agents_run_offline_and_deterministically(monkeypatch):
+    """With engine_override set to the mock engine, agents need no API key and replay identically."""
+    from backend.agent.agent_strategies import KaniAgent
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(get_config_manager().llm_config, "engine_override", "mock")
+
+    async def play():
+        game = build_house_game()
+        alan = game.characters["alan_002"]
+        agent = KaniAgent(alan.name, game=game, character=alan)
+        assert isinstance(agent.engine, MockEngine)
+
+        commands, result = [], "Welcome to the game! This is your first turn."
+        for _ in range(10):
+            agent.command_executed_this_turn = False
+            commands.append(await agent.select_action(result))
+            result = agent.last_execution.result.description if agent.last_execution and agent.last_execution.result else ""
+        return commands, alan.location.name
+
+    first = await play()
+    assert first == await play()
+    assert len(set(first[0])) > 1
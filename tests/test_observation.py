@@ -0,0 +1,64 @@
+"""
+Observation Compression Tests
+=============================
+
+Tests for the observation compressor used by KaniAgent.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.agent.observation import ObservationCompressor, group_actions
+
+COLORS = ["red", "blue", "green", "yellow", "white", "black"]
+
+CLOSET = "\n".join([
+    "You are at: Bedroom",
+    "A cozy bedroom.",
+    "",
+    "You are not carrying anything.",
+    "",
+    "Available exits: south to Dining Room",
+    "",
+    "Available actions:",
+    "  - look: Look around the current location",
+] + [f"  - take {color} quilt: Take the {color} quilt" for color in COLORS] + [
+    "  - open closet: Change the state of the closet",
+    "  - close closet: Change the state of the closet",
+    "  - go south: Move south",
+])
+
+
+def test_templated_actions_are_grouped():
+    """Commands differing in one span collapse into one line listing every choice."""
+    entries = [(f"take {color} quilt", f"Take the {color} quilt") for color in COLORS]
+    entries += [("examine coffee table", "Examine the item"), ("examine tv", "Examine the item"), ("look", "Look around")]
+
+    grouped = group_actions(entries)
+    assert grouped == [
+        ("take {x} quilt (x: red, blue, green, yellow, white, black)", "Take the {x} quilt"),
+        ("examine {x} (x: coffee table, tv)", "Examine the item"),
+        ("look", "Look around"),
+    ]
+
+
+def test_unchanged_sections_are_dropped():
+    """A second identical observation keeps the location but replaces unchanged lists."""
+    compressor = ObservationCompressor()
+
+    first = compressor.compress(CLOSET)
+    assert "  - {x} closet (x: open, close): Change the state of the closet" in first.text
+    assert first.compressed_tokens < first.original_tokens
+    assert set(first.section_tokens) == {"You are at", "You are not carrying anything", "Available exits", "Available actions"}
+
+    second = compressor.compress(CLOSET)
+    assert second.text.startswith("You are at: Bedroom")
+    assert "Available actions: unchanged since your last observation." in second.text
+    assert "take {x} quilt" not in second.text and "take {x} quilt" in second.full_text
+    assert second.section_tokens["Available actions"] < first.section_tokens["Available actions"]
+
+    changed = compressor.compress(CLOSET.replace("  - go south: Move south\n", "").replace("  - go south: Move south", ""))
+    assert "take {x} quilt" in changed.text
@@ -0,0 +1,124 @@
+"""
+Pacing Tests
+============
+
+Tests for the game loop pacing modes (fast, fixed ticks, realtime with catch-up).
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.config.models import PacingConfig
+from backend.config.yaml_config import get_config_manager
+from backend.pacing import Pacer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pacer(mode, **settings):
+    clock = FakeClock()
+    slept = []
+
+    async def sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    return Pacer(PacingConfig(mode=mode, **settings), clock=clock, sleep=sleep), clock, slept
+
+
+async def test_fast_mode_never_waits():
+    pacer, clock, slept = make_pacer("fast")
+    for _ in range(3):
+        clock.now += 0.2
+        await pacer.wait()
+    assert slept == [0.0, 0.0, 0.0]
+
+
+async def test_fixed_mode_waits_for_the_rest_of_the_tick():
+    pacer, clock, slept = make_pacer("fixed", tick_seconds=1.0)
+
+    clock.now += 0.25  # a look that does not end the turn
+    await pacer.wait(turn_ended=False)
+    clock.now += 0.25
+    await pacer.wait()
+    # A slow turn is not made up for
+    clock.now += 1.5
+    await pacer.wait()
+    clock.now += 0.1
+    await pacer.wait()
+
+    assert slept == pytest.approx([0.0, 0.5, 0.0, 0.9])
+
+
+async def test_realtime_mode_catches_up_after_slow_turns():
+    pacer, clock, slept = make_pacer("realtime", tick_seconds=1.0, max_catch_up_ticks=2)
+
+    clock.now += 2.5  # 1.5s behind schedule
+    await pacer.wait()
+    clock.now += 0.25  # 0.75s behind
+    await pacer.wait()
+    clock.now += 0.25  # on schedule
+    await pacer.wait()
+    clock.now += 0.25
+    await pacer.wait()
+
+    assert slept == pytest.approx([0.0, 0.0, 0.0, 0.75])
+
+    # Falling further behind than max_catch_up_ticks drops the backlog
+    clock.now += 10.0
+    await pacer.wait()
+    clock.now += 0.25
+    await pacer.wait()
+    assert slept[-2:] == pytest.approx([0.0, 0.75])
+
+
+async def test_idle_iterations_back_off_in_every_mode():
+    for mode in ("fast", "fixed", "realtime"):
+        pacer, clock, slept = make_pacer(mode, tick_seconds=1.0, idle_seconds=0.5)
+        clock.now += 3.0  # a long idle stretch does not leave a backlog to catch up on
+        await pacer.wait(turn_ended=False, idle=True)
+        clock.now += 0.25
+        await pacer.wait()
+        assert slept[0] == 0.5
+        assert slept[1] == pytest.approx({"fast": 0.0, "fixed": 0.75, "realtime": 0.75}[mode])
+
+
+async def test_game_loop_without_agents_does_not_spin(monkeypatch):
+    from backend.game_loop import GameLoop
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(get_config_manager().llm_config, "engine_override", "mock")
+    loop = GameLoop(pacing_mode="fast")
+    await loop.initialize()
+    loop.agent_manager.active_agents = []
+
+    pacer, _, slept = make_pacer("fast", idle_seconds=0.5)
+    sleep = pacer._sleep
+
+    async def stop_after_three(seconds):
+        await sleep(seconds)
+        loop.is_running = len(slept) < 3
+
+    pacer._sleep = stop_after_three
+    loop.pacer = pacer
+    loop.is_running = True
+    await loop.run_game_loop()
+
+    assert slept == [0.5, 0.5, 0.5]
+    assert loop.turn_counter == 0
+
+
+def test_unknown_mode_falls_back_to_fixed():
+    pacer, _, _ = make_pacer("turbo")
+    assert pacer.mode == "fixed"
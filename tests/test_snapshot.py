@@ -0,0 +1,61 @@
+"""
+Game Snapshot Tests
+===================
+
+Tests for dumping a whole game to bytes and restoring it.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from backend.text_adventure_games.actions.base import ExecutionContext
+from backend.text_adventure_games.actions.generic import EnhancedLookAction
+from backend.text_adventure_games.state.snapshot import SnapshotError, dump_game, load_game
+from backend.text_adventure_games.world import build_generated_game, build_house_game
+
+
+def look(game, name):
+    action = EnhancedLookAction(game, "look")
+    action.character = game.characters[name]
+    return action.apply_effects().description
+
+
+def test_round_trip_after_actions():
+    """A restored game looks the same to every character and keeps shared references."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    for command in ["take apple", "open kitchen cabinet", "go north"]:
+        game.parser.parse_command(command, context=ExecutionContext(actor=alan))
+
+    restored, extra = load_game(dump_game(game, {"turn_counter": 3}))
+    assert extra == {"turn_counter": 3}
+    assert list(restored.locations) == list(game.locations)
+
+    restored_alan = restored.characters["alan_002"]
+    assert restored_alan.location.name == alan.location.name
+    assert restored_alan.location.characters[restored_alan.name] is restored_alan
+    assert list(restored_alan.inventory) == list(alan.inventory)
+    assert restored_alan.inventory["apple"].owner is restored_alan
+    for name in game.characters:
+        assert look(restored, name) == look(game, name)
+
+    # The restored world is independent of the original
+    restored.parser.parse_command("drop apple", context=ExecutionContext(actor=restored_alan))
+    assert "apple" in alan.inventory
+
+
+def test_generated_world_round_trip():
+    game = build_generated_game(rooms=50, agents=5, seed=3)
+    restored, _ = load_game(dump_game(game))
+    assert list(restored.locations) == list(game.locations)
+    for name, location in game.locations.items():
+        assert sorted(restored.locations[name].items) == sorted(location.items)
+        assert sorted(restored.locations[name].connections) == sorted(location.connections)
+
+    with pytest.raises(SnapshotError):
+        load_game(b"not a snapshot")
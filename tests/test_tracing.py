@@ -0,0 +1,66 @@
+"""
+Tracing Tests
+=============
+
+Tests for the per-phase turn tracer behind the /metrics endpoint.
+"""
+
+import sys
+import os
+import json
+import asyncio
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.config.models import TracingConfig
+from backend.tracing import Tracer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def test_spans_nest_across_tasks_and_feed_metrics(tmp_path):
+    clock = FakeClock()
+    export_path = tmp_path / "spans.jsonl"
+    tracer = Tracer(TracingConfig(export_path=str(export_path)), clock=clock)
+
+    async def llm_call(tokens):
+        with tracer.span("llm") as span:
+            clock.now += 0.5
+            span.set("tokens", tokens)
+
+    for turn in range(3):
+        with tracer.span("turn", agent="alex_001"):
+            with tracer.span("select_action"):
+                await asyncio.gather(asyncio.create_task(llm_call(100)), llm_call(50))
+            with tracer.span("get_schema"):
+                clock.now += 0.01
+
+    metrics = tracer.get_metrics()
+    assert metrics["turns"] == 3
+    assert metrics["tokens_per_turn"]["p50"] == 150
+    assert metrics["phases"]["llm"]["count"] == 6
+    assert metrics["phases"]["llm"]["p99"] == 500
+    assert metrics["phases"]["turn"]["p50"] == 1010
+    assert metrics["turns_per_second"] > 0
+
+    tracer.close()
+    spans = [json.loads(line) for line in export_path.read_text().splitlines()]
+    turn = spans[-1]
+    assert turn["name"] == "turn" and turn["parent_id"] is None and turn["attributes"]["tokens"] == 150
+    children = [span for span in spans if span["trace_id"] == turn["trace_id"] and span["name"] == "llm"]
+    assert len(children) == 2
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(TracingConfig(enabled=False))
+    with tracer.span("turn") as span:
+        span.set("tokens", 10)
+    assert tracer.get_metrics()["phases"] == {}
+    assert tracer.get_metrics()["turns"] == 0
@@ -0,0 +1,43 @@
+"""
+World Generator Tests
+=====================
+
+Tests for the seeded procedural world generator.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.text_adventure_games.world import build_generated_game
+from backend.text_adventure_games.actions.base import ExecutionContext
+
+
+def _snapshot(game):
+    return {
+        name: (sorted(location.connections), sorted(location.items), sorted(location.characters))
+        for name, location in game.locations.items()
+    }
+
+
+def test_generated_world_is_connected_and_sized():
+    """Every room is reachable from the start and the requested counts are met."""
+    game = build_generated_game(rooms=1500, items=3000, agents=40, seed=3)
+    assert len(game.locations) == 1500
+    assert len(game.characters) == 41  # agents plus the player
+    items = [thing for thing in game.iter_things() if not hasattr(thing, 'connections') and thing.name not in game.characters]
+    assert len(items) == 3000
+
+
+def test_generation_is_deterministic_and_playable():
+    """The same seed builds the same world, and its agents can act in it."""
+    game = build_generated_game(rooms=50, items=400, agents=5, seed=7)
+    assert _snapshot(game) == _snapshot(build_generated_game(rooms=50, items=400, agents=5, seed=7))
+    assert _snapshot(game) != _snapshot(build_generated_game(rooms=50, items=400, agents=5, seed=8))
+
+    agent = game.characters["agent_0001"]
+    execution = ExecutionContext(actor=agent)
+    result = game.parser.parse_command("look", context=execution)
+    assert result.description.startswith(f"You are at: {agent.location.name}")
@@ -0,0 +1,87 @@
+"""
+World Versioning Tests
+======================
+
+Tests for revision tracking of world changes and incremental world state patches.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.game_loop import GameLoop
+from backend.agent.manager import AgentManager
+from backend.text_adventure_games.world import build_house_game
+
+
+def _build_game_loop():
+    """Create a GameLoop around the house world without starting agents."""
+    game_loop = GameLoop()
+    game_loop.game = build_house_game()
+    game_loop.agent_manager = AgentManager(game_loop.game)
+    game_loop._initialize_objects_registry()
+    return game_loop
+
+
+def test_mutations_bump_revisions():
+    """Moving an item bumps the item, the location and the character."""
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    apple = alan.location.items["apple"]
+    before = {thing: thing.revision for thing in (alan, apple, alan.location)}
+
+    alan.add_to_inventory(apple)
+
+    for thing, revision in before.items():
+        assert thing.revision > revision
+    assert set(game.revision_tracker.changed_since(max(before.values()))) >= set(before)
+
+
+def test_world_state_patch_contains_only_changes():
+    """A patch lists the changed agent, object and location and nothing else."""
+    game_loop = _build_game_loop()
+    version = game_loop.get_world_state()["version"]
+    alan = game_loop.game.characters["alan_002"]
+
+    assert game_loop.get_world_state_since(version)["agents"] == {}
+
+    game_loop.game.parser.parse_command("take apple", character=alan)
+    patch = game_loop.get_world_state_since(version)
+
+    assert list(patch["agents"]) == ["alan_002"]
+    assert [obj["name"] for obj in patch["objects"]] == ["apple"]
+    assert list(patch["locations"]) == ["Kitchen"]
+    assert patch["version"] > version
+
+    game_loop.game.parser.parse_command("consume apple", character=alan)
+    patch = game_loop.get_world_state_since(patch["version"])
+    assert patch["removed_objects"] == ["apple"]
+
+
+def test_stale_version_returns_full_state():
+    """Versions from before the current game fall back to the full state."""
+    game_loop = _build_game_loop()
+    state = game_loop.get_world_state_since(0)
+
+    assert "since_version" not in state
+    assert len(state["locations"]) == len(game_loop.game.locations)
+
+
+def test_available_actions_cache_invalidation():
+    """Unchanged rooms are served from the cache; changes in the room invalidate it."""
+    from backend.text_adventure_games.actions.discovery import get_available_actions
+
+    game = build_house_game()
+    alan = game.characters["alan_002"]
+    cache = game.available_actions_cache
+
+    first = get_available_actions(alan, game.parser)
+    assert get_available_actions(alan, game.parser) == first
+    assert cache.hits == 1
+
+    game.parser.parse_command("take apple", character=alan)
+    commands = [action["command"] for action in get_available_actions(alan, game.parser)]
+    assert "take apple" not in commands
+    assert "drop apple" in commands